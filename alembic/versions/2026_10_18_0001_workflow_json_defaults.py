@@ -0,0 +1,41 @@
+"""Default workflow triggers/actions to empty JSON lists
+
+Revision ID: 2026_10_18_0001
+Revises: 2025_09_19_001
+Create Date: 2026-10-18 00:01:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0001'
+down_revision: Union[str, None] = '2025_09_19_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Backfill NULL triggers/actions and add server defaults"""
+
+    # Backfill legacy rows so readers never have to guard against NULL. The
+    # ORM stored None as the JSON literal null, which IS NULL does not match
+    for column_name in ('triggers', 'actions'):
+        op.execute(
+            f"UPDATE workflows SET {column_name} = '[]' "
+            f"WHERE {column_name} IS NULL OR CAST({column_name} AS TEXT) = 'null'"
+        )
+
+    with op.batch_alter_table('workflows', schema=None) as batch_op:
+        batch_op.alter_column('triggers', existing_type=sa.JSON(), nullable=False, server_default='[]')
+        batch_op.alter_column('actions', existing_type=sa.JSON(), nullable=False, server_default='[]')
+
+
+def downgrade() -> None:
+    """Remove server defaults from workflow triggers/actions"""
+
+    with op.batch_alter_table('workflows', schema=None) as batch_op:
+        batch_op.alter_column('triggers', existing_type=sa.JSON(), server_default=None)
+        batch_op.alter_column('actions', existing_type=sa.JSON(), server_default=None)
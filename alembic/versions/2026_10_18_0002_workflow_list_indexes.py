@@ -0,0 +1,41 @@
+"""Add composite indexes for the admin workflow list query
+
+Revision ID: 2026_10_18_0002
+Revises: 2026_10_18_0001
+Create Date: 2026-10-18 00:02:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0002'
+down_revision: Union[str, None] = '2026_10_18_0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (status, updated_at DESC, id DESC) and (updated_at DESC, id DESC)"""
+
+    # WHERE status = ? ORDER BY updated_at DESC, id DESC
+    op.create_index(
+        'idx_workflows_status_updated_id',
+        'workflows',
+        ['status', sa.text('updated_at DESC'), sa.text('id DESC')]
+    )
+
+    # Unfiltered list ordered by recency
+    op.create_index(
+        'idx_workflows_updated_id',
+        'workflows',
+        [sa.text('updated_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Drop workflow list indexes"""
+    op.drop_index('idx_workflows_updated_id', table_name='workflows')
+    op.drop_index('idx_workflows_status_updated_id', table_name='workflows')
@@ -0,0 +1,31 @@
+"""Add calendar_sync_state table for RFC 6578 sync tokens
+
+Revision ID: 2026_10_18_0003
+Revises: 2026_10_18_0002
+Create Date: 2026-10-18 00:03:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0003'
+down_revision: Union[str, None] = '2026_10_18_0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create calendar_sync_state table"""
+    op.create_table('calendar_sync_state',
+        sa.Column('calendar_id', sa.String(255), primary_key=True),
+        sa.Column('sync_token', sa.Text(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Drop calendar_sync_state table"""
+    op.drop_table('calendar_sync_state')
@@ -0,0 +1,62 @@
+"""Add composite indexes for the external command poll query
+
+Revision ID: 2026_10_18_0004
+Revises: 2026_10_18_0003
+Create Date: 2026-10-18 00:04:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0004'
+down_revision: Union[str, None] = '2026_10_18_0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_external_commands() -> bool:
+    return 'external_commands' in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Index (target_system, status, created_at/processed_at) and the pending queue"""
+
+    # external_commands is created by metadata.create_all, not by an earlier revision
+    if not _has_external_commands():
+        return
+
+    # WHERE target_system = ? AND status = ? ORDER BY created_at
+    op.create_index(
+        'idx_external_commands_system_status_created',
+        'external_commands',
+        ['target_system', 'status', 'created_at']
+    )
+
+    # Stale PROCESSING reclaim on processed_at
+    op.create_index(
+        'idx_external_commands_system_status_processed',
+        'external_commands',
+        ['target_system', 'status', 'processed_at']
+    )
+
+    # Partial index covering only pending commands
+    op.create_index(
+        'idx_external_commands_pending',
+        'external_commands',
+        ['target_system', 'created_at'],
+        sqlite_where=sa.text("status = 'pending'"),
+        postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def downgrade() -> None:
+    """Drop external command poll indexes"""
+    if not _has_external_commands():
+        return
+
+    op.drop_index('idx_external_commands_pending', table_name='external_commands')
+    op.drop_index('idx_external_commands_system_status_processed', table_name='external_commands')
+    op.drop_index('idx_external_commands_system_status_created', table_name='external_commands')
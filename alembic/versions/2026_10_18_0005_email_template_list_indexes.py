@@ -0,0 +1,60 @@
+"""Add indexes for the email template list query
+
+Revision ID: 2026_10_18_0005
+Revises: 2026_10_18_0004
+Create Date: 2026-10-18 00:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0005'
+down_revision: Union[str, None] = '2026_10_18_0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_email_templates() -> bool:
+    return 'email_templates' in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Index (is_active|category_id, updated_at DESC) and (updated_at DESC)"""
+
+    # email_templates is created by metadata.create_all, not by an earlier revision
+    if not _has_email_templates():
+        return
+
+    # WHERE is_active = ? ORDER BY updated_at DESC
+    op.create_index(
+        'idx_email_templates_active_updated',
+        'email_templates',
+        ['is_active', sa.text('updated_at DESC')]
+    )
+
+    # WHERE category_id = ? ORDER BY updated_at DESC
+    op.create_index(
+        'idx_email_templates_category_updated',
+        'email_templates',
+        ['category_id', sa.text('updated_at DESC')]
+    )
+
+    # Unfiltered list ordered by recency
+    op.create_index(
+        'idx_email_templates_updated',
+        'email_templates',
+        [sa.text('updated_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Drop email template list indexes"""
+    if not _has_email_templates():
+        return
+
+    op.drop_index('idx_email_templates_updated', table_name='email_templates')
+    op.drop_index('idx_email_templates_category_updated', table_name='email_templates')
+    op.drop_index('idx_email_templates_active_updated', table_name='email_templates')
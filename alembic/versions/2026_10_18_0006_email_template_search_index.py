@@ -0,0 +1,74 @@
+"""Add a substring search index for email templates
+
+Revision ID: 2026_10_18_0006
+Revises: 2026_10_18_0005
+Create Date: 2026-10-18 00:06:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0006'
+down_revision: Union[str, None] = '2026_10_18_0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trigram FTS5 table and sync triggers, as declared next to EmailTemplateDB
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS email_templates_fts USING fts5("
+    "name, description, subject, content='email_templates', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_ai AFTER INSERT ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(rowid, name, description, subject) "
+    "VALUES (new.id, new.name, new.description, new.subject); END",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_ad AFTER DELETE ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(email_templates_fts, rowid, name, description, subject) "
+    "VALUES ('delete', old.id, old.name, old.description, old.subject); END",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_au AFTER UPDATE OF name, description, subject "
+    "ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(email_templates_fts, rowid, name, description, subject) "
+    "VALUES ('delete', old.id, old.name, old.description, old.subject); "
+    "INSERT INTO email_templates_fts(rowid, name, description, subject) "
+    "VALUES (new.id, new.name, new.description, new.subject); END",
+)
+
+
+def _has_email_templates() -> bool:
+    return 'email_templates' in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Trigram FTS5 index on SQLite, pg_trgm GIN index on PostgreSQL"""
+
+    # email_templates is created by metadata.create_all, not by an earlier revision
+    if not _has_email_templates():
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        # Index the rows that existed before the triggers
+        op.execute("INSERT INTO email_templates_fts(email_templates_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_email_templates_search_trgm ON email_templates "
+            "USING gin (name gin_trgm_ops, description gin_trgm_ops, subject gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the email template search index"""
+    if not _has_email_templates():
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in ('email_templates_fts_au', 'email_templates_fts_ad', 'email_templates_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS email_templates_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_email_templates_search_trgm")
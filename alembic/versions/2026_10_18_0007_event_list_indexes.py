@@ -0,0 +1,65 @@
+"""Add indexes for the /events list query
+
+Revision ID: 2026_10_18_0007
+Revises: 2026_10_18_0006
+Create Date: 2026-10-18 00:07:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0007'
+down_revision: Union[str, None] = '2026_10_18_0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trigram FTS5 table and sync triggers, as declared next to ChronosEventDB
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5("
+    "title, description, location, content='events', content_rowid='rowid', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN "
+    "INSERT INTO events_fts(rowid, title, description, location) "
+    "VALUES (new.rowid, new.title, new.description, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.rowid, old.title, old.description, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF title, description, location "
+    "ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.rowid, old.title, old.description, old.location); "
+    "INSERT INTO events_fts(rowid, title, description, location) "
+    "VALUES (new.rowid, new.title, new.description, new.location); END",
+)
+
+
+def upgrade() -> None:
+    """Index (calendar_id, start_time) and add substring search on title/description/location"""
+    op.create_index('idx_events_calendar_start', 'events', ['calendar_id', 'start_time'])
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        # Index the rows that existed before the triggers
+        op.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_search_trgm ON events "
+            "USING gin (title gin_trgm_ops, description gin_trgm_ops, location gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the /events list indexes"""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in ('events_fts_au', 'events_fts_ad', 'events_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS events_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_events_search_trgm")
+
+    op.drop_index('idx_events_calendar_start', table_name='events')
@@ -0,0 +1,74 @@
+"""Add a token search index for event templates
+
+Revision ID: 2026_10_18_0008
+Revises: 2026_10_18_0007
+Create Date: 2026-10-18 00:08:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0008'
+down_revision: Union[str, None] = '2026_10_18_0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trigram FTS5 table and sync triggers, as declared next to TemplateDB
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS templates_fts USING fts5("
+    "title, description, tags_json, content='templates', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS templates_fts_ai AFTER INSERT ON templates BEGIN "
+    "INSERT INTO templates_fts(rowid, title, description, tags_json) "
+    "VALUES (new.id, new.title, new.description, new.tags_json); END",
+    "CREATE TRIGGER IF NOT EXISTS templates_fts_ad AFTER DELETE ON templates BEGIN "
+    "INSERT INTO templates_fts(templates_fts, rowid, title, description, tags_json) "
+    "VALUES ('delete', old.id, old.title, old.description, old.tags_json); END",
+    "CREATE TRIGGER IF NOT EXISTS templates_fts_au AFTER UPDATE OF title, description, tags_json "
+    "ON templates BEGIN "
+    "INSERT INTO templates_fts(templates_fts, rowid, title, description, tags_json) "
+    "VALUES ('delete', old.id, old.title, old.description, old.tags_json); "
+    "INSERT INTO templates_fts(rowid, title, description, tags_json) "
+    "VALUES (new.id, new.title, new.description, new.tags_json); END",
+)
+
+
+def _has_templates() -> bool:
+    return 'templates' in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Trigram FTS5 index on SQLite, pg_trgm GIN index on PostgreSQL"""
+
+    # templates comes from a side branch of the history or from metadata.create_all
+    if not _has_templates():
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        # Index the rows that existed before the triggers
+        op.execute("INSERT INTO templates_fts(templates_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_templates_search_trgm ON templates "
+            "USING gin (title gin_trgm_ops, description gin_trgm_ops, tags_json gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the template search index"""
+    if not _has_templates():
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in ('templates_fts_au', 'templates_fts_ad', 'templates_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS templates_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_templates_search_trgm")
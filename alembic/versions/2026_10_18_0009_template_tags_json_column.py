@@ -0,0 +1,68 @@
+"""Store template tags as a JSON column
+
+Revision ID: 2026_10_18_0009
+Revises: 2026_10_18_0008
+Create Date: 2026-10-18 00:09:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0009'
+down_revision: Union[str, None] = '2026_10_18_0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_templates() -> bool:
+    return 'templates' in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """templates.tags_json: TEXT -> JSON (SQLite) / JSONB (PostgreSQL)"""
+
+    # templates comes from a side branch of the history or from metadata.create_all
+    if not _has_templates():
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # JSON is stored as TEXT on SQLite, so only values the old readers
+        # silently treated as "no tags" need rewriting before they are decoded
+        op.execute(
+            "UPDATE templates SET tags_json = '[]' WHERE tags_json IS NULL OR "
+            "CASE WHEN json_valid(tags_json) THEN json_type(tags_json) <> 'array' ELSE 1 END"
+        )
+    elif dialect == 'postgresql':
+        # The trigram search index is on the text column; rebuild it over the cast
+        op.execute("DROP INDEX IF EXISTS idx_templates_search_trgm")
+        op.execute(
+            "ALTER TABLE templates ALTER COLUMN tags_json DROP DEFAULT, "
+            "ALTER COLUMN tags_json TYPE jsonb USING coalesce(nullif(tags_json, ''), '[]')::jsonb, "
+            "ALTER COLUMN tags_json SET DEFAULT '[]'::jsonb"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_templates_search_trgm ON templates "
+            "USING gin (title gin_trgm_ops, description gin_trgm_ops, (tags_json::text) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """templates.tags_json back to TEXT"""
+    if not _has_templates():
+        return
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_templates_search_trgm")
+        op.execute(
+            "ALTER TABLE templates ALTER COLUMN tags_json DROP DEFAULT, "
+            "ALTER COLUMN tags_json TYPE text USING tags_json::text, "
+            "ALTER COLUMN tags_json SET DEFAULT '[]'"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_templates_search_trgm ON templates "
+            "USING gin (title gin_trgm_ops, description gin_trgm_ops, tags_json gin_trgm_ops)"
+        )
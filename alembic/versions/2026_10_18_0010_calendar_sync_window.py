@@ -0,0 +1,31 @@
+"""Store the sync window next to calendar sync tokens
+
+Revision ID: 2026_10_18_0010
+Revises: 2026_10_18_0009
+Create Date: 2026-10-18 00:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0010'
+down_revision: Union[str, None] = '2026_10_18_0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add window_start/window_end to calendar_sync_state"""
+    with op.batch_alter_table('calendar_sync_state') as batch_op:
+        batch_op.add_column(sa.Column('window_start', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('window_end', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop window_start/window_end from calendar_sync_state"""
+    with op.batch_alter_table('calendar_sync_state') as batch_op:
+        batch_op.drop_column('window_end')
+        batch_op.drop_column('window_start')
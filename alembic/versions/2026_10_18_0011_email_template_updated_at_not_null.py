@@ -0,0 +1,84 @@
+"""Make email_templates.updated_at NOT NULL
+
+Revision ID: 2026_10_18_0011
+Revises: 2026_10_18_0010
+Create Date: 2026-10-18 00:11:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_18_0011'
+down_revision: Union[str, None] = '2026_10_18_0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Descending list indexes from 2026_10_18_0005; batch reflection would
+# recreate them without DESC
+LIST_INDEXES = (
+    ('idx_email_templates_active_updated', ['is_active', sa.text('updated_at DESC')]),
+    ('idx_email_templates_category_updated', ['category_id', sa.text('updated_at DESC')]),
+    ('idx_email_templates_updated', [sa.text('updated_at DESC')]),
+)
+
+# The batch table rebuild on SQLite drops the FTS sync triggers from 2026_10_18_0006
+SQLITE_FTS_TRIGGERS = (
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_ai AFTER INSERT ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(rowid, name, description, subject) "
+    "VALUES (new.id, new.name, new.description, new.subject); END",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_ad AFTER DELETE ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(email_templates_fts, rowid, name, description, subject) "
+    "VALUES ('delete', old.id, old.name, old.description, old.subject); END",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_au AFTER UPDATE OF name, description, subject "
+    "ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(email_templates_fts, rowid, name, description, subject) "
+    "VALUES ('delete', old.id, old.name, old.description, old.subject); "
+    "INSERT INTO email_templates_fts(rowid, name, description, subject) "
+    "VALUES (new.id, new.name, new.description, new.subject); END",
+)
+
+
+def _has_email_templates() -> bool:
+    return 'email_templates' in sa.inspect(op.get_bind()).get_table_names()
+
+
+def _set_updated_at_nullable(nullable: bool) -> None:
+    """Alter updated_at, keeping the list indexes and FTS triggers intact"""
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('email_templates')}
+    indexes = [(name, columns) for name, columns in LIST_INDEXES if name in existing]
+    for name, _ in indexes:
+        op.drop_index(name, table_name='email_templates')
+
+    with op.batch_alter_table('email_templates') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=nullable)
+
+    for name, columns in indexes:
+        op.create_index(name, 'email_templates', columns)
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_TRIGGERS:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Backfill updated_at and make it NOT NULL; it is the list_templates keyset key"""
+
+    # email_templates is created by metadata.create_all, not by an earlier revision
+    if not _has_email_templates():
+        return
+
+    op.execute(
+        "UPDATE email_templates SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP) "
+        "WHERE updated_at IS NULL"
+    )
+    _set_updated_at_nullable(False)
+
+
+def downgrade() -> None:
+    """Allow NULL updated_at again"""
+    if not _has_email_templates():
+        return
+
+    _set_updated_at_nullable(True)
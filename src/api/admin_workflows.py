@@ -26,359 +26,242 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin/workflows", tags=["admin-workflows"])
 
 
+def _serialize_workflow(db_workflow: WorkflowDB) -> AdminWorkflowResponse:
+    """Convert a WorkflowDB row into an AdminWorkflowResponse"""
+    return AdminWorkflowResponse.model_validate(db_workflow)
+
+
+def _serialize_execution(db_execution: WorkflowExecutionDB) -> AdminWorkflowExecutionResponse:
+    """Convert a WorkflowExecutionDB row into an AdminWorkflowExecutionResponse"""
+    return AdminWorkflowExecutionResponse.model_validate(db_execution)
+
+
 @router.get("/", response_model=AdminWorkflowsListResponse)
+@handle_api_errors
 async def list_workflows(
     authenticated: bool = Depends(verify_api_key),
     q: Optional[str] = Query(None, description="Search query"),
     status: Optional[str] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=1000, description="Items per page")
+    page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
+    include_total: bool = Query(True, description="Compute the total match count")
 ):
     """List all admin workflows with filtering and pagination"""
-    try:
-        async with db_service.get_session() as session:
-            # Build query
-            query = select(WorkflowDB)
-
-            # Apply filters
-            if q:
-                query = query.where(
-                    or_(
-                        WorkflowDB.name.ilike(f"%{q}%"),
-                        WorkflowDB.description.ilike(f"%{q}%")
-                    )
+    async with db_service.get_session() as session:
+        # Build filter conditions once, shared by count and page queries
+        conditions = []
+        if q:
+            conditions.append(
+                or_(
+                    WorkflowDB.name.ilike(f"%{q}%"),
+                    WorkflowDB.description.ilike(f"%{q}%")
                 )
+            )
 
-            if status:
-                query = query.where(WorkflowDB.status == status)
+        if status:
+            conditions.append(WorkflowDB.status == status)
 
-            # Count total
-            count_query = select(func.count()).select_from(query.subquery())
+        # Count total directly against the table (no subquery wrapping)
+        total = None
+        if include_total:
+            count_query = select(func.count(WorkflowDB.id)).where(*conditions)
             total_result = await session.execute(count_query)
             total = total_result.scalar()
 
-            # Apply pagination
-            offset = (page - 1) * page_size
-            query = query.offset(offset).limit(page_size)
-            query = query.order_by(WorkflowDB.updated_at.desc())
-
-            # Execute query
-            result = await session.execute(query)
-            db_workflows = result.scalars().all()
-
-            # Convert to response models
-            workflows = []
-            for db_workflow in db_workflows:
-                workflows.append(AdminWorkflowResponse(
-                    id=db_workflow.id,
-                    name=db_workflow.name,
-                    description=db_workflow.description,
-                    status=db_workflow.status,
-                    triggers=db_workflow.triggers or [],
-                    actions=db_workflow.actions or [],
-                    execution_count=db_workflow.execution_count,
-                    last_execution=db_workflow.last_execution,
-                    success_rate=db_workflow.success_rate,
-                    avg_runtime=db_workflow.avg_runtime,
-                    created_at=db_workflow.created_at,
-                    updated_at=db_workflow.updated_at
-                ))
-
-            return AdminWorkflowsListResponse(
-                total=total,
-                page=page,
-                page_size=page_size,
-                workflows=workflows
-            )
+        # Apply ordering and pagination
+        offset = (page - 1) * page_size
+        query = (
+            select(WorkflowDB)
+            .where(*conditions)
+            .order_by(WorkflowDB.updated_at.desc(), WorkflowDB.id.desc())
+            .offset(offset)
+            .limit(page_size)
+        )
+
+        # Execute query
+        result = await session.execute(query)
+        db_workflows = result.scalars().all()
 
-    except Exception as e:
-        logger.error(f"Error listing workflows: {e}")
-        raise HTTPException(
-            status_code=http_http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list workflows: {str(e)}"
+        # Convert to response models
+        workflows = [_serialize_workflow(db_workflow) for db_workflow in db_workflows]
+
+        return AdminWorkflowsListResponse(
+            total=total,
+            page=page,
+            page_size=page_size,
+            workflows=workflows
         )
 
 
 @router.post("/", response_model=AdminWorkflowResponse, status_code=http_status.HTTP_201_CREATED)
+@handle_api_errors
 async def create_workflow(
     workflow_data: AdminWorkflowCreate,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Create a new admin workflow"""
-    try:
-        async with db_service.get_session() as session:
-            # Convert to domain model
-            workflow = Workflow(
-                name=workflow_data.name,
-                description=workflow_data.description,
-                status=workflow_data.status,
-                triggers=[trigger.dict() for trigger in workflow_data.triggers],
-                actions=[action.dict() for action in workflow_data.actions]
-            )
+    async with db_service.get_session() as session:
+        # Convert to domain model
+        workflow = Workflow(
+            name=workflow_data.name,
+            description=workflow_data.description,
+            status=workflow_data.status,
+            triggers=[trigger.model_dump() for trigger in workflow_data.triggers],
+            actions=[action.model_dump() for action in workflow_data.actions]
+        )
 
-            # Save to database
-            db_workflow = workflow.to_db_model()
-            session.add(db_workflow)
-            await session.commit()
-            await session.refresh(db_workflow)
-
-            return AdminWorkflowResponse(
-                id=db_workflow.id,
-                name=db_workflow.name,
-                description=db_workflow.description,
-                status=db_workflow.status,
-                triggers=db_workflow.triggers or [],
-                actions=db_workflow.actions or [],
-                execution_count=db_workflow.execution_count,
-                last_execution=db_workflow.last_execution,
-                success_rate=db_workflow.success_rate,
-                avg_runtime=db_workflow.avg_runtime,
-                created_at=db_workflow.created_at,
-                updated_at=db_workflow.updated_at
-            )
+        # Save to database
+        db_workflow = workflow.to_db_model()
+        session.add(db_workflow)
+        await session.commit()
+        await session.refresh(db_workflow)
 
-    except Exception as e:
-        logger.error(f"Error creating workflow: {e}")
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create workflow: {str(e)}"
-        )
+        return _serialize_workflow(db_workflow)
 
 
 @router.get("/{workflow_id}", response_model=AdminWorkflowResponse)
+@handle_api_errors
 async def get_workflow(
     workflow_id: int,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Get a specific workflow by ID"""
-    try:
-        async with db_service.get_session() as session:
-            db_workflow = await session.get(WorkflowDB, workflow_id)
-            if not db_workflow:
-                raise HTTPException(
-                    status_code=http_status.HTTP_404_NOT_FOUND,
-                    detail=f"Workflow {workflow_id} not found"
-                )
-
-            return AdminWorkflowResponse(
-                id=db_workflow.id,
-                name=db_workflow.name,
-                description=db_workflow.description,
-                status=db_workflow.status,
-                triggers=db_workflow.triggers or [],
-                actions=db_workflow.actions or [],
-                execution_count=db_workflow.execution_count,
-                last_execution=db_workflow.last_execution,
-                success_rate=db_workflow.success_rate,
-                avg_runtime=db_workflow.avg_runtime,
-                created_at=db_workflow.created_at,
-                updated_at=db_workflow.updated_at
+    async with db_service.get_session() as session:
+        db_workflow = await session.get(WorkflowDB, workflow_id)
+        if not db_workflow:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail=f"Workflow {workflow_id} not found"
             )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting workflow {workflow_id}: {e}")
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get workflow: {str(e)}"
-        )
+        return _serialize_workflow(db_workflow)
 
 
 @router.put("/{workflow_id}", response_model=AdminWorkflowResponse)
+@handle_api_errors
 async def update_workflow(
     workflow_id: int,
     workflow_data: AdminWorkflowUpdate,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Update an existing workflow"""
-    try:
-        async with db_service.get_session() as session:
-            db_workflow = await session.get(WorkflowDB, workflow_id)
-            if not db_workflow:
-                raise HTTPException(
-                    status_code=http_status.HTTP_404_NOT_FOUND,
-                    detail=f"Workflow {workflow_id} not found"
-                )
-
-            # Update fields
-            if workflow_data.name is not None:
-                db_workflow.name = workflow_data.name
-            if workflow_data.description is not None:
-                db_workflow.description = workflow_data.description
-            if workflow_data.status is not None:
-                db_workflow.status = workflow_data.status
-            if workflow_data.triggers is not None:
-                db_workflow.triggers = [trigger.dict() for trigger in workflow_data.triggers]
-            if workflow_data.actions is not None:
-                db_workflow.actions = [action.dict() for action in workflow_data.actions]
-
-            db_workflow.updated_at = datetime.utcnow()
-
-            await session.commit()
-            await session.refresh(db_workflow)
-
-            return AdminWorkflowResponse(
-                id=db_workflow.id,
-                name=db_workflow.name,
-                description=db_workflow.description,
-                status=db_workflow.status,
-                triggers=db_workflow.triggers or [],
-                actions=db_workflow.actions or [],
-                execution_count=db_workflow.execution_count,
-                last_execution=db_workflow.last_execution,
-                success_rate=db_workflow.success_rate,
-                avg_runtime=db_workflow.avg_runtime,
-                created_at=db_workflow.created_at,
-                updated_at=db_workflow.updated_at
+    async with db_service.get_session() as session:
+        db_workflow = await session.get(WorkflowDB, workflow_id)
+        if not db_workflow:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail=f"Workflow {workflow_id} not found"
             )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating workflow {workflow_id}: {e}")
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update workflow: {str(e)}"
-        )
+        # Update fields
+        if workflow_data.name is not None:
+            db_workflow.name = workflow_data.name
+        if workflow_data.description is not None:
+            db_workflow.description = workflow_data.description
+        if workflow_data.status is not None:
+            db_workflow.status = workflow_data.status
+        if workflow_data.triggers is not None:
+            db_workflow.triggers = [trigger.model_dump() for trigger in workflow_data.triggers]
+        if workflow_data.actions is not None:
+            db_workflow.actions = [action.model_dump() for action in workflow_data.actions]
+
+        db_workflow.updated_at = datetime.utcnow()
+
+        await session.commit()
+        await session.refresh(db_workflow)
+
+        return _serialize_workflow(db_workflow)
 
 
 @router.delete("/{workflow_id}")
+@handle_api_errors
 async def delete_workflow(
     workflow_id: int,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Delete a workflow"""
-    try:
-        async with db_service.get_session() as session:
-            db_workflow = await session.get(WorkflowDB, workflow_id)
-            if not db_workflow:
-                raise HTTPException(
-                    status_code=http_status.HTTP_404_NOT_FOUND,
-                    detail=f"Workflow {workflow_id} not found"
-                )
-
-            await session.delete(db_workflow)
-            await session.commit()
+    async with db_service.get_session() as session:
+        db_workflow = await session.get(WorkflowDB, workflow_id)
+        if not db_workflow:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail=f"Workflow {workflow_id} not found"
+            )
 
-            return {"success": True, "message": f"Workflow {workflow_id} deleted"}
+        await session.delete(db_workflow)
+        await session.commit()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting workflow {workflow_id}: {e}")
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete workflow: {str(e)}"
-        )
+        return {"success": True, "message": f"Workflow {workflow_id} deleted"}
 
 
 @router.post("/{workflow_id}/pause")
+@handle_api_errors
 async def pause_workflow(
     workflow_id: int,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Pause a workflow"""
-    try:
-        async with db_service.get_session() as session:
-            db_workflow = await session.get(WorkflowDB, workflow_id)
-            if not db_workflow:
-                raise HTTPException(
-                    status_code=http_status.HTTP_404_NOT_FOUND,
-                    detail=f"Workflow {workflow_id} not found"
-                )
+    async with db_service.get_session() as session:
+        db_workflow = await session.get(WorkflowDB, workflow_id)
+        if not db_workflow:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail=f"Workflow {workflow_id} not found"
+            )
 
-            db_workflow.status = "paused"
-            db_workflow.updated_at = datetime.utcnow()
-            await session.commit()
+        db_workflow.status = "paused"
+        db_workflow.updated_at = datetime.utcnow()
+        await session.commit()
 
-            return {"success": True, "message": f"Workflow {workflow_id} paused"}
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error pausing workflow {workflow_id}: {e}")
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to pause workflow: {str(e)}"
-        )
+        return {"success": True, "message": f"Workflow {workflow_id} paused"}
 
 
 @router.post("/{workflow_id}/resume")
+@handle_api_errors
 async def resume_workflow(
     workflow_id: int,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Resume a paused workflow"""
-    try:
-        async with db_service.get_session() as session:
-            db_workflow = await session.get(WorkflowDB, workflow_id)
-            if not db_workflow:
-                raise HTTPException(
-                    status_code=http_status.HTTP_404_NOT_FOUND,
-                    detail=f"Workflow {workflow_id} not found"
-                )
-
-            db_workflow.status = "active"
-            db_workflow.updated_at = datetime.utcnow()
-            await session.commit()
+    async with db_service.get_session() as session:
+        db_workflow = await session.get(WorkflowDB, workflow_id)
+        if not db_workflow:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail=f"Workflow {workflow_id} not found"
+            )
 
-            return {"success": True, "message": f"Workflow {workflow_id} resumed"}
+        db_workflow.status = "active"
+        db_workflow.updated_at = datetime.utcnow()
+        await session.commit()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error resuming workflow {workflow_id}: {e}")
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to resume workflow: {str(e)}"
-        )
+        return {"success": True, "message": f"Workflow {workflow_id} resumed"}
 
 
 @router.get("/{workflow_id}/executions", response_model=List[AdminWorkflowExecutionResponse])
+@handle_api_errors
 async def get_workflow_executions(
     workflow_id: int,
     authenticated: bool = Depends(verify_api_key),
     limit: int = Query(50, ge=1, le=500, description="Number of executions to return")
 ):
     """Get recent executions for a workflow"""
-    try:
-        async with db_service.get_session() as session:
-            # Verify workflow exists
-            db_workflow = await session.get(WorkflowDB, workflow_id)
-            if not db_workflow:
-                raise HTTPException(
-                    status_code=http_status.HTTP_404_NOT_FOUND,
-                    detail=f"Workflow {workflow_id} not found"
-                )
+    async with db_service.get_session() as session:
+        # Verify workflow exists
+        db_workflow = await session.get(WorkflowDB, workflow_id)
+        if not db_workflow:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail=f"Workflow {workflow_id} not found"
+            )
+
+        # Get recent executions
+        query = select(WorkflowExecutionDB).where(
+            WorkflowExecutionDB.workflow_id == workflow_id
+        ).order_by(WorkflowExecutionDB.executed_at.desc()).limit(limit)
+
+        # Stream rows in fixed-size batches instead of materializing the full result
+        result = await session.stream_scalars(query.execution_options(yield_per=64))
+        executions = [_serialize_execution(db_execution) async for db_execution in result]
 
-            # Get recent executions
-            query = select(WorkflowExecutionDB).where(
-                WorkflowExecutionDB.workflow_id == workflow_id
-            ).order_by(WorkflowExecutionDB.executed_at.desc()).limit(limit)
-
-            result = await session.execute(query)
-            db_executions = result.scalars().all()
-
-            executions = []
-            for db_execution in db_executions:
-                executions.append(AdminWorkflowExecutionResponse(
-                    id=db_execution.id,
-                    workflow_id=db_execution.workflow_id,
-                    status=db_execution.status,
-                    runtime_seconds=db_execution.runtime_seconds,
-                    error_message=db_execution.error_message,
-                    result_data=db_execution.result_data,
-                    executed_at=db_execution.executed_at
-                ))
-
-            return executions
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting workflow executions for {workflow_id}: {e}")
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get workflow executions: {str(e)}"
-        )
\ No newline at end of file
+        return executions
@@ -3,22 +3,232 @@ CalDAV API Router
 Handles CalDAV backend management and calendar operations
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, status
-from pydantic import BaseModel
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+try:
+    import requests
+    from caldav import DAVClient
+except ImportError:
+    DAVClient = None
 
 from src.api.dependencies import verify_api_key, get_scheduler
 from src.core.scheduler import ChronosScheduler
+from src.core.source_adapter import CalendarRef, SourceAdapter, gather_bounded
 from src.api.error_handling import handle_api_errors
 from src.api.standard_schemas import (
     APISuccessResponse, CalDAVConnectionTestResponse, CalDAVBackendSwitchResponse,
     CalDAVCalendarListResponse, CalDAVSyncResponse, CalDAVEventResponse
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# Calendar listings change rarely; cache them per adapter to avoid a
+# PROPFIND round trip on every calendar-scoped request
+CALENDAR_CACHE_TTL_SECONDS = 60
+ALL_CALENDARS = "*"
+_calendar_cache: Dict[int, Tuple[float, Dict[str, CalendarRef]]] = {}
+_calendar_cache_lock = asyncio.Lock()
+
+# Capabilities are static for an adapter's lifetime; build the payload once
+_capabilities_cache: Dict[int, Dict[str, Any]] = {}
+
+# Default sync window; the CalDAV time-range filter keeps old history server-side
+SYNC_WINDOW_PAST_DAYS = 30
+SYNC_WINDOW_FUTURE_DAYS = 180
+
+CONNECTION_TEST_TIMEOUT_SECONDS = 10
+
+# Connection tests reuse DAVClients (and their keep-alive sessions) per
+# server and credentials
+DAV_CLIENT_POOL_SIZE = 16
+DAV_CLIENT_IDLE_SECONDS = 300
+_dav_clients: "OrderedDict[Tuple[str, Optional[str], str], Tuple[float, Any]]" = OrderedDict()
+
+FREEBUSY_DEFAULT_DAYS = 7
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Upper bound for calendar-multiget requests
+MAX_BATCH_EVENT_IDS = 200
+
+
+async def _get_calendars_by_id(adapter: SourceAdapter) -> Dict[str, CalendarRef]:
+    """Return the adapter's calendars keyed by ID, refreshing after the TTL"""
+    key = id(adapter)
+    cached = _calendar_cache.get(key)
+    if cached and time.monotonic() - cached[0] < CALENDAR_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    async with _calendar_cache_lock:
+        # Another request may have refreshed the entry while we waited
+        cached = _calendar_cache.get(key)
+        if cached and time.monotonic() - cached[0] < CALENDAR_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        calendars = await adapter.list_calendars()
+        calendars_by_id = {cal.id: cal for cal in calendars}
+        _calendar_cache[key] = (time.monotonic(), calendars_by_id)
+        return calendars_by_id
+
+
+async def _get_capabilities_payload(adapter: SourceAdapter) -> Dict[str, Any]:
+    """Return the adapter's capabilities as a response dict, built once per adapter"""
+    key = id(adapter)
+    payload = _capabilities_cache.get(key)
+    if payload is None:
+        capabilities = await adapter.capabilities()
+        payload = {
+            "name": capabilities.name,
+            "can_write": capabilities.can_write,
+            "supports_sync_token": capabilities.supports_sync_token,
+            "timezone": capabilities.timezone
+        }
+        _capabilities_cache[key] = payload
+    return payload
+
+
+def invalidate_calendar_cache():
+    """Drop all cached calendar listings and capabilities (e.g. after a backend switch)"""
+    _calendar_cache.clear()
+    _capabilities_cache.clear()
+
+
+async def resolve_calendar(
+    calendar_id: str,
+    authenticated: bool = Depends(verify_api_key),
+    scheduler: ChronosScheduler = Depends(get_scheduler)
+) -> CalendarRef:
+    """Resolve the calendar_id path parameter via the calendar cache
+
+    Depends on verify_api_key so unauthenticated callers get a 401 before
+    calendar ids are looked up, whatever the handler's parameter order.
+    """
+    try:
+        calendars_by_id = await _get_calendars_by_id(scheduler.source_manager.adapter)
+    except Exception:
+        logger.exception("Error listing calendars")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list calendars"
+        )
+
+    calendar = calendars_by_id.get(calendar_id)
+    if not calendar:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Calendar {calendar_id} not found"
+        )
+    return calendar
+
+
+async def require_writable_calendar(
+    calendar: CalendarRef = Depends(resolve_calendar)
+) -> CalendarRef:
+    """Resolve the calendar_id path parameter and reject read-only calendars"""
+    if calendar.read_only:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Calendar {calendar.id} is read-only"
+        )
+    return calendar
+
+
+async def resolve_calendars(
+    calendar_id: str,
+    authenticated: bool = Depends(verify_api_key),
+    scheduler: ChronosScheduler = Depends(get_scheduler)
+) -> List[CalendarRef]:
+    """Resolve calendar_id to one calendar, or every calendar for "*" """
+    if calendar_id != ALL_CALENDARS:
+        return [await resolve_calendar(calendar_id, authenticated, scheduler)]
+
+    try:
+        return list((await _get_calendars_by_id(scheduler.source_manager.adapter)).values())
+    except Exception:
+        logger.exception("Error listing calendars")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list calendars"
+        )
+
+
+def _calendar_payload(cal: CalendarRef) -> Dict[str, Any]:
+    """Serialize a CalendarRef for API responses"""
+    return {
+        "id": cal.id,
+        "alias": cal.alias,
+        "url": cal.url,
+        "read_only": cal.read_only,
+        "timezone": cal.timezone
+    }
+
+
+def _iter_ndjson(items: List[Dict[str, Any]]) -> Iterator[bytes]:
+    """Serialize items as newline-delimited JSON, one chunk per item"""
+    for item in items:
+        yield orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _weak_etag(value: Any) -> str:
+    """Build a weak ETag from a backend etag or a JSON-serializable payload"""
+    if not isinstance(value, str):
+        value = hashlib.sha1(orjson.dumps(value, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    if value.startswith('W/'):
+        value = value[2:]
+    value = value.strip('"')
+    return f'W/"{value}"'
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    """Caching headers for cacheable GET responses"""
+    return {"Cache-Control": f"private, max-age={CALENDAR_CACHE_TTL_SECONDS}", "ETag": etag}
+
+
+def _not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Set caching headers and return a 304 response if the client copy is fresh"""
+    headers = _cache_headers(etag)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match uses weak comparison
+        candidates = {_weak_etag(tag.strip()) for tag in if_none_match.split(",") if tag.strip()}
+        if "*" in if_none_match or etag in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC as used by the scheduler"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _resolve_sync_window(start: Optional[datetime], end: Optional[datetime]) -> Tuple[datetime, datetime]:
+    """Apply the default sync window and validate it"""
+    now = datetime.utcnow()
+    since = _to_naive_utc(start) if start else now - timedelta(days=SYNC_WINDOW_PAST_DAYS)
+    until = _to_naive_utc(end) if end else now + timedelta(days=SYNC_WINDOW_FUTURE_DAYS)
+    if until <= since:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Sync window end must be after start"
+        )
+    return since, until
+
 
 # CalDAV-specific schemas
 class CalDAVBackendInfo(BaseModel):
@@ -37,16 +247,29 @@ class CalDAVBackendSwitch(BaseModel):
     backend_type: str  # "caldav" or "google"
 
 
+class CalDAVBatchSync(BaseModel):
+    calendar_ids: List[str] = Field(default_factory=list, description="Calendars to sync (empty: all)")
+    force_refresh: bool = False
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+
+class CalDAVEventBatchGet(BaseModel):
+    event_ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_EVENT_IDS)
+
+
 class CalDAVEventCreate(BaseModel):
     summary: str
     description: Optional[str] = None
-    start_time: str  # ISO format
-    end_time: str    # ISO format
+    start_time: datetime  # ISO 8601, parsed by Pydantic
+    end_time: datetime    # ISO 8601, parsed by Pydantic
     location: Optional[str] = None
 
 
 @router.get("/backend/info", response_model=CalDAVBackendInfo)
 async def get_backend_info(
+    request: Request,
+    response: Response,
     authenticated: bool = Depends(verify_api_key),
     scheduler: ChronosScheduler = Depends(get_scheduler)
 ):
@@ -57,91 +280,152 @@ async def get_backend_info(
         adapter = source_manager.adapter
 
         # Get adapter capabilities
-        capabilities = await adapter.capabilities()
-        calendars = await adapter.list_calendars()
-
-        return CalDAVBackendInfo(
-            backend_type=capabilities.name,
-            capabilities={
-                "name": capabilities.name,
-                "can_write": capabilities.can_write,
-                "supports_sync_token": capabilities.supports_sync_token,
-                "timezone": capabilities.timezone
-            },
-            calendars=[
-                {
-                    "id": cal.id,
-                    "alias": cal.alias,
-                    "url": cal.url,
-                    "read_only": cal.read_only,
-                    "timezone": cal.timezone
-                }
-                for cal in calendars
-            ]
+        capabilities = await _get_capabilities_payload(adapter)
+        calendars = (await _get_calendars_by_id(adapter)).values()
+
+        # Adapter data is trusted; skip re-validating every calendar dict
+        backend_info = CalDAVBackendInfo.model_construct(
+            backend_type=capabilities["name"],
+            capabilities=capabilities,
+            calendars=[_calendar_payload(cal) for cal in calendars]
         )
 
-    except Exception as e:
-        logger.error(f"Error getting backend info: {e}")
+        not_modified = _not_modified(request, response, _weak_etag(backend_info.model_dump()))
+        return not_modified or backend_info
+
+    except Exception:
+        logger.exception("Error getting backend info")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get backend info: {str(e)}"
+            detail="Failed to get backend info"
         )
 
 
+def _create_dav_client(url: str, username: Optional[str], password: Optional[str]):
+    """Create a DAVClient with a bounded, keep-alive connection pool"""
+    client = DAVClient(url=url, username=username, password=password)
+    pool = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    client.session.mount("http://", pool)
+    client.session.mount("https://", pool)
+    # DAVClient has no timeout option; bound every request it makes
+    client.session.request = functools.partial(
+        client.session.request, timeout=CONNECTION_TEST_TIMEOUT_SECONDS
+    )
+    return client
+
+
+def _get_dav_client(url: str, username: Optional[str], password: Optional[str]):
+    """Return a pooled DAVClient for these credentials, evicting idle/excess clients
+
+    Runs on the event loop without awaiting, so the pool needs no lock.
+    """
+    key = (url, username, hashlib.sha256((password or "").encode()).hexdigest())
+    now = time.monotonic()
+
+    # Entries are kept in least-recently-used order
+    while _dav_clients:
+        oldest_key, (last_used, oldest_client) = next(iter(_dav_clients.items()))
+        if now - last_used <= DAV_CLIENT_IDLE_SECONDS and len(_dav_clients) < DAV_CLIENT_POOL_SIZE:
+            break
+        del _dav_clients[oldest_key]
+        oldest_client.session.close()
+
+    entry = _dav_clients.pop(key, None)
+    client = entry[1] if entry else _create_dav_client(url, username, password)
+    _dav_clients[key] = (now, client)
+    return key, client
+
+
+def clear_dav_client_pool():
+    """Close and drop all pooled connection-test clients"""
+    while _dav_clients:
+        _, (_, client) = _dav_clients.popitem()
+        client.session.close()
+
+
+def _probe_caldav_options(client) -> Dict[str, Any]:
+    """Check CalDAV support with a single OPTIONS request (blocking)"""
+    response = client.options(str(client.url))
+    if response.status >= 400:
+        raise ConnectionError(f"Server returned HTTP {response.status}")
+
+    dav_classes = [value.strip() for value in response.headers.get("DAV", "").split(",") if value.strip()]
+    if "calendar-access" not in dav_classes:
+        raise ValueError("Server does not advertise CalDAV calendar-access support (try deep=true)")
+
+    return {"dav": dav_classes, "supports_caldav": True}
+
+
+def _probe_caldav_server(client) -> Dict[str, Any]:
+    """Describe the server behind a DAVClient (blocking)"""
+    # Test connection by getting principal
+    principal = client.principal()
+
+    # Try to get calendar home set
+    calendar_home = principal.calendar_home_set
+
+    # Try to list calendars
+    calendars = principal.calendars()
+
+    return {
+        "calendar_count": len(calendars),
+        "principal_url": str(principal.url) if principal else None,
+        "calendar_home": str(calendar_home) if calendar_home else None,
+        "calendars": [{"name": cal.name, "url": str(cal.url)} for cal in calendars[:5]]  # Max 5 for preview
+    }
+
+
 @router.post("/test-connection", response_model=CalDAVConnectionTestResponse)
 async def test_caldav_connection(
     connection_data: CalDAVConnectionTest,
+    deep: bool = Query(False, description="Walk principal and calendars instead of a single OPTIONS probe"),
     authenticated: bool = Depends(verify_api_key)
 ):
-    """Test CalDAV server connection"""
-    try:
-        # This would create a temporary adapter to test the connection
-        # For now, we'll return a simple success response
-        # In a full implementation, this would actually test the connection
+    """Test CalDAV server connection
 
+    By default a single OPTIONS request checks that the server advertises
+    calendar-access; deep=true also discovers the principal and calendars.
+    """
+    try:
         logger.info(f"Testing connection to {connection_data.server_url}")
 
+        if DAVClient is None:
+            return CalDAVConnectionTestResponse(
+                success=False,
+                message="CalDAV library not available - install python-caldav",
+                server_url=connection_data.server_url,
+                details={"error": "python-caldav package not installed"}
+            )
+
         # Implement actual connection testing
         try:
-            import caldav
-            from caldav import DAVClient
-
-            # Create temporary CalDAV client
-            client = DAVClient(
-                url=connection_data.server_url,
-                username=connection_data.username,
-                password=connection_data.password
+            client_key, client = _get_dav_client(
+                connection_data.server_url,
+                connection_data.username,
+                connection_data.password
             )
-
-            # Test connection by getting principal
-            principal = client.principal()
-
-            # Try to get calendar home set
-            calendar_home = principal.calendar_home_set
-
-            # Try to list calendars
-            calendars = principal.calendars()
-            calendar_count = len(calendars)
+            try:
+                # python-caldav is blocking (requests); keep it off the event loop
+                probe = _probe_caldav_server if deep else _probe_caldav_options
+                details = await asyncio.to_thread(probe, client)
+            except Exception:
+                # Don't keep clients for unreachable servers or bad credentials
+                if _dav_clients.pop(client_key, None):
+                    client.session.close()
+                raise
+
+            if deep:
+                message = f"Connection successful! Found {details['calendar_count']} calendar(s)"
+            else:
+                message = "Connection successful! Server supports CalDAV"
 
             return CalDAVConnectionTestResponse(
                 success=True,
-                message=f"Connection successful! Found {calendar_count} calendar(s)",
+                message=message,
                 server_url=connection_data.server_url,
-                details={
-                    "calendar_count": calendar_count,
-                    "principal_url": str(principal.url) if principal else None,
-                    "calendar_home": str(calendar_home) if calendar_home else None,
-                    "calendars": [{"name": cal.name, "url": str(cal.url)} for cal in calendars[:5]]  # Max 5 for preview
-                }
+                details=details
             )
 
-        except ImportError:
-            return CalDAVConnectionTestResponse(
-                success=False,
-                message="CalDAV library not available - install python-caldav",
-                server_url=connection_data.server_url,
-                details={"error": "python-caldav package not installed"}
-            )
         except Exception as conn_error:
             return CalDAVConnectionTestResponse(
                 success=False,
@@ -154,11 +438,11 @@ async def test_caldav_connection(
             }
         )
 
-    except Exception as e:
-        logger.error(f"Error testing CalDAV connection: {e}")
+    except Exception:
+        logger.exception("Error testing CalDAV connection")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Connection test failed: {str(e)}"
+            detail="Connection test failed"
         )
 
 
@@ -184,87 +468,144 @@ async def switch_backend(
                 detail=f"Unknown backend type: {switch_data.backend_type}"
             )
 
+        # Cached calendar listings belong to the replaced adapter
+        invalidate_calendar_cache()
+
         return CalDAVBackendSwitchResponse(
             success=True,
             message=f"Switched to {switch_data.backend_type} backend",
             current_backend=switch_data.backend_type
         )
 
-    except Exception as e:
-        logger.error(f"Error switching backend: {e}")
+    except Exception:
+        logger.exception("Error switching backend")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to switch backend: {str(e)}"
+            detail="Failed to switch backend"
         )
 
 
 @router.get("/calendars", response_model=CalDAVCalendarListResponse)
 async def list_calendars(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of calendars to return"),
+    offset: int = Query(0, ge=0, description="Number of calendars to skip"),
     authenticated: bool = Depends(verify_api_key),
     scheduler: ChronosScheduler = Depends(get_scheduler)
 ):
-    """List all available CalDAV calendars"""
+    """List available CalDAV calendars
+
+    Send "Accept: application/x-ndjson" to stream one calendar per line
+    instead of a single JSON document.
+    """
     try:
         source_manager = scheduler.source_manager
         adapter = source_manager.adapter
 
-        calendars = await adapter.list_calendars()
+        calendars = sorted((await _get_calendars_by_id(adapter)).values(), key=lambda cal: cal.id)
+        page = calendars[offset:offset + limit if limit else None]
+        calendar_dicts = [_calendar_payload(cal) for cal in page]
 
-        return CalDAVCalendarListResponse(
-            calendars=[
-                {
-                    "id": cal.id,
-                    "alias": cal.alias,
-                    "url": cal.url,
-                    "read_only": cal.read_only,
-                    "timezone": cal.timezone
-                }
-                for cal in calendars
-            ],
+        etag = _weak_etag({"calendars": calendar_dicts, "total_count": len(calendars)})
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+
+        if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+            return StreamingResponse(
+                _iter_ndjson(calendar_dicts),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers={**_cache_headers(etag), "X-Total-Count": str(len(calendars))}
+            )
+
+        return CalDAVCalendarListResponse.model_construct(
+            calendars=calendar_dicts,
             total_count=len(calendars)
         )
 
-    except Exception as e:
-        logger.error(f"Error listing calendars: {e}")
+    except Exception:
+        logger.exception("Error listing calendars")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list calendars"
+        )
+
+
+@router.post("/calendars:batchSync", response_model=CalDAVSyncResponse)
+async def batch_sync_calendars(
+    batch: CalDAVBatchSync,
+    authenticated: bool = Depends(verify_api_key),
+    scheduler: ChronosScheduler = Depends(get_scheduler)
+):
+    """Sync several calendars (or all, if none are given) in one request"""
+    try:
+        since, until = _resolve_sync_window(batch.start, batch.end)
+
+        calendar_ids = list(dict.fromkeys(batch.calendar_ids)) or None
+        if calendar_ids:
+            calendars_by_id = await _get_calendars_by_id(scheduler.source_manager.adapter)
+            unknown = [calendar_id for calendar_id in calendar_ids if calendar_id not in calendars_by_id]
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Calendars not found: {', '.join(unknown)}"
+                )
+
+        # One scheduler run fetches all calendars concurrently and keeps
+        # database writes serialized
+        logger.info("Batch syncing calendars %s", calendar_ids or ALL_CALENDARS)
+        sync_result = await scheduler.sync_calendar(
+            force_refresh=batch.force_refresh, calendar_ids=calendar_ids,
+            since=since, until=until,
+            exact_window=batch.start is not None or batch.end is not None
+        )
+
+        return CalDAVSyncResponse(
+            success=sync_result.get("success", False),
+            message=f"{sync_result.get('calendars_synced', 0)} calendar(s) synced",
+            calendar_id=",".join(calendar_ids) if calendar_ids else ALL_CALENDARS,
+            sync_details={
+                "events_processed": sync_result.get("events_processed", 0),
+                "incremental_calendars": sync_result.get("incremental_calendars", []),
+                "calendars": sync_result.get("calendar_results", {}),
+                "errors": sync_result.get("errors", [])
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error batch syncing calendars")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list calendars: {str(e)}"
+            detail="Failed to sync calendars"
         )
 
 
 @router.post("/calendars/{calendar_id}/sync", response_model=CalDAVSyncResponse)
 async def sync_calendar(
     calendar_id: str,
+    force_refresh: bool = Query(False, description="Ignore stored sync tokens and do a full sync"),
+    start: Optional[datetime] = Query(None, description="Start of the sync window (default: now - 30 days)"),
+    end: Optional[datetime] = Query(None, description="End of the sync window (default: now + 180 days)"),
     authenticated: bool = Depends(verify_api_key),
+    calendars: List[CalendarRef] = Depends(resolve_calendars),
     scheduler: ChronosScheduler = Depends(get_scheduler)
 ):
-    """Manually sync a specific calendar"""
+    """Manually sync a specific calendar, or all calendars with calendar_id "*" """
     try:
-        source_manager = scheduler.source_manager
-        adapter = source_manager.adapter
+        since, until = _resolve_sync_window(start, end)
 
-        # Find the calendar
-        calendars = await adapter.list_calendars()
-        target_calendar = None
-        for cal in calendars:
-            if cal.id == calendar_id:
-                target_calendar = cal
-                break
+        # Scheduler fetches every calendar concurrently
+        calendar_ids = None if calendar_id == ALL_CALENDARS else [calendar.id for calendar in calendars]
 
-        if not target_calendar:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Calendar {calendar_id} not found"
-            )
-
-        # Sync the calendar
-        # This would typically involve calling the scheduler's sync method
-        # with a specific calendar filter
         logger.info(f"Syncing calendar {calendar_id}")
-
-        # TODO: Implement actual calendar-specific sync
-        # For now, trigger a general sync
-        sync_result = await scheduler.sync_events()
+        sync_result = await scheduler.sync_calendar(
+            force_refresh=force_refresh, calendar_ids=calendar_ids,
+            since=since, until=until,
+            exact_window=start is not None or end is not None
+        )
 
         return CalDAVSyncResponse(
             success=True,
@@ -272,17 +613,18 @@ async def sync_calendar(
             calendar_id=calendar_id,
             sync_details={
                 "events_processed": sync_result.get("events_processed", 0),
+                "incremental_calendars": sync_result.get("incremental_calendars", []),
                 "errors": sync_result.get("errors", [])
             }
         )
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error syncing calendar {calendar_id}: {e}")
+    except Exception:
+        logger.exception("Error syncing calendar %s", calendar_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to sync calendar: {str(e)}"
+            detail="Failed to sync calendar"
         )
 
 
@@ -291,6 +633,7 @@ async def create_caldav_event(
     calendar_id: str,
     event_data: CalDAVEventCreate,
     authenticated: bool = Depends(verify_api_key),
+    calendar: CalendarRef = Depends(require_writable_calendar),
     scheduler: ChronosScheduler = Depends(get_scheduler)
 ):
     """Create event directly in CalDAV calendar"""
@@ -298,38 +641,17 @@ async def create_caldav_event(
         source_manager = scheduler.source_manager
         adapter = source_manager.adapter
 
-        # Find the calendar
-        calendars = await adapter.list_calendars()
-        target_calendar = None
-        for cal in calendars:
-            if cal.id == calendar_id:
-                target_calendar = cal
-                break
-
-        if not target_calendar:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Calendar {calendar_id} not found"
-            )
-
-        if target_calendar.read_only:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Calendar {calendar_id} is read-only"
-            )
-
         # Create event data for adapter
-        from datetime import datetime
         adapter_event_data = {
             'summary': event_data.summary,
             'description': event_data.description,
-            'start_time': datetime.fromisoformat(event_data.start_time.replace('Z', '+00:00')),
-            'end_time': datetime.fromisoformat(event_data.end_time.replace('Z', '+00:00')),
+            'start_time': event_data.start_time,
+            'end_time': event_data.end_time,
             'location': event_data.location
         }
 
         # Create event via adapter
-        event_uid = await adapter.create_event(target_calendar, adapter_event_data)
+        event_uid = await adapter.create_event(calendar, adapter_event_data)
 
         return CalDAVEventResponse(
             success=True,
@@ -340,11 +662,11 @@ async def create_caldav_event(
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error creating event in calendar {calendar_id}: {e}")
+    except Exception:
+        logger.exception("Error creating event in calendar %s", calendar_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create event: {str(e)}"
+            detail="Failed to create event"
         )
 
 
@@ -352,7 +674,10 @@ async def create_caldav_event(
 async def get_caldav_event(
     calendar_id: str,
     event_id: str,
+    request: Request,
+    response: Response,
     authenticated: bool = Depends(verify_api_key),
+    calendar: CalendarRef = Depends(resolve_calendar),
     scheduler: ChronosScheduler = Depends(get_scheduler)
 ):
     """Get specific event from CalDAV calendar"""
@@ -360,22 +685,8 @@ async def get_caldav_event(
         source_manager = scheduler.source_manager
         adapter = source_manager.adapter
 
-        # Find the calendar
-        calendars = await adapter.list_calendars()
-        target_calendar = None
-        for cal in calendars:
-            if cal.id == calendar_id:
-                target_calendar = cal
-                break
-
-        if not target_calendar:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Calendar {calendar_id} not found"
-            )
-
         # Get event
-        event = await adapter.get_event(target_calendar, event_id)
+        event = await adapter.get_event(calendar, event_id)
 
         if not event:
             raise HTTPException(
@@ -383,56 +694,125 @@ async def get_caldav_event(
                 detail=f"Event {event_id} not found in calendar {calendar_id}"
             )
 
-        return {
+        payload = {
             "event": event,
             "calendar_id": calendar_id
         }
+        etag = _weak_etag(event.get("etag") or payload)
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+
+        # Free-form adapter data; serialize straight through orjson instead
+        # of validating against the Dict[str, Any] response model
+        return ORJSONResponse(payload, headers=_cache_headers(etag))
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error getting event {event_id} from calendar {calendar_id}: {e}")
+    except Exception:
+        logger.exception("Error getting event %s from calendar %s", event_id, calendar_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get event: {str(e)}"
+            detail="Failed to get event"
         )
 
 
-@router.patch("/calendars/{calendar_id}/events/{event_id}", response_model=CalDAVEventResponse)
-async def update_caldav_event(
+@router.post("/calendars/{calendar_id}/events:batchGet", response_model=Dict[str, Any])
+async def batch_get_caldav_events(
     calendar_id: str,
-    event_id: str,
-    patch_data: Dict[str, Any],
+    batch: CalDAVEventBatchGet,
     authenticated: bool = Depends(verify_api_key),
+    calendar: CalendarRef = Depends(resolve_calendar),
     scheduler: ChronosScheduler = Depends(get_scheduler)
 ):
-    """Update specific event in CalDAV calendar"""
+    """Get several events from a CalDAV calendar in one backend round trip"""
     try:
         source_manager = scheduler.source_manager
         adapter = source_manager.adapter
 
-        # Find the calendar
-        calendars = await adapter.list_calendars()
-        target_calendar = None
-        for cal in calendars:
-            if cal.id == calendar_id:
-                target_calendar = cal
-                break
+        event_ids = list(dict.fromkeys(batch.event_ids))
+        events = await adapter.multiget_events(calendar, event_ids)
+        found_ids = {event.get("uid") or event.get("id") for event in events}
 
-        if not target_calendar:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Calendar {calendar_id} not found"
-            )
+        return ORJSONResponse({
+            "events": events,
+            "missing": [event_id for event_id in event_ids if event_id not in found_ids],
+            "calendar_id": calendar_id
+        })
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error getting events from calendar %s", calendar_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get events"
+        )
 
-        if target_calendar.read_only:
+
+@router.get("/calendars/{calendar_id}/freebusy", response_model=Dict[str, Any])
+async def get_calendar_freebusy(
+    calendar_id: str,
+    start: Optional[datetime] = Query(None, description="Start of the window (default: now)"),
+    end: Optional[datetime] = Query(None, description="End of the window (default: now + 7 days)"),
+    authenticated: bool = Depends(verify_api_key),
+    calendars: List[CalendarRef] = Depends(resolve_calendars),
+    scheduler: ChronosScheduler = Depends(get_scheduler)
+):
+    """Get busy periods for a calendar, or all calendars with calendar_id "*" """
+    try:
+        source_manager = scheduler.source_manager
+        adapter = source_manager.adapter
+
+        since = _to_naive_utc(start) if start else datetime.utcnow()
+        until = _to_naive_utc(end) if end else since + timedelta(days=FREEBUSY_DEFAULT_DAYS)
+        if until <= since:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Calendar {calendar_id} is read-only"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Free/busy window end must be after start"
             )
 
+        # One free-busy-query per calendar, issued concurrently
+        busy_by_calendar = await gather_bounded(
+            (adapter.freebusy(calendar, since, until) for calendar in calendars),
+            adapter.max_concurrency
+        )
+
+        return ORJSONResponse({
+            "start": since,
+            "end": until,
+            "busy": {
+                calendar.id: [{"start": busy_start, "end": busy_end} for busy_start, busy_end in busy]
+                for calendar, busy in zip(calendars, busy_by_calendar)
+            }
+        })
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error getting free/busy for calendar %s", calendar_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get free/busy"
+        )
+
+
+@router.patch("/calendars/{calendar_id}/events/{event_id}", response_model=CalDAVEventResponse)
+async def update_caldav_event(
+    calendar_id: str,
+    event_id: str,
+    patch_data: Dict[str, Any],
+    authenticated: bool = Depends(verify_api_key),
+    calendar: CalendarRef = Depends(require_writable_calendar),
+    scheduler: ChronosScheduler = Depends(get_scheduler)
+):
+    """Update specific event in CalDAV calendar"""
+    try:
+        source_manager = scheduler.source_manager
+        adapter = source_manager.adapter
+
         # Update event via adapter
-        new_etag = await adapter.patch_event(target_calendar, event_id, patch_data)
+        new_etag = await adapter.patch_event(calendar, event_id, patch_data)
 
         return CalDAVEventResponse(
             success=True,
@@ -444,11 +824,11 @@ async def update_caldav_event(
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error updating event {event_id} in calendar {calendar_id}: {e}")
+    except Exception:
+        logger.exception("Error updating event %s in calendar %s", event_id, calendar_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update event: {str(e)}"
+            detail="Failed to update event"
         )
 
 
@@ -457,6 +837,7 @@ async def delete_caldav_event(
     calendar_id: str,
     event_id: str,
     authenticated: bool = Depends(verify_api_key),
+    calendar: CalendarRef = Depends(require_writable_calendar),
     scheduler: ChronosScheduler = Depends(get_scheduler)
 ):
     """Delete specific event from CalDAV calendar"""
@@ -464,28 +845,8 @@ async def delete_caldav_event(
         source_manager = scheduler.source_manager
         adapter = source_manager.adapter
 
-        # Find the calendar
-        calendars = await adapter.list_calendars()
-        target_calendar = None
-        for cal in calendars:
-            if cal.id == calendar_id:
-                target_calendar = cal
-                break
-
-        if not target_calendar:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Calendar {calendar_id} not found"
-            )
-
-        if target_calendar.read_only:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Calendar {calendar_id} is read-only"
-            )
-
         # Delete event via adapter
-        success = await adapter.delete_event(target_calendar, event_id)
+        success = await adapter.delete_event(calendar, event_id)
 
         if success:
             return CalDAVEventResponse(
@@ -502,9 +863,9 @@ async def delete_caldav_event(
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error deleting event {event_id} from calendar {calendar_id}: {e}")
+    except Exception:
+        logger.exception("Error deleting event %s from calendar %s", event_id, calendar_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete event: {str(e)}"
+            detail="Failed to delete event"
         )
\ No newline at end of file
@@ -4,11 +4,15 @@ Handles command queue operations for external system integration
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy import select, update
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from sqlalchemy import JSON, DateTime, Integer, bindparam, delete, func, literal, literal_column, or_, select, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from src.core.database import db_service
 from src.core.models import ExternalCommandDB, CommandStatus
@@ -22,16 +26,49 @@ from src.api.deprecation import deprecate_parameter, DeprecationLevel
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Minutes after which a PROCESSING command is considered abandoned
+STALE_COMMAND_MINUTES = 10
+
 
 # Command-specific schemas - Local override of standard schema
 class CommandResponseLocal(BaseModel):
+    """Command as handed to polling systems, validated straight from ExternalCommandDB rows"""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, coerce_numbers_to_str=True)
+
     id: str
-    system_id: str
-    command_type: str
-    payload: Dict[str, Any]
+    system_id: str = Field(validation_alias="target_system")
+    command_type: str = Field(validation_alias="command")
+    payload: Dict[str, Any] = Field(default_factory=dict, validation_alias="parameters")
     status: str
     created_at: datetime
-    updated_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = Field(None, validation_alias="processed_at")
+
+    @field_validator("payload", mode="before")
+    @classmethod
+    def _default_payload(cls, value):
+        return {} if value is None else value
+
+
+class PendingCommandsResponse(BaseModel):
+    commands: List[CommandResponseLocal]
+    count: int
+    system_id: str
+    retrieved_at: datetime
+
+
+_CommandAdapter = TypeAdapter(CommandResponseLocal)
+
+
+def _iter_pending_commands(rows: List[Any], system_id: str, retrieved_at: datetime) -> Iterator[bytes]:
+    """Encode a PendingCommandsResponse document one command at a time"""
+    yield b'{"commands":['
+    for index, row in enumerate(rows):
+        if index:
+            yield b','
+        yield _CommandAdapter.dump_json(_CommandAdapter.validate_python(row))
+    yield b'],"count":%d,"system_id":%s,"retrieved_at":%s}' % (
+        len(rows), orjson.dumps(system_id), orjson.dumps(retrieved_at)
+    )
 
 
 class CommandCompletionRequest(BaseModel):
@@ -46,7 +83,179 @@ class CommandFailureRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
-@router.get("/{system_id}", response_model=Dict[str, Any])
+class _json_merge(FunctionElement):
+    """Set top-level keys of a JSON column, replacing each value whole
+
+    Called as _json_merge(column, *_json_items(values)). Unlike an RFC 7396
+    merge patch, null values are stored and nested objects are not merged,
+    so SQLite and PostgreSQL store the same document.
+    """
+    type = JSON()
+    inherit_cache = True
+
+
+@compiles(_json_merge)
+def _compile_json_merge(element, compiler, **kw):
+    column, *items = (compiler.process(clause, **kw) for clause in element.clauses)
+    assignments = ", ".join(
+        "'$.\"' || %s || '\"', json(%s)" % (key, value) for key, value in zip(items[::2], items[1::2])
+    )
+    return "json_set(coalesce(%s, '{}'), %s)" % (column, assignments)
+
+
+@compiles(_json_merge, "postgresql")
+def _compile_json_merge_pg(element, compiler, **kw):
+    column, *items = (compiler.process(clause, **kw) for clause in element.clauses)
+    pairs = ", ".join("%s::text, %s::jsonb" % (key, value) for key, value in zip(items[::2], items[1::2]))
+    return "(coalesce(%s::jsonb, '{}'::jsonb) || jsonb_build_object(%s))::json" % (column, pairs)
+
+
+class _json_increment(FunctionElement):
+    """Set a counter key on a JSON document to the stored counter plus one
+
+    Takes the document to write, the stored column the old count is read
+    from, and the key, so a merged document is rendered only once.
+    """
+    type = JSON()
+    inherit_cache = True
+
+
+@compiles(_json_increment)
+def _compile_json_increment(element, compiler, **kw):
+    document, source, key = (compiler.process(clause, **kw) for clause in element.clauses)
+    return "json_set(coalesce(%s, '{}'), '$.' || %s, coalesce(json_extract(%s, '$.' || %s), 0) + 1)" % (
+        document, key, source, key
+    )
+
+
+@compiles(_json_increment, "postgresql")
+def _compile_json_increment_pg(element, compiler, **kw):
+    document, source, key = (compiler.process(clause, **kw) for clause in element.clauses)
+    return (
+        "jsonb_set(coalesce(%s::jsonb, '{}'::jsonb), ARRAY[%s], "
+        "to_jsonb(coalesce((%s::jsonb ->> %s)::int, 0) + 1))::json" % (document, key, source, key)
+    )
+
+
+class _minutes_ago(FunctionElement):
+    """Database clock minus a number of minutes"""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_minutes_ago)
+def _compile_minutes_ago(element, compiler, **kw):
+    minutes, = list(element.clauses)
+    return "datetime('now', '-' || %s || ' minutes')" % compiler.process(minutes, **kw)
+
+
+@compiles(_minutes_ago, "postgresql")
+def _compile_minutes_ago_pg(element, compiler, **kw):
+    minutes, = list(element.clauses)
+    return "(now() at time zone 'utc') - make_interval(mins => %s)" % compiler.process(minutes, **kw)
+
+
+def _json_items(values: Dict[str, Any]) -> List[Any]:
+    """Bind a dict as alternating key / JSON text literals for _json_merge"""
+    items = []
+    for key, value in values.items():
+        items += [literal(key), literal(orjson.dumps(value).decode())]
+    return items
+
+
+# Hot statements are built once; handlers only bind parameters
+_CLAIM_COMMANDS = (
+    update(ExternalCommandDB)
+    .where(ExternalCommandDB.id.in_(
+        select(ExternalCommandDB.id)
+        .where(
+            (ExternalCommandDB.target_system == bindparam("system_id")) &
+            or_(
+                ExternalCommandDB.status == CommandStatus.PENDING.value,
+                # PROCESSING commands past the threshold are reclaimed as if pending;
+                # the threshold uses the database clock, the same one that stamps processed_at
+                (ExternalCommandDB.status == CommandStatus.PROCESSING.value) &
+                (ExternalCommandDB.processed_at < _minutes_ago(literal(STALE_COMMAND_MINUTES)))
+            )
+        )
+        .order_by(ExternalCommandDB.created_at)
+        .limit(bindparam("limit", type_=Integer))
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    ))
+    .values(
+        status=CommandStatus.PROCESSING.value,
+        processed_at=func.now()
+    )
+    .returning(
+        ExternalCommandDB.id,
+        ExternalCommandDB.target_system,
+        ExternalCommandDB.command,
+        ExternalCommandDB.parameters,
+        ExternalCommandDB.status,
+        ExternalCommandDB.created_at,
+        ExternalCommandDB.processed_at
+    )
+    .execution_options(synchronize_session=False)
+)
+
+_SELECT_STATUS_BY_ID = select(ExternalCommandDB.status).where(ExternalCommandDB.id == bindparam("command_id"))
+
+_DELETE_BY_ID = (
+    delete(ExternalCommandDB)
+    .where(ExternalCommandDB.id == bindparam("command_id"))
+    .returning(ExternalCommandDB.id)
+    .execution_options(synchronize_session=False)
+)
+
+# One row per status; MIN(created_at) of the pending group is the oldest pending command
+_COUNT_BY_STATUS = (
+    select(
+        ExternalCommandDB.status,
+        func.count(ExternalCommandDB.id).label('count'),
+        func.min(ExternalCommandDB.created_at).label('oldest_created_at')
+    )
+    .where(ExternalCommandDB.target_system == bindparam("system_id"))
+    .group_by(ExternalCommandDB.status)
+)
+
+
+async def _transition_processing_command(session, command_id: str, values: Dict[str, Any]) -> str:
+    """Atomically move a PROCESSING command to a new state, returning the new status
+
+    Raises 404 when the command does not exist and 400 when it is not PROCESSING.
+    """
+    transition = (
+        update(ExternalCommandDB)
+        .where(
+            (ExternalCommandDB.id == command_id) &
+            (ExternalCommandDB.status == CommandStatus.PROCESSING.value)
+        )
+        .values(**values)
+        .returning(ExternalCommandDB.status)
+        .execution_options(synchronize_session=False)
+    )
+    new_status = (await session.execute(transition)).scalar_one_or_none()
+    if new_status is not None:
+        return new_status
+
+    # Only the failure path pays for a second query to pick the right error
+    current_status = (await session.execute(
+        _SELECT_STATUS_BY_ID, {"command_id": command_id}
+    )).scalar_one_or_none()
+
+    if current_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Command {command_id} not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Command {command_id} is not in PROCESSING state (current: {current_status})"
+    )
+
+
+@router.get("/{system_id}", response_model=PendingCommandsResponse)
 @deprecate_parameter(
     "limit",
     level=DeprecationLevel.WARNING,
@@ -59,75 +268,23 @@ async def get_pending_commands(
     authenticated: bool = Depends(verify_api_key),
     limit: int = 10
 ):
-    """Poll commands for a target system and reset stale PROCESSING items"""
+    """Poll commands for a target system and reclaim stale PROCESSING items"""
     try:
         async with db_service.get_session() as session:
-            # First, reset stale PROCESSING commands (older than 10 minutes)
-            stale_threshold = datetime.utcnow() - timedelta(minutes=10)
-
-            stale_update = (
-                update(ExternalCommandDB)
-                .where(
-                    (ExternalCommandDB.system_id == system_id) &
-                    (ExternalCommandDB.status == CommandStatus.PROCESSING) &
-                    (ExternalCommandDB.updated_at < stale_threshold)
-                )
-                .values(
-                    status=CommandStatus.PENDING,
-                    updated_at=datetime.utcnow()
-                )
-            )
-            await session.execute(stale_update)
-
-            # Get pending commands for the system
-            query = (
-                select(ExternalCommandDB)
-                .where(
-                    (ExternalCommandDB.system_id == system_id) &
-                    (ExternalCommandDB.status == CommandStatus.PENDING)
-                )
-                .order_by(ExternalCommandDB.created_at)
-                .limit(limit)
-            )
-
-            result = await session.execute(query)
-            commands_db = result.scalars().all()
+            now = datetime.utcnow()
 
-            # Mark retrieved commands as PROCESSING
-            if commands_db:
-                command_ids = [cmd.id for cmd in commands_db]
+            # Reset, fetch and claim in one round trip
+            result = await session.execute(_CLAIM_COMMANDS, {"system_id": system_id, "limit": limit})
 
-                processing_update = (
-                    update(ExternalCommandDB)
-                    .where(ExternalCommandDB.id.in_(command_ids))
-                    .values(
-                        status=CommandStatus.PROCESSING,
-                        updated_at=datetime.utcnow()
-                    )
-                )
-                await session.execute(processing_update)
-                await session.commit()
-
-            # Convert to response format
-            commands = [
-                CommandResponseLocal(
-                    id=cmd.id,
-                    system_id=cmd.system_id,
-                    command_type=cmd.command_type,
-                    payload=cmd.payload,
-                    status=CommandStatus.PROCESSING.value,  # They're now processing
-                    created_at=cmd.created_at,
-                    updated_at=datetime.utcnow()
-                )
-                for cmd in commands_db
-            ]
+            # Plain column rows: no ORM identity map or instrumented entities
+            rows = sorted(result.mappings().all(), key=lambda row: (row["created_at"], row["id"]))
+            await session.commit()
 
-            return {
-                "commands": commands,
-                "count": len(commands),
-                "system_id": system_id,
-                "retrieved_at": datetime.utcnow()
-            }
+            # Stream the document so large polls never hold every encoded command at once
+            return StreamingResponse(
+                _iter_pending_commands(rows, system_id, now),
+                media_type="application/json"
+            )
 
     except Exception as e:
         logger.error(f"Error retrieving commands for system {system_id}: {e}")
@@ -146,41 +303,19 @@ async def complete_command(
     """Mark a command as completed"""
     try:
         async with db_service.get_session() as session:
-            # Find the command
-            query = select(ExternalCommandDB).where(ExternalCommandDB.id == command_id)
-            result = await session.execute(query)
-            command_db = result.scalar_one_or_none()
-
-            if not command_db:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Command {command_id} not found"
-                )
-
-            # Verify command is in PROCESSING state
-            if command_db.status != CommandStatus.PROCESSING:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Command {command_id} is not in PROCESSING state (current: {command_db.status.value})"
-                )
-
-            # Update command status
-            command_db.status = CommandStatus.COMPLETED
-            command_db.updated_at = datetime.utcnow()
-            command_db.completed_at = datetime.utcnow()
-
-            # Store completion result if provided
+            # Completion result and extra metadata are merged into the result column
+            patch = dict(completion_data.metadata or {})
             if completion_data.result:
-                if not command_db.metadata:
-                    command_db.metadata = {}
-                command_db.metadata["completion_result"] = completion_data.result
+                patch["completion_result"] = completion_data.result
 
-            # Store additional metadata if provided
-            if completion_data.metadata:
-                if not command_db.metadata:
-                    command_db.metadata = {}
-                command_db.metadata.update(completion_data.metadata)
+            values = {
+                "status": CommandStatus.COMPLETED.value,
+                "completed_at": func.now()
+            }
+            if patch:
+                values["result"] = _json_merge(ExternalCommandDB.result, *_json_items(patch))
 
+            new_status = await _transition_processing_command(session, command_id, values)
             await session.commit()
 
             logger.info(f"Command {command_id} marked as completed")
@@ -189,7 +324,7 @@ async def complete_command(
                 success=True,
                 message=f"Command {command_id} completed successfully",
                 command_id=command_id,
-                new_status="COMPLETED"
+                new_status=new_status.upper()
             )
 
     except HTTPException:
@@ -211,62 +346,42 @@ async def fail_command(
     """Report command failure with error details"""
     try:
         async with db_service.get_session() as session:
-            # Find the command
-            query = select(ExternalCommandDB).where(ExternalCommandDB.id == command_id)
-            result = await session.execute(query)
-            command_db = result.scalar_one_or_none()
-
-            if not command_db:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Command {command_id} not found"
-                )
-
-            # Verify command is in PROCESSING state
-            if command_db.status != CommandStatus.PROCESSING:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Command {command_id} is not in PROCESSING state (current: {command_db.status.value})"
-                )
-
             # Determine new status based on retry flag
-            if failure_data.retry:
-                command_db.status = CommandStatus.PENDING
-                logger.info(f"Command {command_id} failed but will be retried")
-            else:
-                command_db.status = CommandStatus.FAILED
-                logger.warning(f"Command {command_id} failed permanently")
+            new_status = CommandStatus.PENDING if failure_data.retry else CommandStatus.FAILED
 
-            command_db.updated_at = datetime.utcnow()
-
-            # Store error information
-            if not command_db.metadata:
-                command_db.metadata = {}
-
-            command_db.metadata["error"] = {
+            # Store error information alongside any additional metadata
+            patch = dict(failure_data.metadata or {})
+            patch["error"] = {
                 "message": failure_data.error_message,
                 "code": failure_data.error_code,
                 "timestamp": datetime.utcnow().isoformat(),
                 "retry_requested": failure_data.retry
             }
-
-            # Store additional metadata if provided
-            if failure_data.metadata:
-                command_db.metadata.update(failure_data.metadata)
+            result_value = _json_merge(ExternalCommandDB.result, *_json_items(patch))
 
             # Increment retry count if retrying
             if failure_data.retry:
-                if "retry_count" not in command_db.metadata:
-                    command_db.metadata["retry_count"] = 0
-                command_db.metadata["retry_count"] += 1
+                result_value = _json_increment(
+                    result_value, ExternalCommandDB.result, literal_column("'retry_count'")
+                )
 
+            new_status = await _transition_processing_command(session, command_id, {
+                "status": new_status.value,
+                "error_message": failure_data.error_message,
+                "result": result_value
+            })
             await session.commit()
 
+            if failure_data.retry:
+                logger.info(f"Command {command_id} failed but will be retried")
+            else:
+                logger.warning(f"Command {command_id} failed permanently")
+
             return CommandOperationResponse(
                 success=True,
                 message=f"Command {command_id} failure recorded",
                 command_id=command_id,
-                new_status=command_db.status.value
+                new_status=new_status
             )
 
     except HTTPException:
@@ -287,31 +402,12 @@ async def get_command_status(
     """Get command queue status for a specific system"""
     try:
         async with db_service.get_session() as session:
-            # Count commands by status
-            from sqlalchemy import func
-
-            query = (
-                select(
-                    ExternalCommandDB.status,
-                    func.count(ExternalCommandDB.id).label('count')
-                )
-                .where(ExternalCommandDB.system_id == system_id)
-                .group_by(ExternalCommandDB.status)
-            )
-
-            result = await session.execute(query)
-            status_counts = {row.status.value: row.count for row in result}
-
-            # Get oldest pending command timestamp
-            oldest_pending_query = (
-                select(func.min(ExternalCommandDB.created_at))
-                .where(
-                    (ExternalCommandDB.system_id == system_id) &
-                    (ExternalCommandDB.status == CommandStatus.PENDING)
-                )
+            # Count commands by status and find the oldest pending one in one query
+            rows = (await session.execute(_COUNT_BY_STATUS, {"system_id": system_id})).all()
+            status_counts = {row.status: row.count for row in rows}
+            oldest_pending = next(
+                (row.oldest_created_at for row in rows if row.status == CommandStatus.PENDING.value), None
             )
-            oldest_pending_result = await session.execute(oldest_pending_query)
-            oldest_pending = oldest_pending_result.scalar()
 
             return {
                 "system_id": system_id,
@@ -337,19 +433,15 @@ async def delete_command(
     """Delete a command from the queue (admin operation)"""
     try:
         async with db_service.get_session() as session:
-            # Find the command
-            query = select(ExternalCommandDB).where(ExternalCommandDB.id == command_id)
-            result = await session.execute(query)
-            command_db = result.scalar_one_or_none()
+            # Delete in one statement; no returned id means the command did not exist
+            result = await session.execute(_DELETE_BY_ID, {"command_id": command_id})
 
-            if not command_db:
+            if result.scalar_one_or_none() is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Command {command_id} not found"
                 )
 
-            # Delete the command
-            await session.delete(command_db)
             await session.commit()
 
             logger.info(f"Command {command_id} deleted by admin")
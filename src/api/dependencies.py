@@ -3,13 +3,18 @@ API Dependencies for FastAPI Router Modules
 Shared dependencies for authentication, scheduling, database access
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing import Iterable, Optional
+import hashlib
+import hmac
 import logging
 
+from src.api.error_handling import http_exception_handler
 from src.core.scheduler import ChronosScheduler
-from src.core.database import db_service
+# Re-exported so every router shares the one session dependency (and override key)
+from src.core.database import get_db_session  # noqa: F401
 
 # Initialize security scheme
 security = HTTPBearer(auto_error=False)
@@ -20,74 +25,118 @@ class APIAuthenticator:
     """Centralized API authentication handler"""
 
     def __init__(self, api_key: str):
-        self.api_key = api_key
+        # Only the digest is kept; fixed-length digests also hide the key length
+        self._api_key_digest = hashlib.sha256(api_key.encode("utf-8")).digest()
 
     def verify_api_key(self, credentials: Optional[HTTPAuthorizationCredentials] = None) -> bool:
         """Verify API key from authorization header"""
         if not credentials:
             return False
 
-        if credentials.credentials != self.api_key:
-            return False
+        # Constant-time comparison so response timing does not leak the key
+        provided = hashlib.sha256(credentials.credentials.encode("utf-8", "ignore")).digest()
+        return hmac.compare_digest(provided, self._api_key_digest)
 
-        return True
+    def verify_authorization_header(self, header: Optional[str]) -> bool:
+        """Verify a raw ``Authorization: Bearer <key>`` header value"""
+        if not header:
+            return False
+        scheme, _, token = header.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        return self.verify_api_key(HTTPAuthorizationCredentials(scheme=scheme, credentials=token))
 
-    def raise_unauthorized(self):
-        """Raise unauthorized error"""
-        raise HTTPException(
+    def unauthorized(self) -> HTTPException:
+        """Build the unauthorized error"""
+        return HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-
-# Global authenticator instance (will be set during app initialization)
-_authenticator: Optional[APIAuthenticator] = None
-_scheduler_instance: Optional[ChronosScheduler] = None
-
-
-def init_api_dependencies(api_key: str, scheduler_instance: ChronosScheduler = None):
-    """Initialize API dependencies with configuration"""
-    global _authenticator, _scheduler_instance
-    _authenticator = APIAuthenticator(api_key)
+    def raise_unauthorized(self):
+        """Raise unauthorized error"""
+        raise self.unauthorized()
+
+
+class APIKeyMiddleware:
+    """Reject unauthenticated API calls before routing and dependency resolution
+
+    Requests under ``prefix`` must carry a valid bearer key; CORS preflights and
+    ``exempt_paths`` pass through. Verified requests are flagged on the request
+    state so ``verify_api_key`` does not hash the key a second time.
+    """
+
+    def __init__(self, app: ASGIApp, prefix: str = "/api/v1/", exempt_paths: Iterable[str] = ()):
+        self.app = app
+        self.prefix = prefix
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not scope["path"].startswith(self.prefix)
+            or scope["path"] in self.exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        authenticator: Optional[APIAuthenticator] = getattr(request.app.state, "authenticator", None)
+        if authenticator and not authenticator.verify_authorization_header(request.headers.get("authorization")):
+            exc = authenticator.unauthorized()
+            response = await http_exception_handler(request, exc)
+            response.headers.update(exc.headers)
+            await response(scope, receive, send)
+            return
+
+        if authenticator:
+            scope.setdefault("state", {})["api_key_verified"] = True
+        await self.app(scope, receive, send)
+
+
+def init_api_dependencies(app: FastAPI, api_key: str, scheduler_instance: ChronosScheduler = None):
+    """Initialize API dependencies on the application state"""
+    app.state.authenticator = APIAuthenticator(api_key)
     if scheduler_instance:
-        _scheduler_instance = scheduler_instance
-        logger.info(f"Dependencies module received scheduler: {_scheduler_instance} (type: {type(_scheduler_instance)})")
+        app.state.scheduler = scheduler_instance
+        logger.debug("Dependencies received scheduler: %r", scheduler_instance)
+    else:
+        logger.error("No scheduler passed to init_api_dependencies - scheduler routes will fail")
 
 
-async def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)) -> bool:
+async def verify_api_key(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> bool:
     """FastAPI dependency for API key verification"""
-    if not _authenticator:
+    authenticator: Optional[APIAuthenticator] = getattr(request.app.state, "authenticator", None)
+    if not authenticator:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="API authentication not initialized"
         )
 
+    if getattr(request.state, "api_key_verified", False):
+        return True
+
     if not credentials:
-        _authenticator.raise_unauthorized()
+        authenticator.raise_unauthorized()
 
-    if not _authenticator.verify_api_key(credentials):
-        _authenticator.raise_unauthorized()
+    if not authenticator.verify_api_key(credentials):
+        authenticator.raise_unauthorized()
 
     return True
 
 
-async def get_scheduler() -> ChronosScheduler:
+async def get_scheduler(request: Request) -> ChronosScheduler:
     """FastAPI dependency to get scheduler instance"""
-    global _scheduler_instance
-
-    if _scheduler_instance is None:
-        logger.error("Scheduler instance not initialized in dependencies - please check init_api_dependencies")
-        raise RuntimeError("Scheduler instance not available - please check initialization")
-
-    logger.info(f"get_scheduler() returning: {_scheduler_instance} (type: {type(_scheduler_instance)})")
-    return _scheduler_instance
-
-
-async def get_db_session():
-    """FastAPI dependency to get database session"""
-    async with db_service.get_session() as session:
-        yield session
+    # The happy path is a single attribute read; a missing scheduler is a startup error
+    try:
+        return request.app.state.scheduler
+    except AttributeError:
+        raise RuntimeError("Scheduler instance not available - please check initialization") from None
 
 
 # Future: Scope-based authentication dependency
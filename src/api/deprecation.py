@@ -3,16 +3,21 @@ API Deprecation Management System
 Provides warnings and tracking for deprecated API features
 """
 
+import inspect
 import logging
+import sys
+import time
 import warnings
-from datetime import datetime, timedelta
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, Optional, List, Set
-from functools import wraps
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Set, Tuple
+from functools import lru_cache, wraps
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +30,15 @@ class DeprecationLevel(str, Enum):
     SUNSET = "sunset"       # Final warning before removal
 
 
-class DeprecationNotice(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DeprecationNotice:
     """Structured deprecation notice"""
-    feature: str = Field(..., description="The deprecated feature name")
-    level: DeprecationLevel = Field(..., description="Deprecation severity")
-    message: str = Field(..., description="Human-readable deprecation message")
-    alternative: Optional[str] = Field(None, description="Recommended alternative")
-    removal_date: Optional[str] = Field(None, description="Planned removal date (ISO format)")
-    documentation_url: Optional[str] = Field(None, description="Migration guide URL")
+    feature: str                              # The deprecated feature name
+    level: DeprecationLevel                   # Deprecation severity
+    message: str                              # Human-readable deprecation message
+    alternative: Optional[str] = None         # Recommended alternative
+    removal_date: Optional[str] = None        # Planned removal date (ISO format)
+    documentation_url: Optional[str] = None   # Migration guide URL
 
 
 class DeprecationTracker:
@@ -40,9 +46,12 @@ class DeprecationTracker:
 
     def __init__(self):
         self._deprecations: Dict[str, DeprecationNotice] = {}
-        self._usage_stats: Dict[str, int] = {}
-        self._last_warnings: Dict[str, datetime] = {}
-        self._warning_cooldown = timedelta(minutes=5)  # Limit log spam
+        self._usage_stats: Counter = Counter()
+        self._last_warnings: Dict[str, float] = {}  # time.monotonic() of the last warning
+        self._warning_cooldown_s = 300.0  # Limit log spam
+        # Live read-only views handed out to callers instead of per-call copies
+        self._deprecations_view = MappingProxyType(self._deprecations)
+        self._usage_stats_view = MappingProxyType(self._usage_stats)
 
     def register_deprecation(
         self,
@@ -51,9 +60,17 @@ class DeprecationTracker:
         message: str,
         alternative: Optional[str] = None,
         removal_date: Optional[str] = None,
-        documentation_url: Optional[str] = None
+        documentation_url: Optional[str] = None,
+        overwrite: bool = True
     ):
-        """Register a deprecated feature"""
+        """Register a deprecated feature
+
+        With overwrite=False an existing notice for the feature is kept.
+        """
+        # Interned so lookups from decorators and middleware hit by identity
+        feature = sys.intern(feature)
+        if not overwrite and feature in self._deprecations:
+            return
         self._deprecations[feature] = DeprecationNotice(
             feature=feature,
             level=level,
@@ -64,22 +81,40 @@ class DeprecationTracker:
         )
         logger.info(f"Registered deprecation: {feature} ({level.value})")
 
-    def track_usage(self, feature: str, request_details: Optional[Dict[str, Any]] = None):
-        """Track usage of deprecated feature"""
-        if feature not in self._deprecations:
+    def track_usage(
+        self,
+        feature: str,
+        request_details: Optional[Dict[str, Any]] = None,
+        **call_details: Any
+    ):
+        """Track usage of deprecated feature
+
+        ``request_details`` may be a shared per-endpoint mapping; per-call values
+        go in ``call_details`` and are only merged in when a warning is logged.
+        """
+        deprecation = self._deprecations.get(feature)
+        if deprecation is None:
             return
 
-        self._usage_stats[feature] = self._usage_stats.get(feature, 0) + 1
+        self._usage_stats[feature] += 1
 
         # Rate-limited logging to prevent spam
-        now = datetime.utcnow()
-        last_warning = self._last_warnings.get(feature)
-
-        if not last_warning or (now - last_warning) > self._warning_cooldown:
-            deprecation = self._deprecations[feature]
+        now = time.monotonic()
+        if (
+            now - self._last_warnings.get(feature, float("-inf")) > self._warning_cooldown_s
+            and logger.isEnabledFor(logging.WARNING)
+        ):
+            if call_details:
+                request_details = {
+                    **(request_details or {}),
+                    **{
+                        key: value if isinstance(value, str) else str(value)
+                        for key, value in call_details.items()
+                    }
+                }
             logger.warning(
-                f"Deprecated feature used: {feature} ({deprecation.level.value}). "
-                f"{deprecation.message}",
+                "Deprecated feature used: %s (%s). %s",
+                feature, deprecation.level.value, deprecation.message,
                 extra={
                     "deprecated_feature": feature,
                     "deprecation_level": deprecation.level.value,
@@ -93,18 +128,43 @@ class DeprecationTracker:
         """Get deprecation notice for a feature"""
         return self._deprecations.get(feature)
 
-    def get_all_deprecations(self) -> Dict[str, DeprecationNotice]:
-        """Get all registered deprecations"""
-        return self._deprecations.copy()
+    def get_all_deprecations(self) -> Mapping[str, DeprecationNotice]:
+        """Get a read-only view of all registered deprecations"""
+        return self._deprecations_view
 
-    def get_usage_stats(self) -> Dict[str, int]:
-        """Get usage statistics for deprecated features"""
-        return self._usage_stats.copy()
+    def get_usage_stats(self) -> Mapping[str, int]:
+        """Get a read-only view of usage statistics for deprecated features"""
+        return self._usage_stats_view
 
 
 # Global tracker instance
 deprecation_tracker = DeprecationTracker()
 
+# Notices hit while handling the current request, set by the deprecation middleware
+_request_deprecations: ContextVar[Optional[List[DeprecationNotice]]] = ContextVar(
+    "request_deprecations", default=None
+)
+
+
+def _wrap_like(func, before_call):
+    """Wrap func so before_call(kwargs) runs first, keeping func sync or async
+
+    The coroutine check happens once at decoration time; sync handlers stay
+    sync so FastAPI can still run them in its threadpool.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            before_call(kwargs)
+            return await func(*args, **kwargs)
+        return async_wrapper
+
+    @wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        before_call(kwargs)
+        return func(*args, **kwargs)
+    return sync_wrapper
+
 
 def deprecate_parameter(
     parameter: str,
@@ -114,33 +174,31 @@ def deprecate_parameter(
     removal_date: Optional[str] = None
 ):
     """Decorator to mark API parameters as deprecated"""
+    feature_name = sys.intern(f"parameter:{parameter}")
+    default_message = message or f"Parameter '{parameter}' is deprecated"
 
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
+        # Registered once here so calls only need to record usage; a notice
+        # registered earlier (e.g. a legacy one with docs) takes precedence
+        deprecation_tracker.register_deprecation(
+            feature=feature_name,
+            level=level,
+            message=default_message,
+            alternative=alternative,
+            removal_date=removal_date,
+            overwrite=False
+        )
+
+        details = {"function": func.__name__, "parameter": parameter}
+
+        def before_call(kwargs):
             # Check if deprecated parameter is being used
-            if parameter in kwargs and kwargs[parameter] is not None:
-                feature_name = f"parameter:{parameter}"
-
-                # Register deprecation if not already registered
-                if feature_name not in deprecation_tracker._deprecations:
-                    default_message = message or f"Parameter '{parameter}' is deprecated"
-                    deprecation_tracker.register_deprecation(
-                        feature=feature_name,
-                        level=level,
-                        message=default_message,
-                        alternative=alternative,
-                        removal_date=removal_date
-                    )
-
-                # Track usage
-                deprecation_tracker.track_usage(
-                    feature_name,
-                    {"function": func.__name__, "parameter": parameter, "value": str(kwargs[parameter])}
-                )
+            value = kwargs.get(parameter)
+            if value is not None:
+                deprecation_tracker.track_usage(feature_name, details, value=value)
+                record_deprecation(feature_name)
 
-            return await func(*args, **kwargs)
-        return wrapper
+        return _wrap_like(func, before_call)
     return decorator
 
 
@@ -152,34 +210,58 @@ def deprecate_endpoint(
     removal_date: Optional[str] = None
 ):
     """Decorator to mark entire API endpoints as deprecated"""
+    feature_name = sys.intern(f"endpoint:{endpoint}")
+    default_message = message or f"Endpoint '{endpoint}' is deprecated"
 
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            feature_name = f"endpoint:{endpoint}"
-
-            # Register deprecation if not already registered
-            if feature_name not in deprecation_tracker._deprecations:
-                default_message = message or f"Endpoint '{endpoint}' is deprecated"
-                deprecation_tracker.register_deprecation(
-                    feature=feature_name,
-                    level=level,
-                    message=default_message,
-                    alternative=alternative,
-                    removal_date=removal_date
-                )
-
-            # Track usage
-            deprecation_tracker.track_usage(
-                feature_name,
-                {"function": func.__name__, "endpoint": endpoint}
-            )
+        # Registered once here so calls only need to record usage; a notice
+        # registered earlier (e.g. a legacy one with docs) takes precedence
+        deprecation_tracker.register_deprecation(
+            feature=feature_name,
+            level=level,
+            message=default_message,
+            alternative=alternative,
+            removal_date=removal_date,
+            overwrite=False
+        )
 
-            return await func(*args, **kwargs)
-        return wrapper
+        details = {"function": func.__name__, "endpoint": endpoint}
+
+        def before_call(kwargs):
+            deprecation_tracker.track_usage(feature_name, details)
+            record_deprecation(feature_name)
+
+        return _wrap_like(func, before_call)
     return decorator
 
 
+# Header name templates, pre-encoded; Starlette stores headers as lowercase bytes
+_HEADER_NAME_TEMPLATES = (
+    ("feature", b"x-api-deprecation-%d-feature"),
+    ("level", b"x-api-deprecation-%d-level"),
+    ("message", b"x-api-deprecation-%d-message"),
+    ("alternative", b"x-api-deprecation-%d-alternative"),
+    ("removal_date", b"x-api-deprecation-%d-removal-date"),
+)
+
+
+@lru_cache(maxsize=256)
+def _deprecation_headers(index: int, notice: DeprecationNotice) -> Tuple[Tuple[bytes, bytes], ...]:
+    """Raw header block for the index-th deprecation; built once per notice and position"""
+    values = {
+        "feature": notice.feature,
+        "level": notice.level.value,
+        "message": notice.message,
+        "alternative": notice.alternative,
+        "removal_date": notice.removal_date,
+    }
+    return tuple(
+        (template % index, values[field].encode("latin-1"))
+        for field, template in _HEADER_NAME_TEMPLATES
+        if values[field]
+    )
+
+
 def add_deprecation_headers(response: Response, deprecations: List[DeprecationNotice]):
     """Add deprecation headers to API response"""
     if not deprecations:
@@ -188,32 +270,42 @@ def add_deprecation_headers(response: Response, deprecations: List[DeprecationNo
     # Add standard deprecation header
     response.headers["Deprecation"] = "true"
 
-    # Add custom headers with deprecation details
-    for i, dep in enumerate(deprecations):
-        prefix = f"X-API-Deprecation-{i + 1}"
-        response.headers[f"{prefix}-Feature"] = dep.feature
-        response.headers[f"{prefix}-Level"] = dep.level.value
-        response.headers[f"{prefix}-Message"] = dep.message
+    # Add custom headers with deprecation details; the names are unique per
+    # index, so they go straight onto the raw list without a replace scan
+    raw_headers = response.raw_headers
+    for i, dep in enumerate(deprecations, start=1):
+        raw_headers.extend(_deprecation_headers(i, dep))
+
 
-        if dep.alternative:
-            response.headers[f"{prefix}-Alternative"] = dep.alternative
-        if dep.removal_date:
-            response.headers[f"{prefix}-Removal-Date"] = dep.removal_date
+def record_deprecation(feature: str):
+    """Record a deprecation for the current request's response headers
+
+    A no-op outside the deprecation middleware.
+    """
+    recorded = _request_deprecations.get()
+    if recorded is not None:
+        notice = deprecation_tracker.get_deprecation_notice(feature)
+        if notice is not None and notice not in recorded:
+            recorded.append(notice)
 
 
 def create_deprecation_middleware():
     """Create middleware to automatically add deprecation headers"""
 
     async def deprecation_middleware(request: Request, call_next):
-        # Store deprecations found during request processing
-        request.state.deprecations = []
-
-        # Process request
-        response = await call_next(request)
+        # The list is created here rather than by handlers: values set() inside
+        # call_next's task or the sync threadpool do not propagate back out
+        token = _request_deprecations.set([])
+        try:
+            # Process request
+            response = await call_next(request)
+            recorded = _request_deprecations.get()
+        finally:
+            _request_deprecations.reset(token)
 
         # Add deprecation headers if any were tracked
-        if hasattr(request.state, 'deprecations') and request.state.deprecations:
-            add_deprecation_headers(response, request.state.deprecations)
+        if recorded:
+            add_deprecation_headers(response, recorded)
 
         return response
 
@@ -6,10 +6,12 @@ Handles email template and category management for admin interface
 import logging
 from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy import and_, or_, func, select, update, delete
-from sqlalchemy.orm import Session, selectinload
+from pydantic import TypeAdapter
+from sqlalchemy import and_, case, func, insert, select, tuple_, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
 
 from src.core.database import db_service, get_db_session
 from src.core.models import (
@@ -24,66 +26,108 @@ from src.api.schemas import (
 )
 from src.api.dependencies import verify_api_key
 from src.api.error_handling import handle_api_errors
+from src.api.pagination import VersionedTTLCache, decode_cursor, encode_cursor, substring_search_filter
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin/email-templates", tags=["email-templates"])
 
+# Dashboard stats are served from memory for this long; writes through this
+# router invalidate them so they show up immediately
+STATS_CACHE_TTL_SECONDS = 15
+
+_stats_cache = VersionedTTLCache(STATS_CACHE_TTL_SECONDS)
+
+
+_TEMPLATES_LIST_ADAPTER = TypeAdapter(EmailTemplatesListResponse)
+
+# Columns backing EmailTemplateListItemResponse
+_LIST_COLUMNS = (
+    EmailTemplateDB.id, EmailTemplateDB.name, EmailTemplateDB.description, EmailTemplateDB.subject,
+    EmailTemplateDB.category_id, EmailTemplateDB.is_active, EmailTemplateDB.usage_count,
+    EmailTemplateDB.open_rate, EmailTemplateDB.click_rate, EmailTemplateDB.variables,
+    EmailTemplateDB.created_at, EmailTemplateDB.updated_at
+)
+
+# Dashboard stats in a single round trip; the other tables' counts ride along
+# as scalar subqueries and the averages only consider templates that were used
+_TEMPLATE_STATS = select(
+    func.count(EmailTemplateDB.id).label("total_templates"),
+    func.coalesce(func.sum(case((EmailTemplateDB.is_active == True, 1), else_=0)), 0).label("active_templates"),
+    select(func.count()).select_from(EmailTemplateCategoryDB).scalar_subquery().label("total_categories"),
+    select(func.count()).select_from(SentEmailDB).scalar_subquery().label("total_sent"),
+    func.avg(case((EmailTemplateDB.usage_count > 0, EmailTemplateDB.open_rate))).label("avg_open_rate"),
+    func.avg(case((EmailTemplateDB.usage_count > 0, EmailTemplateDB.click_rate))).label("avg_click_rate"),
+).select_from(EmailTemplateDB)
+
+
+# Templates are counted once per category_id (served by its index) and the
+# small per-category result is joined on, instead of grouping the full join
+_TEMPLATE_COUNTS = (
+    select(EmailTemplateDB.category_id, func.count(EmailTemplateDB.id).label("template_count"))
+    .group_by(EmailTemplateDB.category_id)
+    .subquery()
+)
+_CATEGORIES_WITH_COUNTS = select(
+    EmailTemplateCategoryDB,
+    func.coalesce(_TEMPLATE_COUNTS.c.template_count, 0).label("template_count")
+).outerjoin(_TEMPLATE_COUNTS, EmailTemplateCategoryDB.id == _TEMPLATE_COUNTS.c.category_id)
+
+
+def _search_filter(dialect_name: str, q: str):
+    """Case-insensitive substring match on name, description and subject"""
+    return substring_search_filter(
+        dialect_name, q, "email_templates_fts", EmailTemplateDB.id,
+        (EmailTemplateDB.name, EmailTemplateDB.description, EmailTemplateDB.subject)
+    )
+
+
+async def _get_template(session, template_id: int) -> Optional[EmailTemplateDB]:
+    """Load a template together with its category in a single query
+
+    Any other relationship access raises instead of lazy-loading mid-request.
+    """
+    result = await session.execute(
+        select(EmailTemplateDB)
+        .options(joinedload(EmailTemplateDB.category), raiseload("*"))
+        .where(EmailTemplateDB.id == template_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _category_exists(session, category_id: int) -> bool:
+    """Check a category id without loading the ORM row"""
+    result = await session.execute(
+        select(EmailTemplateCategoryDB.id).where(EmailTemplateCategoryDB.id == category_id)
+    )
+    return result.scalar_one_or_none() is not None
+
 
 @router.get("/stats", response_model=EmailTemplateStatsResponse)
 async def get_email_template_stats(
     authenticated: bool = Depends(verify_api_key)
 ):
     """Get email template statistics for dashboard"""
+    cached = _stats_cache.get()
+    if cached is not None:
+        return cached
+
+    version = _stats_cache.version
     try:
         async with db_service.get_session() as session:
-            # Count templates
-            total_templates_result = await session.execute(
-                select(func.count()).select_from(EmailTemplateDB)
-            )
-            total_templates = total_templates_result.scalar()
-
-            # Count active templates
-            active_templates_result = await session.execute(
-                select(func.count()).select_from(EmailTemplateDB).where(
-                    EmailTemplateDB.is_active == True
-                )
-            )
-            active_templates = active_templates_result.scalar()
-
-            # Count categories
-            total_categories_result = await session.execute(
-                select(func.count()).select_from(EmailTemplateCategoryDB)
-            )
-            total_categories = total_categories_result.scalar()
-
-            # Count sent emails
-            total_sent_result = await session.execute(
-                select(func.count()).select_from(SentEmailDB)
-            )
-            total_sent = total_sent_result.scalar()
-
-            # Calculate average rates
-            avg_rates_result = await session.execute(
-                select(
-                    func.avg(EmailTemplateDB.open_rate),
-                    func.avg(EmailTemplateDB.click_rate)
-                ).select_from(EmailTemplateDB).where(
-                    EmailTemplateDB.usage_count > 0
-                )
-            )
-            avg_rates = avg_rates_result.first()
-            avg_open_rate = avg_rates[0] if avg_rates[0] else 0.0
-            avg_click_rate = avg_rates[1] if avg_rates[1] else 0.0
-
-            return EmailTemplateStatsResponse(
-                total_templates=total_templates,
-                active_templates=active_templates,
-                total_categories=total_categories,
-                total_sent=total_sent,
-                avg_open_rate=avg_open_rate,
-                avg_click_rate=avg_click_rate
+            row = (await session.execute(_TEMPLATE_STATS)).one()
+
+            stats = EmailTemplateStatsResponse(
+                total_templates=row.total_templates,
+                active_templates=row.active_templates,
+                total_categories=row.total_categories,
+                total_sent=row.total_sent,
+                avg_open_rate=row.avg_open_rate or 0.0,
+                avg_click_rate=row.avg_click_rate or 0.0
             )
+            _stats_cache.put(stats, version)
+            return stats
 
     except Exception as e:
         logger.error(f"Error getting email template stats: {e}")
@@ -102,12 +146,7 @@ async def list_categories(
     try:
         async with db_service.get_session() as session:
             # Get categories with template counts
-            query = select(
-                EmailTemplateCategoryDB,
-                func.count(EmailTemplateDB.id).label('template_count')
-            ).outerjoin(EmailTemplateDB).group_by(EmailTemplateCategoryDB.id)
-
-            result = await session.execute(query)
+            result = await session.execute(_CATEGORIES_WITH_COUNTS)
             categories_data = result.all()
 
             categories = []
@@ -143,18 +182,6 @@ async def create_category(
     """Create a new email template category"""
     try:
         async with db_service.get_session() as session:
-            # Check if category with same name exists
-            existing = await session.execute(
-                select(EmailTemplateCategoryDB).where(
-                    EmailTemplateCategoryDB.name == category_data.name
-                )
-            )
-            if existing.scalar():
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Category '{category_data.name}' already exists"
-                )
-
             # Create category
             category = EmailTemplateCategory(
                 name=category_data.name,
@@ -164,8 +191,15 @@ async def create_category(
 
             db_category = category.to_db_model()
             session.add(db_category)
-            await session.commit()
-            await session.refresh(db_category)
+            try:
+                await session.commit()
+            except IntegrityError:
+                # name is UNIQUE, so the insert itself is the existence check
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Category '{category_data.name}' already exists"
+                ) from None
+            _stats_cache.invalidate()
 
             return EmailTemplateCategoryResponse(
                 id=db_category.id,
@@ -195,79 +229,71 @@ async def list_templates(
     category_id: Optional[int] = Query(None, description="Filter by category"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=1000, description="Items per page")
+    page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; takes precedence over page")
 ):
     """List email templates with filtering and pagination"""
+    after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
     try:
         async with db_service.get_session() as session:
-            # Build query with joins
-            query = select(EmailTemplateDB).outerjoin(EmailTemplateCategoryDB)
-
             # Apply filters
+            filters = []
             if q:
-                query = query.where(
-                    or_(
-                        EmailTemplateDB.name.ilike(f"%{q}%"),
-                        EmailTemplateDB.description.ilike(f"%{q}%"),
-                        EmailTemplateDB.subject.ilike(f"%{q}%")
-                    )
-                )
+                filters.append(_search_filter(session.bind.dialect.name, q))
 
             if category_id is not None:
-                query = query.where(EmailTemplateDB.category_id == category_id)
+                filters.append(EmailTemplateDB.category_id == category_id)
 
             if is_active is not None:
-                query = query.where(EmailTemplateDB.is_active == is_active)
+                filters.append(EmailTemplateDB.is_active == is_active)
 
-            # Count total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
+            # Count total straight off the table, no derived table
+            total_result = await session.execute(
+                select(func.count(EmailTemplateDB.id)).where(*filters)
+            )
             total = total_result.scalar()
 
-            # Apply pagination
-            offset = (page - 1) * page_size
-            query = query.offset(offset).limit(page_size)
-            query = query.order_by(EmailTemplateDB.updated_at.desc())
+            page_filters = list(filters)
+            offset = 0
+            if after:
+                page_filters.append(tuple_(EmailTemplateDB.updated_at, EmailTemplateDB.id) < after)
+            else:
+                offset = (page - 1) * page_size
+
+            # Categories come from one batched IN query instead of a lookup per row
+            query = (
+                select(EmailTemplateDB)
+                .where(*page_filters)
+                .options(
+                    # Bodies can be tens of KB each and are only shown by GET /{id}
+                    load_only(*_LIST_COLUMNS, raiseload=True),
+                    selectinload(EmailTemplateDB.category),
+                    raiseload("*")
+                )
+                .order_by(EmailTemplateDB.updated_at.desc(), EmailTemplateDB.id.desc())
+                .offset(offset)
+                # One extra row tells whether another page follows
+                .limit(page_size + 1)
+            )
 
             # Execute query
             result = await session.execute(query)
             db_templates = result.scalars().all()
-
-            # Get category info for each template
-            templates = []
-            for db_template in db_templates:
-                category_name = None
-                category_icon = None
-                if db_template.category_id:
-                    category = await session.get(EmailTemplateCategoryDB, db_template.category_id)
-                    if category:
-                        category_name = category.name
-                        category_icon = category.icon
-
-                templates.append(EmailTemplateResponse(
-                    id=db_template.id,
-                    name=db_template.name,
-                    description=db_template.description,
-                    subject=db_template.subject,
-                    html_content=db_template.html_content,
-                    text_content=db_template.text_content,
-                    category_id=db_template.category_id,
-                    category_name=category_name,
-                    category_icon=category_icon,
-                    is_active=db_template.is_active,
-                    usage_count=db_template.usage_count,
-                    open_rate=db_template.open_rate,
-                    click_rate=db_template.click_rate,
-                    variables=db_template.variables,
-                    created_at=db_template.created_at,
-                    updated_at=db_template.updated_at
-                ))
-
-            return EmailTemplatesListResponse(
-                total=total,
-                page=page,
-                page_size=page_size,
-                templates=templates
+            has_more = len(db_templates) > page_size
+            db_templates = db_templates[:page_size]
+
+            # Validate the ORM rows and encode the page in one pydantic-core pass;
+            # returning a Response skips FastAPI re-validating the response_model
+            page_data = _TEMPLATES_LIST_ADAPTER.validate_python({
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "templates": db_templates,
+                "next_cursor": encode_cursor(db_templates[-1].updated_at, db_templates[-1].id) if has_more else None
+            }, from_attributes=True)
+            return Response(
+                content=_TEMPLATES_LIST_ADAPTER.dump_json(page_data),
+                media_type="application/json"
             )
 
     except Exception as e:
@@ -288,8 +314,7 @@ async def create_template(
         async with db_service.get_session() as session:
             # Verify category exists if provided
             if template_data.category_id:
-                category = await session.get(EmailTemplateCategoryDB, template_data.category_id)
-                if not category:
+                if not await _category_exists(session, template_data.category_id):
                     raise HTTPException(
                         status_code=status.HTTP_404_NOT_FOUND,
                         detail=f"Category {template_data.category_id} not found"
@@ -310,35 +335,10 @@ async def create_template(
             db_template = template.to_db_model()
             session.add(db_template)
             await session.commit()
-            await session.refresh(db_template)
-
-            # Get category info
-            category_name = None
-            category_icon = None
-            if db_template.category_id:
-                category = await session.get(EmailTemplateCategoryDB, db_template.category_id)
-                if category:
-                    category_name = category.name
-                    category_icon = category.icon
-
-            return EmailTemplateResponse(
-                id=db_template.id,
-                name=db_template.name,
-                description=db_template.description,
-                subject=db_template.subject,
-                html_content=db_template.html_content,
-                text_content=db_template.text_content,
-                category_id=db_template.category_id,
-                category_name=category_name,
-                category_icon=category_icon,
-                is_active=db_template.is_active,
-                usage_count=db_template.usage_count,
-                open_rate=db_template.open_rate,
-                click_rate=db_template.click_rate,
-                variables=db_template.variables,
-                created_at=db_template.created_at,
-                updated_at=db_template.updated_at
-            )
+            _stats_cache.invalidate()
+            db_template = await _get_template(session, db_template.id)
+
+            return EmailTemplateResponse.model_validate(db_template)
 
     except HTTPException:
         raise
@@ -350,6 +350,61 @@ async def create_template(
         )
 
 
+@router.post("/bulk", response_model=List[EmailTemplateResponse], status_code=status.HTTP_201_CREATED)
+async def bulk_create_templates(
+    templates_data: List[EmailTemplateCreate],
+    authenticated: bool = Depends(verify_api_key)
+):
+    """Create several email templates in one INSERT and one commit"""
+    try:
+        async with db_service.get_session() as session:
+            # Verify every referenced category exists with a single lookup
+            category_ids = {t.category_id for t in templates_data if t.category_id}
+            if category_ids:
+                found = await session.execute(
+                    select(EmailTemplateCategoryDB.id).where(EmailTemplateCategoryDB.id.in_(category_ids))
+                )
+                missing = sorted(category_ids - set(found.scalars()))
+                if missing:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Categories {missing} not found"
+                    )
+
+            if not templates_data:
+                return []
+
+            # Uniform parameter dicts plus render_nulls (None means NULL here, as
+            # with create_template) let SQLAlchemy send one multi-row INSERT
+            now = datetime.utcnow()
+            result = await session.execute(
+                insert(EmailTemplateDB)
+                .returning(EmailTemplateDB)
+                .options(selectinload(EmailTemplateDB.category), raiseload("*"))
+                .execution_options(render_nulls=True),
+                [
+                    {**template_data.model_dump(), "created_at": now, "updated_at": now}
+                    for template_data in templates_data
+                ]
+            )
+            # RETURNING order is not guaranteed, but ids follow the VALUES order
+            # (sort_by_parameter_order would split the batch into single rows)
+            db_templates = sorted(result.scalars(), key=lambda db_template: db_template.id)
+            await session.commit()
+            _stats_cache.invalidate()
+
+            return [EmailTemplateResponse.model_validate(db_template) for db_template in db_templates]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error bulk creating templates: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create templates: {str(e)}"
+        )
+
+
 @router.get("/{template_id}", response_model=EmailTemplateResponse)
 async def get_template(
     template_id: int,
@@ -358,40 +413,14 @@ async def get_template(
     """Get a specific email template"""
     try:
         async with db_service.get_session() as session:
-            db_template = await session.get(EmailTemplateDB, template_id)
+            db_template = await _get_template(session, template_id)
             if not db_template:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Template {template_id} not found"
                 )
 
-            # Get category info
-            category_name = None
-            category_icon = None
-            if db_template.category_id:
-                category = await session.get(EmailTemplateCategoryDB, db_template.category_id)
-                if category:
-                    category_name = category.name
-                    category_icon = category.icon
-
-            return EmailTemplateResponse(
-                id=db_template.id,
-                name=db_template.name,
-                description=db_template.description,
-                subject=db_template.subject,
-                html_content=db_template.html_content,
-                text_content=db_template.text_content,
-                category_id=db_template.category_id,
-                category_name=category_name,
-                category_icon=category_icon,
-                is_active=db_template.is_active,
-                usage_count=db_template.usage_count,
-                open_rate=db_template.open_rate,
-                click_rate=db_template.click_rate,
-                variables=db_template.variables,
-                created_at=db_template.created_at,
-                updated_at=db_template.updated_at
-            )
+            return EmailTemplateResponse.model_validate(db_template)
 
     except HTTPException:
         raise
@@ -412,71 +441,47 @@ async def update_template(
     """Update an email template"""
     try:
         async with db_service.get_session() as session:
-            db_template = await session.get(EmailTemplateDB, template_id)
+            # None means "leave unchanged", as before
+            patch = template_data.model_dump(exclude_none=True)
+
+            # Nothing to change: answer from a read instead of an UPDATE that
+            # would only bump updated_at and invalidate the stats cache
+            if not patch:
+                db_template = await _get_template(session, template_id)
+                if not db_template:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Template {template_id} not found"
+                    )
+                return EmailTemplateResponse.model_validate(db_template)
+
+            # Verify category exists
+            if patch.get("category_id"):
+                if not await _category_exists(session, patch["category_id"]):
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Category {template_data.category_id} not found"
+                    )
+
+            # One UPDATE ... RETURNING instead of load, mutate, flush and reload
+            result = await session.execute(
+                update(EmailTemplateDB)
+                .where(EmailTemplateDB.id == template_id)
+                .values(**patch, updated_at=datetime.utcnow())
+                .returning(EmailTemplateDB)
+                .options(selectinload(EmailTemplateDB.category), raiseload("*"))
+            )
+            db_template = result.scalar_one_or_none()
             if not db_template:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Template {template_id} not found"
                 )
 
-            # Update fields
-            if template_data.name is not None:
-                db_template.name = template_data.name
-            if template_data.description is not None:
-                db_template.description = template_data.description
-            if template_data.subject is not None:
-                db_template.subject = template_data.subject
-            if template_data.html_content is not None:
-                db_template.html_content = template_data.html_content
-            if template_data.text_content is not None:
-                db_template.text_content = template_data.text_content
-            if template_data.category_id is not None:
-                # Verify category exists
-                if template_data.category_id:
-                    category = await session.get(EmailTemplateCategoryDB, template_data.category_id)
-                    if not category:
-                        raise HTTPException(
-                            status_code=status.HTTP_404_NOT_FOUND,
-                            detail=f"Category {template_data.category_id} not found"
-                        )
-                db_template.category_id = template_data.category_id
-            if template_data.is_active is not None:
-                db_template.is_active = template_data.is_active
-            if template_data.variables is not None:
-                db_template.variables = template_data.variables
-
-            db_template.updated_at = datetime.utcnow()
-
             await session.commit()
-            await session.refresh(db_template)
-
-            # Get category info
-            category_name = None
-            category_icon = None
-            if db_template.category_id:
-                category = await session.get(EmailTemplateCategoryDB, db_template.category_id)
-                if category:
-                    category_name = category.name
-                    category_icon = category.icon
-
-            return EmailTemplateResponse(
-                id=db_template.id,
-                name=db_template.name,
-                description=db_template.description,
-                subject=db_template.subject,
-                html_content=db_template.html_content,
-                text_content=db_template.text_content,
-                category_id=db_template.category_id,
-                category_name=category_name,
-                category_icon=category_icon,
-                is_active=db_template.is_active,
-                usage_count=db_template.usage_count,
-                open_rate=db_template.open_rate,
-                click_rate=db_template.click_rate,
-                variables=db_template.variables,
-                created_at=db_template.created_at,
-                updated_at=db_template.updated_at
-            )
+            _stats_cache.invalidate()
+
+            return EmailTemplateResponse.model_validate(db_template)
 
     except HTTPException:
         raise
@@ -496,15 +501,28 @@ async def delete_template(
     """Delete an email template"""
     try:
         async with db_service.get_session() as session:
-            db_template = await session.get(EmailTemplateDB, template_id)
-            if not db_template:
+            # Detach sent email history in bulk instead of loading it through the
+            # relationship, then delete and test existence in one statement
+            await session.execute(
+                update(SentEmailDB)
+                .where(SentEmailDB.template_id == template_id)
+                .values(template_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(
+                delete(EmailTemplateDB)
+                .where(EmailTemplateDB.id == template_id)
+                .returning(EmailTemplateDB.id)
+            )
+            if result.scalar_one_or_none() is None:
+                await session.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Template {template_id} not found"
                 )
 
-            await session.delete(db_template)
             await session.commit()
+            _stats_cache.invalidate()
 
             return {"success": True, "message": f"Template {template_id} deleted"}
 
@@ -526,18 +544,24 @@ async def toggle_template(
     """Toggle template active status"""
     try:
         async with db_service.get_session() as session:
-            db_template = await session.get(EmailTemplateDB, template_id)
-            if not db_template:
+            result = await session.execute(
+                update(EmailTemplateDB)
+                .where(EmailTemplateDB.id == template_id)
+                # NULL counts as inactive, as in the stats query (NOT NULL would stay NULL)
+                .values(is_active=~func.coalesce(EmailTemplateDB.is_active, False), updated_at=datetime.utcnow())
+                .returning(EmailTemplateDB.is_active)
+            )
+            is_active = result.scalar_one_or_none()
+            if is_active is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Template {template_id} not found"
                 )
 
-            db_template.is_active = not db_template.is_active
-            db_template.updated_at = datetime.utcnow()
             await session.commit()
+            _stats_cache.invalidate()
 
-            status_text = "aktiviert" if db_template.is_active else "deaktiviert"
+            status_text = "aktiviert" if is_active else "deaktiviert"
             return {"success": True, "message": f"Template {template_id} {status_text}"}
 
     except HTTPException:
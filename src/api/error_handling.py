@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from typing import Dict, Any, Optional, List
+import functools
 import logging
 import uuid
 import json
@@ -254,18 +255,21 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
 
 # Decorator for consistent error handling (backward compatibility)
 def handle_api_errors(func):
-    """Decorator for backward compatibility with existing error handling"""
+    """Decorator for backward compatibility with existing error handling
+
+    Uses functools.wraps so FastAPI still resolves the endpoint's own
+    signature (path/query params and dependencies) through the wrapper.
+    """
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
-        except HTTPException:
-            raise  # Re-raise HTTP exceptions as-is
-        except APIError:
-            raise  # Re-raise API errors as-is
+        except (HTTPException, APIError):
+            raise  # Re-raise HTTP and API errors as-is
         except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}: {str(e)}", exc_info=True)
+            logger.exception("Unexpected error in %s", func.__name__)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Internal error: {str(e)}"
+                detail=f"Internal error: {e}"
             )
-    return wrapper
\ No newline at end of file
+    return wrapper
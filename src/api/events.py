@@ -8,10 +8,11 @@ import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy import and_, or_, func, select, update
-from sqlalchemy.orm import Session, selectinload
+from pydantic import TypeAdapter
+from sqlalchemy import Text, and_, cast, column, event, or_, func, literal_column, select, table, tuple_, update
+from sqlalchemy.orm import Session, object_session, selectinload
 
 from src.core.scheduler import ChronosScheduler
 from src.core.database import db_service, get_db_session
@@ -29,6 +30,10 @@ from src.api.schemas import (
 )
 from src.api.dependencies import verify_api_key, get_scheduler
 from src.api.error_handling import handle_api_errors
+from src.api.pagination import (
+    TRIGRAM_MIN_LENGTH, VersionedTTLCache, decode_cursor, encode_cursor, fts_phrase,
+    substring_search_filter
+)
 
 def safe_enum_name(value, fallback="UNKNOWN"):
     """Safely access enum name whether it's string or enum"""
@@ -77,6 +82,105 @@ def safe_get_enum(value, enum_class, fallback=None):
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# /events pages are cached per query for a short while; any committed write to
+# events (router, scheduler sync, ...) invalidates them
+EVENTS_CACHE_TTL_SECONDS = 30
+EVENTS_CACHE_MAX_ENTRIES = 256
+
+_events_cache = VersionedTTLCache(EVENTS_CACHE_TTL_SECONDS, EVENTS_CACHE_MAX_ENTRIES)
+
+
+def _mark_events_written(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["events_written"] = True
+
+
+for _mapper_event in ("after_insert", "after_update", "after_delete"):
+    event.listen(ChronosEventDB, _mapper_event, _mark_events_written)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_events_written(orm_execute_state):
+    # insert()/update()/delete() statements bypass the mapper events above
+    if orm_execute_state.is_select or orm_execute_state.bind_mapper is None:
+        return
+    if orm_execute_state.bind_mapper.class_ is ChronosEventDB:
+        orm_execute_state.session.info["events_written"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_events_on_commit(session):
+    # Only once committed: until then other sessions still read the old rows
+    if session.info.pop("events_written", False):
+        _events_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_events_written(session):
+    session.info.pop("events_written", None)
+
+
+# List pages are validated straight from result rows and encoded to JSON in
+# one pydantic-core pass each
+_EVENTS_LIST_ADAPTER = TypeAdapter(EventsListResponse)
+_TEMPLATES_LIST_ADAPTER = TypeAdapter(TemplatesListResponse)
+
+# Columns backing EventResponse on /events; sub_tasks and links stay out of lists
+_EVENT_LIST_COLUMNS = (
+    ChronosEventDB.id, ChronosEventDB.title, ChronosEventDB.description,
+    ChronosEventDB.start_time, ChronosEventDB.end_time,
+    ChronosEventDB.priority, ChronosEventDB.event_type, ChronosEventDB.status,
+    ChronosEventDB.tags, ChronosEventDB.attendees, ChronosEventDB.location,
+    ChronosEventDB.calendar_id, ChronosEventDB.created_at, ChronosEventDB.updated_at,
+)
+
+def _event_search_filter(dialect_name: str, q: str):
+    """Case-insensitive substring match on title, description and location"""
+    return substring_search_filter(
+        dialect_name, q, "events_fts", literal_column("events.rowid"),
+        (ChronosEventDB.title, ChronosEventDB.description, ChronosEventDB.location)
+    )
+
+
+_TEMPLATES_FTS = table("templates_fts", column("rowid"))
+
+
+def _template_search(query, dialect_name: str, q: str):
+    """Restrict a TemplateDB query to rows matching every token of q
+
+    Returns the filtered query and a ranking expression to order by, or None
+    when no token went through the FTS index.
+    """
+    # Tokens long enough for the trigram index share one MATCH, see
+    # substring_search_filter; the rest are ILIKE-filtered one by one
+    tokens = q.split()
+    fts_tokens = (
+        [token for token in tokens if len(token) >= TRIGRAM_MIN_LENGTH]
+        if dialect_name == "sqlite" else []
+    )
+
+    for token in tokens:
+        if token not in fts_tokens:
+            token_pattern = f"%{token}%"
+            query = query.where(or_(
+                TemplateDB.title.ilike(token_pattern),
+                TemplateDB.description.ilike(token_pattern),
+                cast(TemplateDB.tags, Text).ilike(token_pattern)
+            ))
+
+    if not fts_tokens:
+        return query, None
+
+    # Space-separated phrases are ANDed by FTS5
+    match = " ".join(fts_phrase(token) for token in fts_tokens)
+    query = (
+        query.join(_TEMPLATES_FTS, _TEMPLATES_FTS.c.rowid == TemplateDB.id)
+        .where(literal_column("templates_fts").op("MATCH")(match))
+    )
+    # bm25 is lower-is-better; weights follow the column order title, description, tags_json
+    return query, func.bm25(literal_column("templates_fts"), 3.0, 1.0, 2.0)
+
 
 @router.post("/events", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
@@ -145,9 +249,19 @@ async def get_events_advanced(
     calendar: Optional[str] = Query(None, description="Filter by calendar ID"),
     q: Optional[str] = Query(None, description="Full-text search query"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=1000, description="Items per page")
+    page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    include_total: bool = Query(True, description="Compute the total match count")
 ):
     """Advanced event listing with filtering, search, and pagination"""
+    after = decode_cursor(cursor, datetime.fromisoformat, str) if cursor else None
+
+    cache_key = (anchor, direction, days, calendar, q, page, page_size, cursor, include_total)
+    cached = _events_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    version = _events_cache.version
     try:
         # Parse anchor date
         anchor_date = datetime.strptime(anchor, '%Y-%m-%d').date()
@@ -165,7 +279,7 @@ async def get_events_advanced(
 
         async with db_service.get_session() as session:
             # Build query
-            query = select(ChronosEventDB)
+            query = select(*_EVENT_LIST_COLUMNS)
 
             # Date range filter
             query = query.where(
@@ -181,57 +295,45 @@ async def get_events_advanced(
 
             # Full-text search
             if q:
-                search_term = f"%{q}%"
-                query = query.where(
-                    or_(
-                        ChronosEventDB.title.ilike(search_term),
-                        ChronosEventDB.description.ilike(search_term),
-                        ChronosEventDB.location.ilike(search_term)
-                    )
-                )
+                query = query.where(_event_search_filter(session.bind.dialect.name, q))
 
             # Pagination
-            total_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(total_query)
-            total_count = total_result.scalar()
+            total_count = None
+            if include_total:
+                total_query = select(func.count()).select_from(query.subquery())
+                total_result = await session.execute(total_query)
+                total_count = total_result.scalar()
 
-            offset = (page - 1) * page_size
-            query = query.offset(offset).limit(page_size)
+            if after:
+                query = query.where(tuple_(ChronosEventDB.start_time, ChronosEventDB.id) > after)
+            else:
+                query = query.offset((page - 1) * page_size)
 
-            # Order by start_time
-            query = query.order_by(ChronosEventDB.start_time)
+            # Order by start_time, id breaks ties; one extra row tells whether
+            # another page follows
+            query = query.order_by(ChronosEventDB.start_time, ChronosEventDB.id).limit(page_size + 1)
 
             # Execute query
             result = await session.execute(query)
-            events_db = result.scalars().all()
-
-            # Convert to response format
-            events = [
-                EventResponse(
-                    id=event.id,
-                    title=event.title,
-                    description=event.description,
-                    start_time=event.start_time,
-                    end_time=event.end_time,
-                    priority=safe_enum_name(event.priority, "MEDIUM"),
-                    event_type=safe_enum_name(event.event_type, "TASK"),
-                    status=safe_enum_name(event.status, "PENDING"),
-                    tags=event.tags or [],
-                    attendees=event.attendees or [],
-                    location=event.location,
-                    calendar_id=event.calendar_id,
-                    created_at=event.created_at,
-                    updated_at=event.updated_at
-                )
-                for event in events_db
-            ]
-
-            return EventsListResponse(
-                items=events,
-                total_count=total_count,
-                page=page,
-                page_size=page_size
-            )
+            rows = result.all()
+            next_cursor = None
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                next_cursor = encode_cursor(rows[-1].start_time, rows[-1].id)
+
+            # Returning a Response skips FastAPI re-validating the response_model;
+            # the encoded body is what gets cached
+            page_data = _EVENTS_LIST_ADAPTER.validate_python({
+                "items": rows,
+                "total_count": total_count,
+                "page": page,
+                "page_size": page_size,
+                "next_cursor": next_cursor
+            }, from_attributes=True)
+            body = _EVENTS_LIST_ADAPTER.dump_json(page_data)
+
+            _events_cache.put(body, version, cache_key)
+            return Response(content=body, media_type="application/json")
 
     except ValueError as e:
         raise HTTPException(
@@ -312,9 +414,12 @@ async def get_templates(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
     category: Optional[str] = Query(None, description="Filter by category"),
-    q: Optional[str] = Query(None, description="Search query")
+    q: Optional[str] = Query(None, description="Search query"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    include_total: bool = Query(True, description="Compute the total match count")
 ):
     """Get paginated list of templates with optional filtering"""
+    after = decode_cursor(cursor, int, str, int) if cursor else None
     try:
         async with db_service.get_session() as session:
             # Build query
@@ -325,54 +430,66 @@ async def get_templates(
                 query = query.where(TemplateDB.category == category)
 
             # Search filter
+            rank = None
             if q:
-                search_term = f"%{q}%"
-                query = query.where(
-                    or_(
-                        TemplateDB.name.ilike(search_term),
-                        TemplateDB.description.ilike(search_term)
-                    )
-                )
+                query, rank = _template_search(query, session.bind.dialect.name, q)
 
             # Count total
-            total_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(total_query)
-            total_count = total_result.scalar()
+            total_count = None
+            if include_total:
+                total_query = select(func.count()).select_from(query.subquery())
+                total_result = await session.execute(total_query)
+                total_count = total_result.scalar()
+
+            # Ranked search results page by number; relevance scores are not a
+            # stable sort key, so no cursor is handed out for them
+            if rank is not None and after:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="cursor cannot be combined with a ranked search, use page"
+                )
 
-            # Pagination
-            offset = (page - 1) * page_size
-            query = query.offset(offset).limit(page_size)
-            query = query.order_by(TemplateDB.usage_count.desc(), TemplateDB.title)
+            # Sort key is (usage_count desc, title, id)
+            if after:
+                usage_count, title, template_id = after
+                query = query.where(or_(
+                    TemplateDB.usage_count < usage_count,
+                    and_(
+                        TemplateDB.usage_count == usage_count,
+                        tuple_(TemplateDB.title, TemplateDB.id) > (title, template_id)
+                    )
+                ))
+            else:
+                query = query.offset((page - 1) * page_size)
+            if rank is not None:
+                query = query.order_by(rank)
+            query = query.order_by(TemplateDB.usage_count.desc(), TemplateDB.title, TemplateDB.id)
+            query = query.limit(page_size + 1)
 
             # Execute
             result = await session.execute(query)
             templates_db = result.scalars().all()
-
-            # Convert to response
-            templates = []
-            for template in templates_db:
-                templates.append(TemplateResponse(
-                    id=template.id,
-                    title=template.title,
-                    description=template.description,
-                    all_day=safe_get_bool(template, 'all_day', False),
-                    default_time=getattr(template, 'default_time', None),
-                    duration_minutes=getattr(template, 'duration_minutes', None),
-                    calendar_id=getattr(template, 'calendar_id', None),
-                    tags=safe_get_json_list(template, 'tags_json', []),
-                    usage_count=template.usage_count or 0,
-                    created_at=template.created_at,
-                    updated_at=template.updated_at,
-                    author=getattr(template, 'author', None)
-                ))
-
-            return TemplatesListResponse(
-                items=templates,
-                total_count=total_count,
-                page=page,
-                page_size=page_size
+            next_cursor = None
+            if len(templates_db) > page_size:
+                templates_db = templates_db[:page_size]
+                if rank is None:
+                    last = templates_db[-1]
+                    next_cursor = encode_cursor(last.usage_count, last.title, last.id)
+
+            page_data = _TEMPLATES_LIST_ADAPTER.validate_python({
+                "items": templates_db,
+                "total_count": total_count,
+                "page": page,
+                "page_size": page_size,
+                "next_cursor": next_cursor
+            }, from_attributes=True)
+            return Response(
+                content=_TEMPLATES_LIST_ADAPTER.dump_json(page_data),
+                media_type="application/json"
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving templates: {e}")
         raise HTTPException(
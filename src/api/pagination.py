@@ -3,12 +3,15 @@ Unified API Pagination and Filtering Standards
 Provides consistent pagination, filtering, and sorting across all endpoints
 """
 
+import base64
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional, List, Generic, TypeVar
+from typing import Callable, Dict, Any, Hashable, Iterable, Optional, List, Generic, Tuple, TypeVar
+import orjson
 from pydantic import BaseModel, Field, validator
-from fastapi import Query
-from sqlalchemy import Select, func, asc, desc
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, column, func, asc, desc, literal_column, or_, select, table
 
 
 T = TypeVar('T')
@@ -222,6 +225,95 @@ class QueryBuilder:
         return self.query.with_only_columns(func.count()).order_by(None)
 
 
+# Keyset pagination: list endpoints hand out the sort key of the last row as
+# next_cursor and seek past it with a row-value comparison, so deep pages do
+# not pay for an OFFSET scan. Page numbers keep working for the first pages.
+def encode_cursor(*values) -> str:
+    """Opaque keyset cursor holding the sort key of the row a page ended on"""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def decode_cursor(cursor: str, *converters: Callable) -> tuple:
+    """Inverse of encode_cursor, one converter per key value
+
+    Malformed cursors are a client error.
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if len(values) != len(converters):
+            raise ValueError("wrong cursor length")
+        return tuple(convert(value) for convert, value in zip(converters, values))
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        ) from None
+
+
+# Trigram FTS5 tables match substrings of at least this many characters
+TRIGRAM_MIN_LENGTH = 3
+
+
+def fts_phrase(term: str) -> str:
+    """Quote a search term as one FTS5 phrase"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def substring_search_filter(dialect_name: str, q: str, fts_table: str, rowid, columns: Iterable):
+    """Case-insensitive substring match of q on any of columns
+
+    On SQLite the trigram FTS5 table fts_table (kept in sync by triggers
+    declared next to the model) answers this without a table scan, matching
+    its rowid against the rowid expression. Shorter terms fall back to ILIKE,
+    which PostgreSQL serves from its pg_trgm GIN index.
+    """
+    if dialect_name == "sqlite" and len(q) >= TRIGRAM_MIN_LENGTH:
+        fts = table(fts_table, column("rowid"))
+        return rowid.in_(
+            select(fts.c.rowid).where(literal_column(fts_table).op("MATCH")(fts_phrase(q)))
+        )
+
+    pattern = f"%{q}%"
+    return or_(*(col.ilike(pattern) for col in columns))
+
+
+class VersionedTTLCache:
+    """Small in-process cache for read endpoints
+
+    Entries expire after ttl_seconds, or at once when invalidate() is called
+    after a write. Take version before querying and pass it to put(), so a
+    write that lands mid-query leaves the new entry stale. Beyond max_entries
+    the oldest entry is evicted.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version = 0
+        self._entries: Dict[Hashable, Tuple[int, float, Any]] = {}
+
+    def get(self, key: Hashable = None) -> Optional[Any]:
+        """Cached value for key, or None when missing, expired or invalidated"""
+        entry = self._entries.get(key)
+        if (
+            entry
+            and entry[0] == self.version
+            and time.monotonic() - entry[1] < self.ttl_seconds
+        ):
+            return entry[2]
+        return None
+
+    def put(self, value: Any, version: int, key: Hashable = None):
+        """Store value computed from data as of version"""
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (version, time.monotonic(), value)
+
+    def invalidate(self):
+        """Mark every cached entry as stale after a write"""
+        self.version += 1
+
+
 # FastAPI dependency functions for consistent parameter injection
 def pagination_params(
     page: int = Query(1, ge=1, description="Page number"),
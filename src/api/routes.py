@@ -3,7 +3,6 @@ Consolidated API routes for Chronos Engine v2.2
 Unified single API combining all features from multiple versions
 """
 
-import json
 import logging
 import uuid
 import platform
@@ -13,7 +12,7 @@ from fastapi import APIRouter, HTTPException, Depends, Request, Query, Form, Hea
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import and_, or_, func, select, update, text
+from sqlalchemy import Text, and_, cast, or_, func, select, update, text
 from sqlalchemy.orm import Session, selectinload
 
 from src.core.scheduler import ChronosScheduler
@@ -435,7 +434,7 @@ class ChronosUnifiedAPIRoutes:
                             token_condition = or_(
                                 TemplateDB.title.ilike(token_pattern),
                                 TemplateDB.description.ilike(token_pattern),
-                                TemplateDB.tags_json.ilike(token_pattern)
+                                cast(TemplateDB.tags, Text).ilike(token_pattern)
                             )
                             conditions.append(token_condition)
 
@@ -481,7 +480,7 @@ class ChronosUnifiedAPIRoutes:
                             default_time=template.default_time,
                             duration_minutes=template.duration_minutes,
                             calendar_id=template.calendar_id,
-                            tags=json.loads(template.tags_json) if template.tags_json else [],
+                            tags=template.tags or [],
                             usage_count=template.usage_count,
                             created_at=template.created_at,
                             updated_at=template.updated_at,
@@ -518,7 +517,7 @@ class ChronosUnifiedAPIRoutes:
                         default_time=template_data.default_time,
                         duration_minutes=template_data.duration_minutes,
                         calendar_id=template_data.calendar_id,
-                        tags_json=json.dumps(template_data.tags),
+                        tags=template_data.tags,
                         usage_count=0,
                         created_at=now,
                         updated_at=now,
@@ -537,7 +536,7 @@ class ChronosUnifiedAPIRoutes:
                         default_time=template_db.default_time,
                         duration_minutes=template_db.duration_minutes,
                         calendar_id=template_db.calendar_id,
-                        tags=json.loads(template_db.tags_json) if template_db.tags_json else [],
+                        tags=template_db.tags or [],
                         usage_count=template_db.usage_count,
                         created_at=template_db.created_at,
                         updated_at=template_db.updated_at,
@@ -577,7 +576,7 @@ class ChronosUnifiedAPIRoutes:
                     if template_data.calendar_id is not None:
                         template_db.calendar_id = template_data.calendar_id
                     if template_data.tags is not None:
-                        template_db.tags_json = json.dumps(template_data.tags)
+                        template_db.tags = template_data.tags
 
                     template_db.updated_at = datetime.utcnow().isoformat()
                     await session.flush()
@@ -591,7 +590,7 @@ class ChronosUnifiedAPIRoutes:
                         default_time=template_db.default_time,
                         duration_minutes=template_db.duration_minutes,
                         calendar_id=template_db.calendar_id,
-                        tags=json.loads(template_db.tags_json) if template_db.tags_json else [],
+                        tags=template_db.tags or [],
                         usage_count=template_db.usage_count,
                         created_at=template_db.created_at,
                         updated_at=template_db.updated_at,
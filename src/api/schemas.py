@@ -4,7 +4,7 @@ Pydantic schemas for API request/response models
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from enum import Enum
 
 
@@ -103,6 +103,12 @@ class EventResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @field_validator('tags', 'attendees', mode='before')
+    @classmethod
+    def null_list_as_empty(cls, value):
+        # JSON columns on events may hold NULL
+        return value or []
+
 
 class SyncRequest(BaseModel):
     days_ahead: int = Field(default=7, ge=1, le=365)
@@ -196,7 +202,8 @@ class TemplatesListResponse(BaseModel):
     items: List[TemplateResponse]
     page: int = 1
     page_size: int = 100
-    total_count: Optional[int] = None
+    total_count: Optional[int] = None  # None when include_total=false
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the following page
 
 
 # Enhanced Event schemas for new filtering
@@ -204,7 +211,8 @@ class EventsListResponse(BaseModel):
     items: List[EventResponse]
     page: int = 1
     page_size: int = 100
-    total_count: Optional[int] = None
+    total_count: Optional[int] = None  # None when include_total=false
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the following page
 
 
 class EventDirection(str, Enum):
@@ -336,13 +344,18 @@ class AdminWorkflowResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator('triggers', 'actions', mode='before')
+    @classmethod
+    def null_list_as_empty(cls, value):
+        # Rows written before the column defaults may hold JSON null
+        return value or []
 
 
 class AdminWorkflowsListResponse(BaseModel):
     success: bool = True
-    total: int
+    total: Optional[int] = None  # None when include_total=false
     page: int
     page_size: int
     workflows: List[AdminWorkflowResponse]
@@ -357,8 +370,7 @@ class AdminWorkflowExecutionResponse(BaseModel):
     result_data: Optional[Dict[str, Any]] = None
     executed_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Email Template Schemas
@@ -409,13 +421,12 @@ class EmailTemplateUpdate(BaseModel):
     variables: Optional[List[str]] = None
 
 
-class EmailTemplateResponse(BaseModel):
+class EmailTemplateListItemResponse(BaseModel):
+    """Template summary for list pages; bodies are served by GET /{id} only"""
     id: int
     name: str
     description: Optional[str] = None
     subject: str
-    html_content: Optional[str] = None
-    text_content: Optional[str] = None
     category_id: Optional[int] = None
     category_name: Optional[str] = None
     category_icon: Optional[str] = None
@@ -427,8 +438,12 @@ class EmailTemplateResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EmailTemplateResponse(EmailTemplateListItemResponse):
+    html_content: Optional[str] = None
+    text_content: Optional[str] = None
 
 
 class EmailTemplatesListResponse(BaseModel):
@@ -436,7 +451,8 @@ class EmailTemplatesListResponse(BaseModel):
     total: int
     page: int
     page_size: int
-    templates: List[EmailTemplateResponse]
+    templates: List[EmailTemplateListItemResponse]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the following page
 
 
 class EmailTemplateCategoriesListResponse(BaseModel):
@@ -121,6 +121,10 @@ def load_config() -> Dict[str, Any]:
         log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
         logging.getLogger().setLevel(getattr(logging, log_level, logging.INFO))
     
+    if os.getenv('CALDAV_MAX_CONCURRENCY'):
+        caldav_sync = config.setdefault('caldav', {}).setdefault('sync', {})
+        caldav_sync['parallel_requests'] = int(os.getenv('CALDAV_MAX_CONCURRENCY'))
+    
     if os.getenv('DATABASE_URL'):
         config['database']['url'] = os.getenv('DATABASE_URL')
     
@@ -3,11 +3,13 @@ CalDAV Adapter for Radicale Integration
 Implements SourceAdapter interface for CalDAV/Radicale backend
 """
 
+import asyncio
 import re
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone, timedelta, date
-from typing import Dict, Any, List, Optional
-from urllib.parse import urljoin
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import quote, unquote, urljoin, urlparse
+from xml.sax.saxutils import escape
 import hashlib
 import aiohttp
 from icalendar import Calendar, Event as ICalEvent
@@ -46,6 +48,7 @@ class CalDAVAdapter(SourceAdapter):
         self.verify_tls = self.transport_config.get('verify_tls', False)
         self.use_sync_collection = self.sync_config.get('use_sync_collection', True)
         self.if_match = self.write_config.get('if_match', True)
+        self.max_concurrency = max(1, int(self.sync_config.get('parallel_requests', 3)))
 
         # Build calendar references from config
         self.calendars = []
@@ -196,14 +199,10 @@ class CalDAVAdapter(SourceAdapter):
             self.logger.error(f"Failed to list events from {calendar.alias}: {e}")
             return EventListResult(events=[])
 
-    async def _sync_collection_report(
-        self,
-        session: aiohttp.ClientSession,
-        calendar: CalendarRef,
-        sync_token: str
-    ) -> EventListResult:
-        """Use sync-collection REPORT for incremental sync"""
-        body = f'''<?xml version="1.0" encoding="utf-8" ?>
+    @staticmethod
+    def _build_sync_collection_body(sync_token: str) -> str:
+        """Build RFC 6578 sync-collection REPORT body"""
+        return f'''<?xml version="1.0" encoding="utf-8" ?>
 <d:sync-collection xmlns:d="DAV:" xmlns:cal="urn:ietf:params:xml:ns:caldav">
   <d:sync-token>{sync_token}</d:sync-token>
   <d:sync-level>1</d:sync-level>
@@ -213,6 +212,77 @@ class CalDAVAdapter(SourceAdapter):
   </d:prop>
 </d:sync-collection>'''
 
+    async def get_sync_token(self, calendar: CalendarRef) -> Optional[str]:
+        """Get the collection's current DAV:sync-token via PROPFIND"""
+        if not self.sync_config.get('use_sync_collection', True):
+            return None
+
+        body = '''<?xml version="1.0" encoding="utf-8" ?>
+<d:propfind xmlns:d="DAV:">
+  <d:prop>
+    <d:sync-token/>
+  </d:prop>
+</d:propfind>'''
+
+        session = await self._get_session()
+        try:
+            async with session.request(
+                'PROPFIND', calendar.url,
+                data=body,
+                headers={'Depth': '0'}
+            ) as response:
+                if response.status != 207:
+                    return None
+                xml_data = await response.text()
+        except aiohttp.ClientError as e:
+            self.logger.warning(f"Failed to fetch sync token for {calendar.alias}: {e}")
+            return None
+
+        try:
+            token_elem = ET.fromstring(xml_data).find('.//{DAV:}sync-token')
+        except ET.ParseError as e:
+            self.logger.warning(f"Failed to parse sync token response for {calendar.alias}: {e}")
+            return None
+        return token_elem.text.strip() if token_elem is not None and token_elem.text else None
+
+    async def sync_collection(self, calendar: CalendarRef, sync_token: str) -> Optional[EventListResult]:
+        """List changes since sync_token using sync-collection REPORT
+
+        Returns None when the server rejects the token (DAV:valid-sync-token
+        precondition) or does not support sync-collection.
+        """
+        if not self.sync_config.get('use_sync_collection', True):
+            return None
+
+        session = await self._get_session()
+        try:
+            async with session.request(
+                'REPORT', calendar.url,
+                data=self._build_sync_collection_body(sync_token),
+                headers={'Depth': '1'}
+            ) as response:
+                if response.status == 207:
+                    xml_data = await response.text()
+                    return self._parse_multistatus_response(xml_data, calendar)
+
+                self.logger.info(
+                    f"Sync collection for {calendar.alias} returned {response.status}, "
+                    f"full sync required"
+                )
+                return None
+        except aiohttp.ClientError as e:
+            self.logger.warning(f"Sync collection failed for {calendar.alias}: {e}")
+            return None
+
+    async def _sync_collection_report(
+        self,
+        session: aiohttp.ClientSession,
+        calendar: CalendarRef,
+        sync_token: str
+    ) -> EventListResult:
+        """Use sync-collection REPORT for incremental sync"""
+        body = self._build_sync_collection_body(sync_token)
+
         async with session.request(
             'REPORT', calendar.url,
             data=body,
@@ -274,6 +344,8 @@ class CalDAVAdapter(SourceAdapter):
     def _parse_multistatus_response(self, xml_data: str, calendar: CalendarRef) -> EventListResult:
         """Parse CalDAV REPORT response"""
         events = []
+        deleted_ids = []
+        sync_token = None
 
         try:
             root = ET.fromstring(xml_data)
@@ -286,6 +358,15 @@ class CalDAVAdapter(SourceAdapter):
 
             for response in root.findall('.//d:response', namespaces):
                 href = response.find('d:href', namespaces)
+
+                # sync-collection reports removed members as 404 responses
+                # without calendar data (RFC 6578 section 3.5.2)
+                statuses = [elem.text or '' for elem in response.findall('d:status', namespaces)]
+                statuses += [elem.text or '' for elem in response.findall('d:propstat/d:status', namespaces)]
+                if href is not None and href.text and any(' 404 ' in f'{status} ' for status in statuses):
+                    deleted_ids.append(self._href_to_uid(href.text))
+                    continue
+
                 propstat = response.find('.//d:propstat[d:status="HTTP/1.1 200 OK"]', namespaces)
 
                 if href is not None and propstat is not None:
@@ -306,10 +387,21 @@ class CalDAVAdapter(SourceAdapter):
                         except Exception as e:
                             self.logger.warning(f"Failed to parse event from {href.text}: {e}")
 
+            # sync-collection responses carry the new token at the top level
+            token_elem = root.find('d:sync-token', namespaces)
+            if token_elem is not None and token_elem.text:
+                sync_token = token_elem.text.strip()
+
         except ET.ParseError as e:
             self.logger.error(f"Failed to parse CalDAV response XML: {e}")
 
-        return EventListResult(events=events)
+        return EventListResult(events=events, sync_token=sync_token, deleted_ids=deleted_ids)
+
+    @staticmethod
+    def _href_to_uid(href: str) -> str:
+        """UID of a resource addressed as <calendar>/<uid>.ics"""
+        name = unquote(href.rstrip('/').rsplit('/', 1)[-1])
+        return name[:-len('.ics')] if name.endswith('.ics') else name
 
     def _parse_ics_event(self, ics_data: str, etag: str, calendar: CalendarRef) -> Optional[Dict[str, Any]]:
         """Parse iCalendar data into normalized event"""
@@ -419,16 +511,111 @@ class CalDAVAdapter(SourceAdapter):
 
     async def get_event(self, calendar: CalendarRef, event_id: str) -> Optional[Dict[str, Any]]:
         """Get single event by UID"""
-        session = await self._get_session()
+        events = await self.multiget_events(calendar, [event_id])
+        return events[0] if events else None
 
-        # For CalDAV, we typically need to find the event by UID first
-        # This is a simplified implementation - in practice you might want to cache href->uid mappings
-        events = await self.list_events(calendar)
-        for event in events.events:
-            if event.get('uid') == event_id or event.get('id') == event_id:
-                return event
+    async def freebusy(
+        self,
+        calendar: CalendarRef,
+        start: datetime,
+        end: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """Get busy periods with a free-busy-query REPORT (RFC 4791 7.10)"""
+        body = f'''<?xml version="1.0" encoding="utf-8" ?>
+<cal:free-busy-query xmlns:cal="urn:ietf:params:xml:ns:caldav">
+  <cal:time-range start="{start.strftime('%Y%m%dT%H%M%SZ')}"
+                  end="{end.strftime('%Y%m%dT%H%M%SZ')}"/>
+</cal:free-busy-query>'''
 
-        return None
+        session = await self._get_session()
+        try:
+            async with session.request(
+                'REPORT', calendar.url,
+                data=body,
+                headers={'Depth': '1', 'Content-Type': 'application/xml; charset=utf-8'}
+            ) as response:
+                if response.status == 200:
+                    return self._parse_freebusy(await response.text())
+                self.logger.info(
+                    f"free-busy-query on {calendar.alias} returned {response.status}, "
+                    f"deriving busy periods from events"
+                )
+        except (aiohttp.ClientError, ValueError) as e:
+            self.logger.warning(f"free-busy-query failed for {calendar.alias}: {e}")
+
+        return await super().freebusy(calendar, start, end)
+
+    @staticmethod
+    def _parse_freebusy(ics_data: str) -> List[Tuple[datetime, datetime]]:
+        """Extract busy periods from a VFREEBUSY response as naive UTC tuples"""
+        busy = []
+        for component in Calendar.from_ical(ics_data).walk('VFREEBUSY'):
+            periods = component.get('FREEBUSY', [])
+            if not isinstance(periods, list):
+                periods = [periods]
+
+            for period in periods:
+                if period.params.get('FBTYPE', 'BUSY').upper() == 'FREE':
+                    continue
+                period_start, period_end = period.dt
+                if isinstance(period_end, timedelta):
+                    period_end = period_start + period_end
+                busy.append(tuple(
+                    value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+                    for value in (period_start, period_end)
+                ))
+        return sorted(busy)
+
+    async def multiget_events(self, calendar: CalendarRef, event_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several events by UID with one calendar-multiget REPORT
+
+        Resources are addressed as <calendar>/<uid>.ics, which is how events
+        created by this adapter are stored. UIDs the server does not return
+        under that name are looked up with a single calendar listing.
+        """
+        if not event_ids:
+            return []
+
+        base_path = urlparse(calendar.url).path.rstrip('/')
+        hrefs = ''.join(
+            f'\n  <d:href>{escape(base_path)}/{escape(quote(event_id))}.ics</d:href>'
+            for event_id in event_ids
+        )
+        body = f'''<?xml version="1.0" encoding="utf-8" ?>
+<cal:calendar-multiget xmlns:d="DAV:" xmlns:cal="urn:ietf:params:xml:ns:caldav">
+  <d:prop>
+    <d:getetag/>
+    <cal:calendar-data/>
+  </d:prop>{hrefs}
+</cal:calendar-multiget>'''
+
+        found: Dict[str, Dict[str, Any]] = {}
+        session = await self._get_session()
+        try:
+            async with session.request(
+                'REPORT', calendar.url,
+                data=body,
+                headers={'Depth': '1', 'Content-Type': 'application/xml; charset=utf-8'}
+            ) as response:
+                if response.status == 207:
+                    xml_data = await response.text()
+                    for event in self._parse_multistatus_response(xml_data, calendar).events:
+                        found[event.get('uid') or event.get('id')] = event
+                else:
+                    self.logger.debug(f"calendar-multiget on {calendar.alias} returned {response.status}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.warning(f"calendar-multiget failed for {calendar.alias}: {e}")
+            return []
+
+        missing = set(event_ids) - found.keys()
+        if missing:
+            # Resource names don't always match UIDs (e.g. events created by other clients)
+            for event in (await self.list_events(calendar)).events:
+                for key in (event.get('uid'), event.get('id')):
+                    if key in missing:
+                        found[key] = event
+
+        return [found[event_id] for event_id in event_ids if event_id in found]
 
     async def patch_event(
         self,
@@ -46,6 +46,7 @@ class CalendarSourceManager:
 
         # Cache for calendars and capabilities
         self._calendars_cache = None
+        self._calendars_by_id_cache = None
         self._capabilities_cache = None
 
     def _create_adapter(self) -> SourceAdapter:
@@ -71,13 +72,16 @@ class CalendarSourceManager:
             self._calendars_cache = await self.adapter.list_calendars()
         return self._calendars_cache
 
+    async def list_calendars_by_id(self) -> Dict[str, CalendarRef]:
+        """List all available calendars keyed by ID"""
+        calendars = await self.list_calendars()
+        if self._calendars_by_id_cache is None:
+            self._calendars_by_id_cache = {calendar.id: calendar for calendar in calendars}
+        return self._calendars_by_id_cache
+
     async def get_calendar_by_id(self, calendar_id: str) -> Optional[CalendarRef]:
         """Get specific calendar by ID"""
-        calendars = await self.list_calendars()
-        for calendar in calendars:
-            if calendar.id == calendar_id:
-                return calendar
-        return None
+        return (await self.list_calendars_by_id()).get(calendar_id)
 
     async def get_calendar_by_alias(self, alias: str) -> Optional[CalendarRef]:
         """Get specific calendar by alias"""
@@ -127,6 +131,7 @@ class CalendarSourceManager:
 
             # Clear caches
             self._calendars_cache = None
+            self._calendars_by_id_cache = None
             self._capabilities_cache = None
 
             # Validate new connection
@@ -11,12 +11,24 @@ from pathlib import Path
 from typing import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy import text
 
 from src.core.models import Base
 
+# Connection pool sizing for non-SQLite backends
+POOL_SIZE = 20
+POOL_MAX_OVERFLOW = 20
+POOL_TIMEOUT_SECONDS = 30
+POOL_RECYCLE_SECONDS = 3600
+
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON column values with orjson (SQLite stores JSON as TEXT)"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class DatabaseService:
     """Enhanced async SQLite database service with migrations"""
@@ -30,17 +42,12 @@ class DatabaseService:
         db_path.mkdir(exist_ok=True)
         
         # Create async engine
-        # SQLite connection arguments for WAL mode and stability
-        sqlite_args = {
-            "check_same_thread": False,
-            "timeout": 20,
-        }
-
         self.engine = create_async_engine(
             database_url,
             echo=False,
-            poolclass=StaticPool,
-            connect_args=sqlite_args
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+            **self._pool_args(database_url)
         )
         
         # Create session factory
@@ -52,6 +59,50 @@ class DatabaseService:
         
         self.logger.info(f"Enhanced Database service initialized: {database_url}")
     
+    @staticmethod
+    def _pool_args(database_url: str) -> dict:
+        """Connection pool settings for the given backend"""
+        if database_url.startswith("sqlite"):
+            # SQLite connection arguments for WAL mode and stability
+            return {
+                "poolclass": StaticPool,
+                "connect_args": {
+                    "check_same_thread": False,
+                    "timeout": 20,
+                },
+            }
+
+        # Server databases get a QueuePool sized for concurrent command polling;
+        # keep pool_size + max_overflow below max_connections / worker count
+        args = {
+            "pool_size": POOL_SIZE,
+            "max_overflow": POOL_MAX_OVERFLOW,
+            "pool_timeout": POOL_TIMEOUT_SECONDS,
+            "pool_recycle": POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": True,
+        }
+        if database_url.startswith("postgresql+asyncpg"):
+            # PgBouncer in transaction mode hands each transaction a different
+            # server connection, so prepared statements must not be cached
+            args["connect_args"] = {"statement_cache_size": 0}
+        return args
+
+    def pool_status(self) -> dict:
+        """Describe the engine's connection pool for health reporting"""
+        pool = self.engine.pool
+        status = {
+            "pool_class": type(pool).__name__,
+            "status": pool.status(),
+        }
+        if isinstance(pool, QueuePool):
+            status.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            })
+        return status
+
     async def initialize_database(self):
         """Initialize database with migrations"""
         try:
@@ -298,6 +349,10 @@ db_service = DatabaseService()
 
 # Dependency for FastAPI
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get database session in FastAPI routes"""
+    """Dependency to get database session in FastAPI routes
+
+    The session is committed or rolled back and returned to the pool in the
+    dependency's exit code, which FastAPI runs before the response is sent.
+    """
     async with db_service.get_session() as session:
         yield session
@@ -7,9 +7,8 @@ from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Dict, Any, List, Optional
 import uuid
-import json
 
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, Boolean, JSON, ForeignKey
+from sqlalchemy import DDL, Column, String, DateTime, Integer, Float, Text, Boolean, JSON, ForeignKey, Index, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import TypeDecorator, VARCHAR
@@ -85,7 +84,7 @@ class ChronosEventDB(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(200), nullable=False, default="")
     description = Column(Text, default="")
-    start_time = Column(DateTime, nullable=True)
+    start_time = Column(DateTime, nullable=True, index=True)
     end_time = Column(DateTime, nullable=True)
 
     # New UTC timestamp fields for enhanced filtering
@@ -127,7 +126,12 @@ class ChronosEventDB(Base):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+
+    # /events filters on calendar and start_time range, ordered by start_time
+    __table_args__ = (
+        Index('idx_events_calendar_start', calendar_id, start_time),
+    )
+
     def to_domain_model(self) -> 'ChronosEvent':
         """Convert SQLAlchemy model to domain model"""
         return ChronosEvent(
@@ -161,6 +165,34 @@ class ChronosEventDB(Base):
         )
 
 
+# SQLite substring search for /events: an external-content FTS5 table with the
+# trigram tokenizer over events, keyed by the implicit rowid and kept in sync
+# by triggers
+EVENTS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5("
+    "title, description, location, content='events', content_rowid='rowid', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN "
+    "INSERT INTO events_fts(rowid, title, description, location) "
+    "VALUES (new.rowid, new.title, new.description, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.rowid, old.title, old.description, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF title, description, location "
+    "ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.rowid, old.title, old.description, old.location); "
+    "INSERT INTO events_fts(rowid, title, description, location) "
+    "VALUES (new.rowid, new.title, new.description, new.location); END",
+)
+
+for _statement in EVENTS_FTS_DDL:
+    event.listen(ChronosEventDB.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    ChronosEventDB.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS events_fts").execute_if(dialect="sqlite")
+)
+
+
 class AnalyticsDataDB(Base):
     """SQLAlchemy model for AnalyticsData"""
     __tablename__ = 'analytics_data'
@@ -228,7 +260,9 @@ class TemplateDB(Base):
     default_time = Column(Text, nullable=True)
     duration_minutes = Column(Integer, nullable=True)
     calendar_id = Column(Text, nullable=True)
-    tags_json = Column(Text, nullable=False, default='[]')
+    # JSON list decoded by the engine's json_deserializer; the column keeps its
+    # historical tags_json name
+    tags = Column('tags_json', JSON, nullable=False, default=list)
     usage_count = Column(Integer, nullable=False, default=0)
     created_at = Column(Text, nullable=False, default=lambda: datetime.utcnow().isoformat())
     updated_at = Column(Text, nullable=False, default=lambda: datetime.utcnow().isoformat())
@@ -236,7 +270,6 @@ class TemplateDB(Base):
 
     def to_domain_model(self) -> 'Template':
         """Convert to domain model"""
-        import json
         return Template(
             id=self.id,
             title=self.title,
@@ -245,7 +278,7 @@ class TemplateDB(Base):
             default_time=self.default_time,
             duration_minutes=self.duration_minutes,
             calendar_id=self.calendar_id,
-            tags=json.loads(self.tags_json) if self.tags_json else [],
+            tags=self.tags or [],
             usage_count=self.usage_count,
             created_at=self.created_at,
             updated_at=self.updated_at,
@@ -253,6 +286,33 @@ class TemplateDB(Base):
         )
 
 
+# SQLite search for /templates: an external-content FTS5 table with the trigram
+# tokenizer over templates, kept in sync by triggers
+TEMPLATES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS templates_fts USING fts5("
+    "title, description, tags_json, content='templates', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS templates_fts_ai AFTER INSERT ON templates BEGIN "
+    "INSERT INTO templates_fts(rowid, title, description, tags_json) "
+    "VALUES (new.id, new.title, new.description, new.tags_json); END",
+    "CREATE TRIGGER IF NOT EXISTS templates_fts_ad AFTER DELETE ON templates BEGIN "
+    "INSERT INTO templates_fts(templates_fts, rowid, title, description, tags_json) "
+    "VALUES ('delete', old.id, old.title, old.description, old.tags_json); END",
+    "CREATE TRIGGER IF NOT EXISTS templates_fts_au AFTER UPDATE OF title, description, tags_json "
+    "ON templates BEGIN "
+    "INSERT INTO templates_fts(templates_fts, rowid, title, description, tags_json) "
+    "VALUES ('delete', old.id, old.title, old.description, old.tags_json); "
+    "INSERT INTO templates_fts(rowid, title, description, tags_json) "
+    "VALUES (new.id, new.title, new.description, new.tags_json); END",
+)
+
+for _statement in TEMPLATES_FTS_DDL:
+    event.listen(TemplateDB.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    TemplateDB.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS templates_fts").execute_if(dialect="sqlite")
+)
+
+
 class TemplateUsageDB(Base):
     """SQLAlchemy model for template usage tracking"""
     __tablename__ = 'template_usage'
@@ -665,7 +725,7 @@ class Template:
             default_time=self.default_time,
             duration_minutes=self.duration_minutes,
             calendar_id=self.calendar_id,
-            tags_json=json.dumps(self.tags),
+            tags=list(self.tags),
             usage_count=self.usage_count,
             created_at=self.created_at,
             updated_at=self.updated_at,
@@ -728,6 +788,19 @@ class ExternalCommandDB(Base):
     result = Column(JSON, nullable=True)
     error_message = Column(Text, nullable=True)
 
+    __table_args__ = (
+        # Claim query: WHERE target_system = ? AND status = ? ORDER BY created_at
+        Index('idx_external_commands_system_status_created', target_system, status, created_at),
+        # Stale PROCESSING reclaim: status = 'processing' AND processed_at < ?
+        Index('idx_external_commands_system_status_processed', target_system, status, processed_at),
+        # Dense index over the pending queue only
+        Index(
+            'idx_external_commands_pending', target_system, created_at,
+            sqlite_where=status == CommandStatus.PENDING.value,
+            postgresql_where=status == CommandStatus.PENDING.value
+        ),
+    )
+
 
 class URLPayloadDB(Base):
     """Database model for URL payloads from URL: commands"""
@@ -781,8 +854,8 @@ class WorkflowDB(Base):
     name = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(String(20), nullable=False, default='active', index=True)  # active, paused, error
-    triggers = Column(JSON, nullable=False)  # List of trigger conditions
-    actions = Column(JSON, nullable=False)   # List of actions to execute
+    triggers = Column(JSON, nullable=False, default=list, server_default='[]')  # List of trigger conditions
+    actions = Column(JSON, nullable=False, default=list, server_default='[]')   # List of actions to execute
     execution_count = Column(Integer, default=0)
     last_execution = Column(DateTime, nullable=True)
     success_rate = Column(Float, default=0.0)
@@ -793,6 +866,12 @@ class WorkflowDB(Base):
     # Relationship to execution logs
     executions = relationship("WorkflowExecutionDB", back_populates="workflow")
 
+    # Support WHERE status=? ORDER BY updated_at DESC, id DESC (and the unfiltered list)
+    __table_args__ = (
+        Index('idx_workflows_status_updated_id', status, updated_at.desc(), id.desc()),
+        Index('idx_workflows_updated_id', updated_at.desc(), id.desc()),
+    )
+
 
 class WorkflowExecutionDB(Base):
     """Database model for workflow execution logs"""
@@ -842,12 +921,59 @@ class EmailTemplateDB(Base):
     click_rate = Column(Float, default=0.0)  # Percentage 0.0-1.0
     variables = Column(JSON, nullable=True)  # Available template variables
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # NOT NULL: list_templates pages on (updated_at, id)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     category = relationship("EmailTemplateCategoryDB", back_populates="templates")
     sent_emails = relationship("SentEmailDB", back_populates="template")
 
+    # list_templates: optional is_active / category_id filter, ORDER BY updated_at DESC
+    __table_args__ = (
+        Index('idx_email_templates_active_updated', is_active, updated_at.desc()),
+        Index('idx_email_templates_category_updated', category_id, updated_at.desc()),
+        Index('idx_email_templates_updated', updated_at.desc()),
+    )
+
+    # Read from the instance dict so an unloaded category yields None rather
+    # than a lazy load
+    @property
+    def category_name(self) -> Optional[str]:
+        category = self.__dict__.get('category')
+        return category.name if category else None
+
+    @property
+    def category_icon(self) -> Optional[str]:
+        category = self.__dict__.get('category')
+        return category.icon if category else None
+
+
+# SQLite substring search for list_templates: an external-content FTS5 table
+# with the trigram tokenizer over email_templates, kept in sync by triggers
+EMAIL_TEMPLATES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS email_templates_fts USING fts5("
+    "name, description, subject, content='email_templates', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_ai AFTER INSERT ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(rowid, name, description, subject) "
+    "VALUES (new.id, new.name, new.description, new.subject); END",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_ad AFTER DELETE ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(email_templates_fts, rowid, name, description, subject) "
+    "VALUES ('delete', old.id, old.name, old.description, old.subject); END",
+    "CREATE TRIGGER IF NOT EXISTS email_templates_fts_au AFTER UPDATE OF name, description, subject "
+    "ON email_templates BEGIN "
+    "INSERT INTO email_templates_fts(email_templates_fts, rowid, name, description, subject) "
+    "VALUES ('delete', old.id, old.name, old.description, old.subject); "
+    "INSERT INTO email_templates_fts(rowid, name, description, subject) "
+    "VALUES (new.id, new.name, new.description, new.subject); END",
+)
+
+for _statement in EMAIL_TEMPLATES_FTS_DDL:
+    event.listen(EmailTemplateDB.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    EmailTemplateDB.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS email_templates_fts").execute_if(dialect="sqlite")
+)
+
 
 class SentEmailDB(Base):
     """Database model for tracking sent emails"""
@@ -905,6 +1031,19 @@ class WhitelistAccessLogDB(Base):
     whitelist = relationship("WhitelistDB", back_populates="access_logs")
 
 
+class CalendarSyncStateDB(Base):
+    """Database model for per-calendar incremental sync state (RFC 6578 sync tokens)"""
+    __tablename__ = 'calendar_sync_state'
+
+    calendar_id = Column(String(255), primary_key=True)
+    sync_token = Column(Text, nullable=True)
+    # Time range of the full listing the token was taken for; changes reported
+    # against the token only cover events already imported from that range
+    window_start = Column(DateTime, nullable=True)
+    window_end = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 # Domain Models for Command Layer
 
 @dataclass
@@ -6,9 +6,11 @@ Core scheduling functionality without corrupted code
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from src.core.models import ChronosEvent, ChronosEventDB, Priority, EventStatus
+from sqlalchemy import select
+
+from src.core.models import ChronosEvent, ChronosEventDB, CalendarSyncStateDB, Priority, EventStatus
 from src.core.database import db_service
 from src.core.event_parser import EventParser
 from src.core.analytics_engine import AnalyticsEngine
@@ -20,6 +22,7 @@ from src.core.task_queue import TaskQueue
 from src.core.plugin_manager import PluginManager
 from src.core.calendar_repairer import CalendarRepairer
 from src.core.calendar_source_manager import CalendarSourceManager
+from src.core.source_adapter import gather_bounded
 
 
 class ChronosScheduler:
@@ -106,13 +109,37 @@ class ChronosScheduler:
                 self.logger.error(f"Error in periodic sync: {e}")
                 await asyncio.sleep(60)  # Wait before retrying
 
-    async def sync_calendar(self, days_ahead: int = 7, force_refresh: bool = False) -> Dict[str, Any]:
-        """Synchronize calendar events from all configured calendars"""
+    async def sync_calendar(
+        self,
+        days_ahead: int = 7,
+        force_refresh: bool = False,
+        calendar_ids: Optional[List[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        exact_window: bool = False
+    ) -> Dict[str, Any]:
+        """Synchronize calendar events from all (or the selected) configured calendars
+
+        Events for all calendars are fetched concurrently since the backend
+        round trips dominate; the fetched events are then processed one
+        calendar at a time so database writes stay serialized.
+
+        since/until override the default [start of today, + days_ahead] window
+        that is sent to the backend as a time-range filter. A stored sync token
+        is only used while the window lies inside the one it was taken for,
+        since the changes it reports do not include untouched events that
+        were outside that range; otherwise the calendar is listed in full.
+        With exact_window (an explicitly requested range) the token is only
+        used for the very window it was taken for.
+        """
         try:
             self.logger.info(f"Starting unified calendar sync (days_ahead: {days_ahead})")
 
             # Get all calendars from source manager
             calendars = await self.source_manager.list_calendars()
+            if calendar_ids is not None:
+                wanted_ids = set(calendar_ids)
+                calendars = [calendar for calendar in calendars if calendar.id in wanted_ids]
             if not calendars:
                 self.logger.warning("No calendars configured for sync")
                 return {
@@ -120,115 +147,98 @@ class ChronosScheduler:
                     'events_processed': 0,
                     'events_created': 0,
                     'events_updated': 0,
+                    'errors': [],
                     'sync_time': datetime.utcnow().isoformat()
                 }
 
             total_processed = 0
             total_created = 0
             total_updated = 0
+            errors = []
             adapter = self.source_manager.get_adapter()
 
-            # Calculate time window for sync
-            since = datetime.utcnow()
-            until = since + timedelta(days=days_ahead)
+            # Calculate time window for sync; whole days so repeated runs on
+            # the same day can stay incremental
+            since = since or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            until = until or since + timedelta(days=days_ahead)
+
+            # Incremental (RFC 6578) sync when the backend supports it
+            capabilities = await self.source_manager.get_capabilities()
+            use_sync_token = capabilities.supports_sync_token and not force_refresh
+            sync_states = await self._load_sync_states([calendar.id for calendar in calendars])
+
+            async def fetch(calendar):
+                # Failures are reported per calendar instead of cancelling the others
+                try:
+                    return await self._fetch_calendar_events(
+                        adapter, calendar, since, until,
+                        sync_states.get(calendar.id) if use_sync_token else None,
+                        exact_window
+                    )
+                except Exception as e:
+                    return e
+
+            # Fetch events from all calendars in parallel, bounded per backend
+            fetch_results = await gather_bounded(
+                (fetch(calendar) for calendar in calendars), adapter.max_concurrency
+            )
+
+            new_sync_states = {}
+            incremental_calendars = []
+            calendar_results = {}
 
             # Process each calendar
-            for calendar in calendars:
+            for calendar, fetch_result in zip(calendars, fetch_results):
                 try:
                     self.logger.info(f"Syncing calendar: {calendar.alias} ({calendar.id})")
 
-                    # Fetch events from this calendar
-                    event_result = await adapter.list_events(
-                        calendar=calendar,
-                        since=since,
-                        until=until
-                    )
+                    if isinstance(fetch_result, Exception):
+                        raise fetch_result
+
+                    event_result, incremental = fetch_result
+                    if incremental:
+                        incremental_calendars.append(calendar.id)
+                    calendar_results[calendar.id] = {'events_processed': 0, 'incremental': incremental}
+
+                    if event_result.deleted_ids:
+                        calendar_results[calendar.id]['events_deleted'] = await self._delete_removed_events(
+                            calendar, event_result.deleted_ids
+                        )
 
                     events = event_result.events
-                    if not events:
+                    if events:
+                        processed_count, created_count, updated_count = await self._process_calendar_events(
+                            calendar, events
+                        )
+                        calendar_results[calendar.id]['events_processed'] = processed_count
+
+                        total_processed += processed_count
+                        total_created += created_count
+                        total_updated += updated_count
+                    else:
+                        processed_count = 0
                         self.logger.debug(f"No events found in calendar {calendar.alias}")
-                        continue
-
-                    processed_count = 0
-                    created_count = 0
-                    updated_count = 0
-
-                    # STEP 1: Calendar Repairer - repair keyword events FIRST
-                    repair_results = []
-                    if self.calendar_repairer and self.calendar_repairer.enabled:
-                        self.logger.info(f"Running Calendar Repairer for {calendar.alias}...")
-                        try:
-                            repair_results = await self.calendar_repairer.process_events(events, calendar)
-                            repaired_count = sum(1 for r in repair_results if r.patched)
-                            if repaired_count > 0:
-                                self.logger.info(f"Calendar Repairer processed {repaired_count} events in {calendar.alias}")
-                        except Exception as e:
-                            self.logger.error(f"Calendar Repairer failed for {calendar.alias}: {e}")
-
-                    # STEP 2: Process events through normal pipeline
-                    for i, event_data in enumerate(events):
-                        try:
-                            # Parse event
-                            parsed_event = self.event_parser.parse_event(event_data)
-
-                            # Apply enrichment data from CalendarRepairer if available
-                            if i < len(repair_results) and repair_results[i].enrichment_data:
-                                enrichment = repair_results[i].enrichment_data
-                                # Merge enrichment data into parsed event
-                                if 'event_type' in enrichment:
-                                    parsed_event.event_type = enrichment['event_type']
-                                if 'tags' in enrichment:
-                                    parsed_event.tags.extend(enrichment['tags'])
-                                if 'sub_tasks' in enrichment:
-                                    parsed_event.sub_tasks.extend(enrichment['sub_tasks'])
-
-                            # Process through plugins (KeywordEnricher, command_handler, etc.)
-                            processed_event = await self.plugins.process_event_through_plugins(parsed_event)
-
-                            # Check if event was processed as command (None return = delete event)
-                            if processed_event is None:
-                                await self._consume_calendar_event(parsed_event, calendar)
-                                processed_count += 1
-                                continue
-
-                            chronos_event = processed_event
-
-                            # Save to database
-                            async with db_service.get_session() as session:
-                                existing = None
-                                if chronos_event.id:
-                                    existing = await session.get(ChronosEventDB, chronos_event.id)
-
-                                db_event = chronos_event.to_db_model()
-
-                                if existing:
-                                    # Update existing
-                                    for key, value in db_event.__dict__.items():
-                                        if not key.startswith('_') and key != 'id':
-                                            setattr(existing, key, value)
-                                    updated_count += 1
-                                else:
-                                    # Create new
-                                    session.add(db_event)
-                                    created_count += 1
-
-                                await session.commit()
-
-                            processed_count += 1
-
-                        except Exception as e:
-                            self.logger.warning(f"Error processing event {event_data.get('id', 'unknown')} in {calendar.alias}: {e}")
-
-                    total_processed += processed_count
-                    total_created += created_count
-                    total_updated += updated_count
-
-                    self.logger.info(f"Calendar {calendar.alias} sync: {processed_count} processed, {created_count} created, {updated_count} updated")
+
+                    # Only advance the token once every change it covers has been
+                    # applied; the backend will not report skipped changes again
+                    if event_result.sync_token and processed_count == len(events):
+                        # A delta keeps the window of the listing it continues
+                        window = sync_states[calendar.id][1:] if incremental else (since, until)
+                        new_sync_states[calendar.id] = (event_result.sync_token, *window)
+                    elif event_result.sync_token:
+                        self.logger.warning(
+                            f"{len(events) - processed_count} events of {calendar.alias} failed, keeping the previous sync token"
+                        )
 
                 except Exception as e:
                     self.logger.error(f"Error syncing calendar {calendar.alias}: {e}")
+                    errors.append(f"{calendar.id}: {e}")
+                    calendar_results[calendar.id] = {'events_processed': 0, 'error': str(e)}
+                    new_sync_states.pop(calendar.id, None)
                     continue
 
+            await self._save_sync_states(new_sync_states)
+
             self.last_sync_time = datetime.utcnow()
 
             result = {
@@ -237,6 +247,9 @@ class ChronosScheduler:
                 'events_created': total_created,
                 'events_updated': total_updated,
                 'calendars_synced': len(calendars),
+                'incremental_calendars': incremental_calendars,
+                'calendar_results': calendar_results,
+                'errors': errors,
                 'sync_time': self.last_sync_time.isoformat()
             }
 
@@ -251,6 +264,182 @@ class ChronosScheduler:
                 'sync_time': datetime.utcnow().isoformat()
             }
 
+    async def _fetch_calendar_events(
+        self,
+        adapter,
+        calendar,
+        since: datetime,
+        until: datetime,
+        sync_state: Optional[Tuple[str, datetime, datetime]],
+        exact_window: bool = False
+    ) -> Tuple[Any, bool]:
+        """Fetch events for one calendar, incrementally when the stored sync state allows
+
+        Returns:
+            Tuple of (EventListResult, incremental). For full syncs the
+            result's sync_token is the collection token captured *before*
+            listing, so changes made during the listing are picked up next time.
+        """
+        if sync_state:
+            sync_token, window_start, window_end = sync_state
+            if exact_window:
+                window_covered = (window_start, window_end) == (since, until)
+            else:
+                window_covered = window_start <= since and until <= window_end
+            if window_covered:
+                delta = await adapter.sync_collection(calendar, sync_token)
+                if delta is not None:
+                    return delta, True
+                self.logger.info(f"Sync token for {calendar.alias} rejected, falling back to full sync")
+            else:
+                self.logger.info(f"Sync window for {calendar.alias} differs from the stored one, doing a full sync")
+
+        current_token = await adapter.get_sync_token(calendar)
+        event_result = await adapter.list_events(calendar=calendar, since=since, until=until)
+        if current_token:
+            event_result.sync_token = current_token
+        return event_result, False
+
+    async def _load_sync_states(self, calendar_ids: List[str]) -> Dict[str, Tuple[str, datetime, datetime]]:
+        """Load stored (sync token, window start, window end) for the given calendars"""
+        try:
+            async with db_service.get_session() as session:
+                result = await session.execute(
+                    select(
+                        CalendarSyncStateDB.calendar_id, CalendarSyncStateDB.sync_token,
+                        CalendarSyncStateDB.window_start, CalendarSyncStateDB.window_end
+                    )
+                    .where(CalendarSyncStateDB.calendar_id.in_(calendar_ids))
+                )
+                # Tokens without a recorded window cannot vouch for any range
+                return {
+                    calendar_id: (token, window_start, window_end)
+                    for calendar_id, token, window_start, window_end in result.all()
+                    if token and window_start and window_end
+                }
+        except Exception as e:
+            self.logger.warning(f"Could not load calendar sync state: {e}")
+            return {}
+
+    async def _save_sync_states(self, sync_states: Dict[str, Tuple[str, datetime, datetime]]):
+        """Persist sync tokens and their windows returned by the latest sync"""
+        if not sync_states:
+            return
+        try:
+            async with db_service.get_session() as session:
+                for calendar_id, (token, window_start, window_end) in sync_states.items():
+                    await session.merge(CalendarSyncStateDB(
+                        calendar_id=calendar_id,
+                        sync_token=token,
+                        window_start=window_start,
+                        window_end=window_end,
+                        updated_at=datetime.utcnow()
+                    ))
+        except Exception as e:
+            self.logger.warning(f"Could not save calendar sync state: {e}")
+
+    async def _delete_removed_events(self, calendar, event_ids: List[str]) -> int:
+        """Delete events the backend reported as removed from a calendar
+
+        Scoped to the calendar so a UID reported gone in one calendar cannot
+        remove another calendar's event.
+        """
+        async with db_service.get_session() as session:
+            result = await session.execute(
+                select(ChronosEventDB).where(
+                    ChronosEventDB.calendar_id == calendar.id,
+                    ChronosEventDB.id.in_(event_ids)
+                )
+            )
+            removed = result.scalars().all()
+            for db_event in removed:
+                await session.delete(db_event)
+            await session.commit()
+
+        if removed:
+            self.logger.info(f"Removed {len(removed)} deleted events of {calendar.alias} from database")
+        return len(removed)
+
+    async def _process_calendar_events(self, calendar, events: List[Dict[str, Any]]):
+        """Run fetched events of one calendar through repairer, plugins and database
+
+        Returns:
+            Tuple of (processed, created, updated) counts
+        """
+        processed_count = 0
+        created_count = 0
+        updated_count = 0
+
+        # STEP 1: Calendar Repairer - repair keyword events FIRST
+        repair_results = []
+        if self.calendar_repairer and self.calendar_repairer.enabled:
+            self.logger.info(f"Running Calendar Repairer for {calendar.alias}...")
+            try:
+                repair_results = await self.calendar_repairer.process_events(events, calendar)
+                repaired_count = sum(1 for r in repair_results if r.patched)
+                if repaired_count > 0:
+                    self.logger.info(f"Calendar Repairer processed {repaired_count} events in {calendar.alias}")
+            except Exception as e:
+                self.logger.error(f"Calendar Repairer failed for {calendar.alias}: {e}")
+
+        # STEP 2: Process events through normal pipeline
+        for i, event_data in enumerate(events):
+            try:
+                # Parse event; synced events belong to the calendar they came from
+                parsed_event = self.event_parser.parse_event(event_data)
+                parsed_event.calendar_id = calendar.id
+
+                # Apply enrichment data from CalendarRepairer if available
+                if i < len(repair_results) and repair_results[i].enrichment_data:
+                    enrichment = repair_results[i].enrichment_data
+                    # Merge enrichment data into parsed event
+                    if 'event_type' in enrichment:
+                        parsed_event.event_type = enrichment['event_type']
+                    if 'tags' in enrichment:
+                        parsed_event.tags.extend(enrichment['tags'])
+                    if 'sub_tasks' in enrichment:
+                        parsed_event.sub_tasks.extend(enrichment['sub_tasks'])
+
+                # Process through plugins (KeywordEnricher, command_handler, etc.)
+                processed_event = await self.plugins.process_event_through_plugins(parsed_event)
+
+                # Check if event was processed as command (None return = delete event)
+                if processed_event is None:
+                    await self._consume_calendar_event(parsed_event, calendar)
+                    processed_count += 1
+                    continue
+
+                chronos_event = processed_event
+
+                # Save to database
+                async with db_service.get_session() as session:
+                    existing = None
+                    if chronos_event.id:
+                        existing = await session.get(ChronosEventDB, chronos_event.id)
+
+                    db_event = chronos_event.to_db_model()
+
+                    if existing:
+                        # Update existing
+                        for key, value in db_event.__dict__.items():
+                            if not key.startswith('_') and key != 'id':
+                                setattr(existing, key, value)
+                        updated_count += 1
+                    else:
+                        # Create new
+                        session.add(db_event)
+                        created_count += 1
+
+                    await session.commit()
+
+                processed_count += 1
+
+            except Exception as e:
+                self.logger.warning(f"Error processing event {event_data.get('id', 'unknown')} in {calendar.alias}: {e}")
+
+        self.logger.info(f"Calendar {calendar.alias} sync: {processed_count} processed, {created_count} created, {updated_count} updated")
+        return processed_count, created_count, updated_count
+
     async def sync_events(self, incremental: bool = True, days_ahead: int = 7) -> Dict[str, Any]:
         """Sync events with optional incremental mode - compatibility wrapper for API"""
         try:
@@ -3,12 +3,15 @@ SourceAdapter Interface for Calendar Backends
 Unified interface for Google Calendar and CalDAV/Radicale integration
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+from typing import Awaitable, Dict, Any, Iterable, List, Optional, Tuple, TypeVar, Union
 import logging
 
+T = TypeVar('T')
+
 
 @dataclass
 class CalendarRef:
@@ -35,6 +38,7 @@ class EventListResult:
     events: List[Dict[str, Any]]           # Normalized event objects
     next_page_token: Optional[str] = None  # For pagination
     sync_token: Optional[str] = None       # For incremental sync
+    deleted_ids: List[str] = field(default_factory=list)  # Removed since the sync token (incremental only)
 
 
 class SourceAdapter(ABC):
@@ -45,6 +49,9 @@ class SourceAdapter(ABC):
     All events are normalized to internal format with UTC timestamps and timezone info.
     """
 
+    # Upper bound for concurrent requests when fanning out across calendars
+    max_concurrency: int = 8
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -88,6 +95,37 @@ class SourceAdapter(ABC):
         """Get single event by ID"""
         pass
 
+    async def freebusy(
+        self,
+        calendar: CalendarRef,
+        start: datetime,
+        end: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Get busy periods in [start, end) as sorted (start, end) tuples in naive UTC
+
+        Derived from a full event listing; adapters with a native
+        free/busy query should override this.
+        """
+        result = await self.list_events(calendar, since=start, until=end)
+        return sorted(
+            (event['start_time'], event['end_time'])
+            for event in result.events
+            if event.get('start_time') and event.get('end_time')
+        )
+
+    async def multiget_events(self, calendar: CalendarRef, event_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several events by ID, skipping IDs that are not found
+
+        Adapters that can fetch many events in one round trip should override this.
+        """
+        events = []
+        for event_id in event_ids:
+            event = await self.get_event(calendar, event_id)
+            if event:
+                events.append(event)
+        return events
+
     @abstractmethod
     async def patch_event(
         self,
@@ -201,6 +239,21 @@ class SourceAdapter(ABC):
         # Default implementation - to be overridden by adapters
         return event
 
+    async def get_sync_token(self, calendar: CalendarRef) -> Optional[str]:
+        """Get the calendar's current sync token, or None if unsupported"""
+        return None
+
+    async def sync_collection(self, calendar: CalendarRef, sync_token: str) -> Optional[EventListResult]:
+        """
+        List changes since sync_token
+
+        Returns:
+            EventListResult with changed events and the new sync token, or
+            None if incremental sync is unsupported or the token was rejected
+            (caller should fall back to a full sync)
+        """
+        return None
+
     async def validate_connection(self) -> bool:
         """Test if adapter can connect to backend"""
         try:
@@ -271,4 +324,22 @@ def extract_timezone_from_event(event: Dict[str, Any], backend_type: str) -> str
         # Look in start.timeZone
         start = event.get('start', {})
         return start.get('timeZone', 'UTC')
-    return "UTC"
\ No newline at end of file
+    return "UTC"
+
+
+async def gather_bounded(aws: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """
+    Await all awaitables concurrently, at most `limit` at a time
+
+    Runs in an asyncio.TaskGroup, so the first failure cancels the
+    remaining tasks. Results are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [task_group.create_task(run(aw)) for aw in aws]
+    return [task.result() for task in tasks]
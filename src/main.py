@@ -14,7 +14,7 @@ from typing import Dict, Any
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
 
@@ -25,11 +25,12 @@ from src.config.config_loader import load_config
 
 # Import core components
 from src.core.database import db_service
+from src.core.models import ChronosEventDB
 from src.core.scheduler import ChronosScheduler
 
 # Import API routes (new modular structure)
 from src.api import events, caldav, sync, commands, admin, admin_workflows, email_templates, whitelists
-from src.api.dependencies import init_api_dependencies
+from src.api.dependencies import APIKeyMiddleware, init_api_dependencies
 from src.api.error_handling import (
     api_error_handler, http_exception_handler, validation_exception_handler,
     general_exception_handler, APIError
@@ -108,9 +109,17 @@ class ChronosApp:
             title="Chronos Engine v2.2",
             description="Advanced Calendar Management with AI-powered optimization and Complete GUI Integration",
             version="2.2.0",
-            lifespan=lifespan
+            lifespan=lifespan,
+            default_response_class=ORJSONResponse
         )
         
+        # Reject unauthenticated /api/v1 calls before routing; registered before
+        # CORS so the CORS middleware stays outermost and decorates 401s too
+        self.app.add_middleware(
+            APIKeyMiddleware,
+            exempt_paths=("/api/v1/sync/health", "/api/v1/dashboard-data")
+        )
+
         # Configure CORS
         self.app.add_middleware(
             CORSMiddleware,
@@ -128,7 +137,7 @@ class ChronosApp:
         # Initialize API dependencies
         # Check legacy field first, then nested api.api_key
         api_key = config.get('api_key') or config.get('api', {}).get('api_key', 'development-key')
-        init_api_dependencies(api_key, self.scheduler)
+        init_api_dependencies(self.app, api_key, self.scheduler)
 
         # Add enhanced error handlers
         from fastapi.exceptions import RequestValidationError
@@ -156,14 +165,14 @@ class ChronosApp:
         self.app.include_router(v2_router, tags=["API v2"])
 
         # Initialize dashboard
-        dashboard = ChronosDashboard(
+        self.dashboard = ChronosDashboard(
             analytics_engine=self.scheduler.analytics,
             timebox_engine=self.scheduler.timebox,
             replan_engine=self.scheduler.replan
         )
 
         # Register dashboard and n8n routes
-        self.app.include_router(dashboard.router)
+        self.app.include_router(self.dashboard.router)
         self.app.include_router(n8n_webhook_api.router)
         
         # Serve static files
@@ -222,8 +231,6 @@ class ChronosApp:
 
                 # Check database connectivity
                 try:
-                    from src.core.models import ChronosEventDB
-
                     async with db_service.get_session() as session:
                         # Test a simple query using async SQLAlchemy API
                         result = await session.execute(select(ChronosEventDB).limit(1))
@@ -281,6 +288,15 @@ class ChronosApp:
             except Exception as e:
                 raise HTTPException(status_code=503, detail=f"Service unhealthy: {e}")
 
+        # Database pool health endpoint
+        @self.app.get("/health/db")
+        async def database_health():
+            """Report connection pool usage so pool exhaustion is observable"""
+            return {
+                "timestamp": datetime.utcnow().isoformat(),
+                "pool": db_service.pool_status()
+            }
+
         # GUI Client endpoint
         @self.app.get("/client", response_class=HTMLResponse)
         async def gui_client():
@@ -353,6 +369,9 @@ class ChronosApp:
         # Start scheduler
         await self.scheduler.start()
         logger.info("Scheduler started")
+
+        # Keep dashboard data warm off the request path
+        self.dashboard.start_background_refresh()
         
         logger.info("Chronos Engine v2.2 started successfully")
     
@@ -363,6 +382,8 @@ class ChronosApp:
         # Stop scheduler
         await self.scheduler.stop()
         logger.info("Scheduler stopped")
+
+        await self.dashboard.stop_background_refresh()
         
         # Close database
         await db_service.close()
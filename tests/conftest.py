@@ -12,10 +12,10 @@ import tempfile
 from httpx import AsyncClient
 from fastapi.testclient import TestClient
 
-from src.core.models import ChronosEvent, Priority, EventType, EventStatus
+from src.core.models import Base, ChronosEvent, Priority, EventType, EventStatus
 from src.core.analytics_engine import AnalyticsEngine
 from src.core.event_parser import EventParser
-from src.core.database import db_service
+from src.core.database import DatabaseService, db_service
 from src.main import create_app
 from src.config.config_loader import load_config
 
@@ -167,6 +167,19 @@ async def client(test_app):
         yield ac
 
 
+@pytest.fixture
+async def memory_db():
+    """Empty in-memory SQLite database with the full schema
+
+    Unit tests patch it over the db_service of the module under test.
+    """
+    service = DatabaseService("sqlite+aiosqlite:///:memory:")
+    async with service.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield service
+    await service.close()
+
+
 # CalDAV-specific fixtures
 from src.core.source_adapter import CalendarRef, AdapterCapabilities, EventListResult
 from src.core.caldav_adapter import CalDAVAdapter
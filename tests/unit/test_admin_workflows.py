@@ -0,0 +1,103 @@
+"""
+Unit tests for the admin workflows API router
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import src.api.admin_workflows as admin_workflows
+from src.api.dependencies import verify_api_key
+from src.core.models import WorkflowDB, WorkflowExecutionDB
+
+
+@pytest.fixture
+def workflow_db(memory_db, monkeypatch):
+    """In-memory database wired into the admin workflows router"""
+    monkeypatch.setattr(admin_workflows, "db_service", memory_db)
+    return memory_db
+
+
+@pytest.fixture
+def client(workflow_db):
+    """TestClient for the admin workflows router with auth bypassed"""
+    app = FastAPI()
+    app.include_router(admin_workflows.router)
+    app.dependency_overrides[verify_api_key] = lambda: True
+    return TestClient(app)
+
+
+class TestAdminWorkflowsAPI:
+    """Test admin workflow endpoints"""
+
+    def test_create_defaults_triggers_and_actions(self, client):
+        """Test omitted triggers/actions come back as empty lists"""
+        response = client.post("/admin/workflows/", json={"name": "Minimal"})
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["triggers"] == []
+        assert data["actions"] == []
+
+    async def test_db_default_for_triggers_and_actions(self, workflow_db):
+        """Test WorkflowDB rows default triggers/actions to []"""
+        async with workflow_db.get_session() as session:
+            session.add(WorkflowDB(name="Raw"))
+        async with workflow_db.get_session() as session:
+            db_workflow = await session.get(WorkflowDB, 1)
+
+        assert db_workflow.triggers == []
+        assert db_workflow.actions == []
+
+    async def test_json_null_triggers_and_actions_read_as_empty(self, client, workflow_db):
+        """Test legacy rows holding JSON null still serialize"""
+        async with workflow_db.get_session() as session:
+            await session.execute(text(
+                "INSERT INTO workflows (name, status, triggers, actions, execution_count, "
+                "success_rate, avg_runtime, created_at, updated_at) "
+                "VALUES ('Legacy', 'active', 'null', 'null', 0, 0, 0, :now, :now)"
+            ), {"now": datetime.utcnow()})
+
+        response = client.get("/admin/workflows/1")
+
+        assert response.status_code == 200
+        assert response.json()["triggers"] == []
+        assert response.json()["actions"] == []
+
+    def test_list_filters_and_orders(self, client):
+        """Test status filter, ordering and optional total"""
+        client.post("/admin/workflows/", json={"name": "First", "status": "paused"})
+        client.post("/admin/workflows/", json={"name": "Second", "status": "active"})
+        client.post("/admin/workflows/", json={"name": "Third", "status": "paused"})
+
+        data = client.get("/admin/workflows/", params={"status": "paused"}).json()
+        assert data["total"] == 2
+        assert [w["name"] for w in data["workflows"]] == ["Third", "First"]
+
+        data = client.get("/admin/workflows/", params={"include_total": "false"}).json()
+        assert data["total"] is None
+        assert len(data["workflows"]) == 3
+
+    def test_get_missing_workflow_returns_404(self, client):
+        """Test handle_api_errors passes HTTPExceptions through"""
+        response = client.get("/admin/workflows/999")
+        assert response.status_code == 404
+
+    async def test_executions_are_limited_and_ordered(self, client, workflow_db):
+        """Test executions endpoint streams the newest rows first"""
+        client.post("/admin/workflows/", json={"name": "With runs"})
+
+        start = datetime(2025, 1, 1)
+        async with workflow_db.get_session() as session:
+            for i in range(100):
+                session.add(WorkflowExecutionDB(
+                    workflow_id=1, status="success", result_data={"run": i},
+                    executed_at=start + timedelta(minutes=i)
+                ))
+
+        executions = client.get("/admin/workflows/1/executions", params={"limit": 70}).json()
+        assert len(executions) == 70
+        assert executions[0]["result_data"] == {"run": 99}
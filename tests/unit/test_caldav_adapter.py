@@ -596,6 +596,97 @@ END:VCALENDAR</cal:calendar-data>
             assert '20250125T000000Z' in request_body
 
 
+    @pytest.mark.asyncio
+    async def test_multiget_events(self, caldav_adapter, test_calendar_ref):
+        """Test calendar-multiget fetches UIDs in one REPORT and falls back to a listing"""
+        multiget_response = """<?xml version="1.0" encoding="utf-8"?>
+<d:multistatus xmlns:d="DAV:" xmlns:cal="urn:ietf:params:xml:ns:caldav">
+    <d:response>
+        <d:href>/user/synctest/event1.ics</d:href>
+        <d:propstat>
+            <d:prop>
+                <d:getetag>"etag1"</d:getetag>
+                <cal:calendar-data>BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:event1
+SUMMARY:Event 1
+DTSTART:20250115T100000Z
+DTEND:20250115T110000Z
+END:VEVENT
+END:VCALENDAR</cal:calendar-data>
+            </d:prop>
+            <d:status>HTTP/1.1 200 OK</d:status>
+        </d:propstat>
+    </d:response>
+    <d:response>
+        <d:href>/user/synctest/other.ics</d:href>
+        <d:status>HTTP/1.1 404 Not Found</d:status>
+    </d:response>
+</d:multistatus>"""
+
+        with patch.object(caldav_adapter, '_get_session') as mock_session, \
+             patch.object(caldav_adapter, 'list_events', new_callable=AsyncMock) as mock_list:
+            mock_response = AsyncMock()
+            mock_response.status = 207
+            mock_response.text.return_value = multiget_response
+
+            mock_session_instance = AsyncMock()
+            mock_session_instance.request = MagicMock()
+            mock_session_instance.request.return_value.__aenter__.return_value = mock_response
+            mock_session.return_value = mock_session_instance
+            mock_list.return_value = EventListResult(events=[{'id': 'other', 'uid': 'other'}])
+
+            events = await caldav_adapter.multiget_events(test_calendar_ref, ['event1', 'other', 'gone'])
+
+            assert [event['id'] for event in events] == ['event1', 'other']
+            mock_session_instance.request.assert_called_once()
+            call_args = mock_session_instance.request.call_args
+            assert call_args[0][0] == 'REPORT'
+            assert '<d:href>/user/synctest/event1.ics</d:href>' in call_args[1]['data']
+            mock_list.assert_awaited_once()
+
+    def test_parse_freebusy(self):
+        """Test VFREEBUSY periods are returned as sorted naive UTC tuples, skipping FREE"""
+        freebusy_ics = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VFREEBUSY
+DTSTART:20250115T000000Z
+DTEND:20250116T000000Z
+FREEBUSY;FBTYPE=BUSY:20250115T140000Z/PT30M,20250115T100000Z/20250115T110000Z
+FREEBUSY;FBTYPE=FREE:20250115T120000Z/20250115T130000Z
+END:VFREEBUSY
+END:VCALENDAR"""
+
+        assert CalDAVAdapter._parse_freebusy(freebusy_ics) == [
+            (datetime(2025, 1, 15, 10, 0), datetime(2025, 1, 15, 11, 0)),
+            (datetime(2025, 1, 15, 14, 0), datetime(2025, 1, 15, 14, 30)),
+        ]
+    def test_sync_collection_reports_removed_members(self, caldav_adapter, test_calendar_ref):
+        """Test 404 members of a sync-collection response become deleted UIDs"""
+        sync_response = """<?xml version="1.0" encoding="utf-8"?>
+<d:multistatus xmlns:d="DAV:" xmlns:cal="urn:ietf:params:xml:ns:caldav">
+    <d:response>
+        <d:href>/user/collection/gone%40example.com.ics</d:href>
+        <d:status>HTTP/1.1 404 Not Found</d:status>
+    </d:response>
+    <d:response>
+        <d:href>/user/collection/also-gone.ics</d:href>
+        <d:propstat>
+            <d:prop><d:getetag/></d:prop>
+            <d:status>HTTP/1.1 404 Not Found</d:status>
+        </d:propstat>
+    </d:response>
+    <d:sync-token>http://radicale.test/sync/2</d:sync-token>
+</d:multistatus>"""
+
+        result = caldav_adapter._parse_multistatus_response(sync_response, test_calendar_ref)
+
+        assert result.events == []
+        assert result.deleted_ids == ['gone@example.com', 'also-gone']
+        assert result.sync_token == 'http://radicale.test/sync/2'
+
+
 class TestCalDAVErrorHandling:
     """Test CalDAV error handling and resilience"""
 
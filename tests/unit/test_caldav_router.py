@@ -0,0 +1,358 @@
+"""
+Unit tests for the modular CalDAV API router
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import ANY, AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import src.api.caldav as caldav_api
+from src.api.dependencies import APIAuthenticator, get_scheduler, verify_api_key
+from src.core.source_adapter import AdapterCapabilities, CalendarRef
+
+
+@pytest.fixture
+def calendar_refs():
+    """Writable and read-only calendar references"""
+    return [
+        CalendarRef(id='automation', alias='Automation',
+                    url='http://radicale.local/user/automation/', timezone='Europe/Berlin'),
+        CalendarRef(id='special', alias='Special',
+                    url='http://radicale.local/user/special/', read_only=True,
+                    timezone='Europe/Berlin')
+    ]
+
+
+@pytest.fixture
+def adapter(calendar_refs):
+    """Adapter double exposing the SourceAdapter coroutines used by the router"""
+    adapter = Mock(max_concurrency=2)
+    adapter.list_calendars = AsyncMock(return_value=calendar_refs)
+    adapter.capabilities = AsyncMock(return_value=AdapterCapabilities(
+        name="CalDAV/Radicale", can_write=True, supports_sync_token=True,
+        timezone="Europe/Berlin"
+    ))
+    adapter.create_event = AsyncMock(return_value="new-uid")
+    adapter.get_event = AsyncMock(return_value={"uid": "evt-1", "etag": "abc"})
+    adapter.multiget_events = AsyncMock(return_value=[{"uid": "evt-1", "etag": "abc"}])
+    adapter.freebusy = AsyncMock(return_value=[(datetime(2025, 1, 15, 10), datetime(2025, 1, 15, 11))])
+    adapter.patch_event = AsyncMock(return_value="etag-2")
+    adapter.delete_event = AsyncMock(return_value=True)
+    return adapter
+
+
+@pytest.fixture
+def scheduler(adapter):
+    """Scheduler double wired to the adapter"""
+    scheduler = Mock()
+    scheduler.source_manager.adapter = adapter
+    scheduler.sync_calendar = AsyncMock(return_value={"events_processed": 3, "errors": []})
+    return scheduler
+
+
+@pytest.fixture
+def client(scheduler):
+    """TestClient for the CalDAV router with auth bypassed"""
+    caldav_api.invalidate_calendar_cache()
+    caldav_api.clear_dav_client_pool()
+    app = FastAPI()
+    app.include_router(caldav_api.router, prefix="/caldav")
+    app.dependency_overrides[verify_api_key] = lambda: True
+    app.dependency_overrides[get_scheduler] = lambda: scheduler
+    yield TestClient(app)
+    caldav_api.invalidate_calendar_cache()
+    caldav_api.clear_dav_client_pool()
+
+
+class TestCalendarCache:
+    """Test calendar listing cache used to resolve calendar IDs"""
+
+    def test_calendar_listing_is_cached(self, client, adapter):
+        """Test repeated calendar-scoped requests reuse one listing"""
+        client.get("/caldav/calendars")
+        client.get("/caldav/calendars/automation/events/evt-1")
+        client.delete("/caldav/calendars/automation/events/evt-1")
+
+        assert adapter.list_calendars.await_count == 1
+
+    def test_calendar_listing_sets_cache_control(self, client):
+        """Test GET /calendars is cacheable by clients"""
+        response = client.get("/caldav/calendars")
+
+        assert response.status_code == 200
+        assert response.json()["total_count"] == 2
+        assert "max-age=60" in response.headers["Cache-Control"]
+
+    def test_calendar_listing_paging(self, client):
+        """Test limit/offset page through calendars sorted by ID"""
+        data = client.get("/caldav/calendars", params={"limit": 1, "offset": 1}).json()
+
+        assert [cal["id"] for cal in data["calendars"]] == ["special"]
+        assert data["total_count"] == 2
+
+    def test_calendar_listing_ndjson(self, client):
+        """Test NDJSON clients get one calendar per line"""
+        response = client.get("/caldav/calendars", headers={"Accept": "application/x-ndjson"})
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["X-Total-Count"] == "2"
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == ["automation", "special"]
+
+    def test_capabilities_built_once(self, client, adapter):
+        """Test /backend/info reuses the adapter's capabilities payload"""
+        client.get("/caldav/backend/info")
+        response = client.get("/caldav/backend/info")
+
+        assert response.json()["capabilities"]["name"] == "CalDAV/Radicale"
+        assert adapter.capabilities.await_count == 1
+
+    def test_cache_expires_after_ttl(self, client, adapter, monkeypatch):
+        """Test listings are refreshed once the TTL has elapsed"""
+        client.get("/caldav/calendars")
+        monkeypatch.setattr(caldav_api, "CALENDAR_CACHE_TTL_SECONDS", 0)
+        client.get("/caldav/calendars")
+
+        assert adapter.list_calendars.await_count == 2
+
+    def test_unknown_calendar_returns_404(self, client):
+        """Test missing calendar IDs are rejected"""
+        response = client.get("/caldav/calendars/missing/events/evt-1")
+        assert response.status_code == 404
+
+    def test_auth_checked_before_calendar_lookup(self, scheduler, adapter):
+        """Test unauthenticated callers get 401, not a 404/403 revealing calendar ids"""
+        caldav_api.invalidate_calendar_cache()
+        app = FastAPI()
+        app.include_router(caldav_api.router, prefix="/caldav")
+        app.state.authenticator = APIAuthenticator("secret")
+        app.dependency_overrides[get_scheduler] = lambda: scheduler
+        client = TestClient(app)
+
+        assert client.get("/caldav/calendars/missing/events/evt-1").status_code == 401
+        assert client.delete("/caldav/calendars/special/events/evt-1").status_code == 401
+        assert client.post("/caldav/calendars/missing/sync").status_code == 401
+        adapter.list_calendars.assert_not_awaited()
+
+        response = client.get("/caldav/calendars/missing/events/evt-1",
+                              headers={"Authorization": "Bearer secret"})
+        assert response.status_code == 404
+        caldav_api.invalidate_calendar_cache()
+
+    def test_create_event_parses_iso_datetimes(self, client, adapter):
+        """Test start/end are parsed into aware datetimes, including "Z" suffixes"""
+        response = client.post("/caldav/calendars/automation/events", json={
+            "summary": "Standup", "start_time": "2025-01-15T10:00:00Z", "end_time": "2025-01-15T10:15:00Z"
+        })
+
+        assert response.status_code == 200
+        event_data = adapter.create_event.await_args.args[1]
+        assert event_data["start_time"] == datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc)
+
+        response = client.post("/caldav/calendars/automation/events", json={
+            "summary": "Broken", "start_time": "not a date", "end_time": "2025-01-15T10:15:00Z"
+        })
+        assert response.status_code == 422
+
+    def test_batch_get_events(self, client, adapter, calendar_refs):
+        """Test batchGet fetches deduplicated IDs in one adapter call"""
+        response = client.post("/caldav/calendars/automation/events:batchGet",
+                               json={"event_ids": ["evt-1", "evt-2", "evt-1"]})
+
+        assert response.status_code == 200
+        assert response.json()["missing"] == ["evt-2"]
+        adapter.multiget_events.assert_awaited_once_with(calendar_refs[0], ["evt-1", "evt-2"])
+
+    def test_freebusy_all_calendars(self, client, adapter):
+        """Test "*" queries free/busy for every calendar"""
+        response = client.get("/caldav/calendars/*/freebusy", params={
+            "start": "2025-01-15T00:00:00Z", "end": "2025-01-16T00:00:00Z"
+        })
+
+        assert response.status_code == 200
+        busy = response.json()["busy"]
+        assert set(busy) == {"automation", "special"}
+        assert busy["automation"] == [{"start": "2025-01-15T10:00:00", "end": "2025-01-15T11:00:00"}]
+        assert adapter.freebusy.await_count == 2
+
+    def test_read_only_calendar_rejects_writes(self, client):
+        """Test writes to read-only calendars are rejected"""
+        response = client.delete("/caldav/calendars/special/events/evt-1")
+        assert response.status_code == 403
+
+
+class TestConditionalRequests:
+    """Test ETag/If-None-Match handling on cacheable GET endpoints"""
+
+    def test_event_etag_from_backend(self, client):
+        """Test the event ETag is derived from the backend etag"""
+        response = client.get("/caldav/calendars/automation/events/evt-1")
+
+        assert response.headers["ETag"] == 'W/"abc"'
+        assert "max-age=60" in response.headers["Cache-Control"]
+
+        response = client.get("/caldav/calendars/automation/events/evt-1",
+                              headers={"If-None-Match": '"abc"'})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_event_body_serialized_with_orjson(self, client, adapter):
+        """Test free-form event data (e.g. datetimes) is serialized natively"""
+        adapter.get_event.return_value = {"uid": "evt-1", "start": datetime(2025, 1, 15, 10, 0)}
+
+        response = client.get("/caldav/calendars/automation/events/evt-1")
+
+        assert response.json()["event"]["start"] == "2025-01-15T10:00:00"
+        assert response.headers["Cache-Control"] == "private, max-age=60"
+
+    def test_calendar_listing_revalidates(self, client):
+        """Test the calendar collection ETag yields 304 until calendars change"""
+        etag = client.get("/caldav/calendars").headers["ETag"]
+
+        response = client.get("/caldav/calendars", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = client.get("/caldav/backend/info", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+class TestCalendarSync:
+    """Test manual calendar sync endpoint"""
+
+    def test_sync_single_calendar(self, client, scheduler):
+        """Test syncing one calendar restricts the scheduler to it"""
+        response = client.post("/caldav/calendars/automation/sync")
+
+        assert response.status_code == 200
+        assert response.json()["sync_details"]["events_processed"] == 3
+        scheduler.sync_calendar.assert_awaited_once_with(
+            force_refresh=False, calendar_ids=["automation"], since=ANY, until=ANY, exact_window=False
+        )
+
+    def test_sync_all_calendars(self, client, scheduler):
+        """Test "*" syncs every calendar"""
+        response = client.post("/caldav/calendars/*/sync")
+
+        assert response.status_code == 200
+        scheduler.sync_calendar.assert_awaited_once_with(
+            force_refresh=False, calendar_ids=None, since=ANY, until=ANY, exact_window=False
+        )
+
+    def test_batch_sync(self, client, scheduler):
+        """Test batchSync runs one scheduler sync for the deduplicated calendars"""
+        response = client.post("/caldav/calendars:batchSync",
+                               json={"calendar_ids": ["special", "automation", "special"]})
+
+        assert response.status_code == 200
+        assert scheduler.sync_calendar.await_args.kwargs["calendar_ids"] == ["special", "automation"]
+
+        response = client.post("/caldav/calendars:batchSync", json={"calendar_ids": ["automation", "missing"]})
+        assert response.status_code == 404
+        assert scheduler.sync_calendar.await_count == 1
+
+    def test_sync_time_range(self, client, scheduler):
+        """Test start/end are normalized to UTC and passed to the scheduler"""
+        response = client.post("/caldav/calendars/automation/sync", params={
+            "start": "2025-01-01T01:00:00+01:00", "end": "2025-03-01T00:00:00Z"
+        })
+
+        assert response.status_code == 200
+        kwargs = scheduler.sync_calendar.await_args.kwargs
+        assert kwargs["since"] == datetime(2025, 1, 1)
+        assert kwargs["until"] == datetime(2025, 3, 1)
+        assert kwargs["exact_window"] is True
+
+    def test_batch_sync_explicit_window(self, client, scheduler):
+        """Test an explicit batchSync window is marked exact so stale tokens are skipped"""
+        client.post("/caldav/calendars:batchSync", json={"calendar_ids": []})
+        assert scheduler.sync_calendar.await_args.kwargs["exact_window"] is False
+
+        client.post("/caldav/calendars:batchSync", json={"calendar_ids": [], "start": "2025-01-01T00:00:00Z"})
+        assert scheduler.sync_calendar.await_args.kwargs["exact_window"] is True
+
+    def test_sync_default_window(self, client, scheduler):
+        """Test the default window spans 30 days back and 180 days ahead"""
+        client.post("/caldav/calendars/automation/sync")
+
+        kwargs = scheduler.sync_calendar.await_args.kwargs
+        assert (kwargs["until"] - kwargs["since"]).days == 210
+
+    def test_sync_rejects_inverted_window(self, client):
+        """Test end before start is rejected"""
+        response = client.post("/caldav/calendars/automation/sync", params={
+            "start": "2025-03-01T00:00:00", "end": "2025-01-01T00:00:00"
+        })
+        assert response.status_code == 400
+
+
+class TestConnectionTest:
+    """Test CalDAV connection testing endpoint"""
+
+    def test_options_probe_by_default(self, client, monkeypatch):
+        """Test the default probe is a single OPTIONS request checking the DAV header"""
+        dav_client = Mock(url="http://radicale.local/")
+        dav_client.options.return_value = Mock(status=200, headers={"DAV": "1, 2, 3, calendar-access"})
+        monkeypatch.setattr(caldav_api, "DAVClient", Mock(return_value=dav_client))
+
+        response = client.post("/caldav/test-connection", json={"server_url": "http://radicale.local/"})
+
+        assert response.json()["success"] is True
+        assert "calendar-access" in response.json()["details"]["dav"]
+        dav_client.principal.assert_not_called()
+
+        dav_client.options.return_value = Mock(status=200, headers={"DAV": "1, 2"})
+        response = client.post("/caldav/test-connection", json={"server_url": "http://radicale.local/"})
+        assert response.json()["success"] is False
+
+    def test_failed_connection_is_not_pooled(self, client, monkeypatch):
+        """Test clients that failed to connect are discarded"""
+        dav_client = Mock()
+        dav_client.options.side_effect = ConnectionError("refused")
+        dav_client_class = Mock(return_value=dav_client)
+        monkeypatch.setattr(caldav_api, "DAVClient", dav_client_class)
+
+        for _ in range(2):
+            response = client.post("/caldav/test-connection", json={"server_url": "http://radicale.local/"})
+            assert response.json()["success"] is False
+
+        assert dav_client_class.call_count == 2
+        dav_client.session.close.assert_called()
+
+    def test_missing_caldav_library(self, client, monkeypatch):
+        """Test a missing python-caldav install is reported, not raised"""
+        monkeypatch.setattr(caldav_api, "DAVClient", None)
+
+        response = client.post("/caldav/test-connection", json={"server_url": "http://radicale.local/"})
+
+        assert response.status_code == 200
+        assert response.json()["success"] is False
+        assert "not installed" in response.json()["details"]["error"]
+
+    def test_connection_runs_client_with_timeout(self, client, monkeypatch):
+        """Test the blocking DAVClient probe reports calendars and bounds requests"""
+        session = Mock()
+        send = session.request
+        principal = Mock(url="http://radicale.local/user/", calendar_home_set="http://radicale.local/user/")
+        calendar = Mock(url="http://radicale.local/user/automation/")
+        calendar.name = "Automation"
+        principal.calendars.return_value = [calendar]
+        dav_client = Mock(session=session)
+        dav_client.principal.return_value = principal
+        dav_client_class = Mock(return_value=dav_client)
+        monkeypatch.setattr(caldav_api, "DAVClient", dav_client_class)
+
+        for _ in range(2):
+            response = client.post("/caldav/test-connection", params={"deep": "true"},
+                                   json={"server_url": "http://radicale.local/"})
+
+        assert response.json()["success"] is True
+        dav_client_class.assert_called_once()
+        assert response.json()["details"]["calendar_count"] == 1
+        dav_client.session.request("PROPFIND", "http://radicale.local/")
+        send.assert_called_with(
+            "PROPFIND", "http://radicale.local/", timeout=caldav_api.CONNECTION_TEST_TIMEOUT_SECONDS
+        )
@@ -0,0 +1,178 @@
+"""
+Unit tests for the commands API router
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import src.api.commands as commands
+from src.api.dependencies import verify_api_key
+from src.core.database import DatabaseService
+from src.core.models import CommandStatus, ExternalCommandDB
+
+
+@pytest.fixture
+def command_db(memory_db, monkeypatch):
+    """In-memory database wired into the commands router"""
+    monkeypatch.setattr(commands, "db_service", memory_db)
+    return memory_db
+
+
+@pytest.fixture
+def client(command_db):
+    """TestClient for the commands router with auth bypassed"""
+    app = FastAPI()
+    app.include_router(commands.router, prefix="/commands")
+    app.dependency_overrides[verify_api_key] = lambda: True
+    return TestClient(app)
+
+
+async def add_commands(service, *rows):
+    async with service.get_session() as session:
+        session.add_all(rows)
+
+
+async def get_command(service, command_id):
+    async with service.get_session() as session:
+        return await session.get(ExternalCommandDB, command_id)
+
+
+class TestCommandsAPI:
+    """Test command polling"""
+
+    async def test_poll_claims_pending_and_stale_commands(self, client, command_db):
+        """Test pending and stale PROCESSING commands are claimed in creation order"""
+        now = datetime.utcnow()
+        await add_commands(
+            command_db,
+            ExternalCommandDB(target_system="n8n", command="stale", status=CommandStatus.PROCESSING.value,
+                              created_at=now - timedelta(hours=2), processed_at=now - timedelta(hours=1)),
+            ExternalCommandDB(target_system="n8n", command="fresh", status=CommandStatus.PROCESSING.value,
+                              created_at=now - timedelta(hours=3), processed_at=now),
+            ExternalCommandDB(target_system="n8n", command="pending", parameters={"a": 1},
+                              created_at=now - timedelta(minutes=5)),
+            ExternalCommandDB(target_system="other", command="foreign", created_at=now),
+        )
+
+        data = client.get("/commands/n8n").json()
+
+        commands.PendingCommandsResponse.model_validate(data)
+        assert data["count"] == 2
+        assert [c["command_type"] for c in data["commands"]] == ["stale", "pending"]
+        assert all(c["status"] == "processing" for c in data["commands"])
+        assert data["commands"][1]["payload"] == {"a": 1}
+        assert data["commands"][0]["payload"] == {}
+        assert data["commands"][0]["id"] == "1"
+        assert data["commands"][0]["system_id"] == "n8n"
+        assert data["commands"][0]["updated_at"] is not None
+
+        # Claimed commands are not handed out again
+        assert client.get("/commands/n8n").json()["count"] == 0
+
+    async def test_poll_respects_limit(self, client, command_db):
+        now = datetime.utcnow()
+        await add_commands(command_db, *[
+            ExternalCommandDB(target_system="n8n", command=f"c{i}", created_at=now + timedelta(seconds=i))
+            for i in range(5)
+        ])
+
+        data = client.get("/commands/n8n", params={"limit": 3}).json()
+
+        assert [c["command_type"] for c in data["commands"]] == ["c0", "c1", "c2"]
+
+
+    async def test_complete_merges_result(self, client, command_db):
+        """Test completion is a single conditional transition"""
+        await add_commands(command_db, ExternalCommandDB(
+            target_system="n8n", command="run", status=CommandStatus.PROCESSING.value, result={"keep": 1}
+        ))
+
+        response = client.post("/commands/1/complete", json={"result": {"ok": True}, "metadata": {"host": "a"}})
+
+        assert response.status_code == 200
+        assert response.json()["new_status"] == "COMPLETED"
+        row = await get_command(command_db, 1)
+        assert row.status == CommandStatus.COMPLETED.value
+        assert row.completed_at is not None
+        assert row.result == {"keep": 1, "host": "a", "completion_result": {"ok": True}}
+
+        # A second completion is rejected because the row is no longer PROCESSING
+        assert client.post("/commands/1/complete", json={}).status_code == 400
+        assert client.post("/commands/99/complete", json={}).status_code == 404
+
+    async def test_fail_with_retry_increments_counter(self, client, command_db):
+        await add_commands(command_db, ExternalCommandDB(
+            target_system="n8n", command="run", status=CommandStatus.PROCESSING.value
+        ))
+
+        response = client.post("/commands/1/fail", json={"error_message": "boom", "retry": True})
+        assert response.json()["new_status"] == CommandStatus.PENDING.value
+
+        client.get("/commands/n8n")
+        client.post("/commands/1/fail", json={"error_message": "again", "retry": True})
+
+        row = await get_command(command_db, 1)
+        assert row.status == CommandStatus.PENDING.value
+        assert row.error_message == "again"
+        assert row.result["retry_count"] == 2
+        assert row.result["error"]["message"] == "again"
+
+        assert row.result["error"]["code"] is None
+
+    async def test_result_keys_are_replaced_whole(self, client, command_db):
+        """Test nested objects are replaced, not merged, and null values are kept"""
+        await add_commands(command_db, ExternalCommandDB(
+            target_system="n8n", command="run", status=CommandStatus.PROCESSING.value,
+            result={"error": {"message": "old", "stale": True}, "completion_result": {"partial": 1}, "keep": 1}
+        ))
+
+        client.post("/commands/1/fail", json={"error_message": "boom", "metadata": {"host": None}})
+
+        row = await get_command(command_db, 1)
+        assert set(row.result["error"]) == {"message", "code", "timestamp", "retry_requested"}
+        assert row.result["error"]["code"] is None
+        assert row.result["host"] is None
+        assert row.result["completion_result"] == {"partial": 1}
+        assert row.result["keep"] == 1
+
+
+    async def test_delete_command(self, client, command_db):
+        await add_commands(command_db, ExternalCommandDB(target_system="n8n", command="run"))
+
+        assert client.delete("/commands/1").status_code == 200
+        assert await get_command(command_db, 1) is None
+        assert client.delete("/commands/1").status_code == 404
+
+
+    async def test_queue_status_counts(self, client, command_db):
+        await add_commands(
+            command_db,
+            ExternalCommandDB(target_system="n8n", command="a", created_at=datetime(2025, 1, 1)),
+            ExternalCommandDB(target_system="n8n", command="b", status=CommandStatus.FAILED.value),
+            ExternalCommandDB(target_system="other", command="c"),
+        )
+
+        data = client.get("/commands/n8n/status").json()
+
+        assert data["status_counts"] == {"pending": 1, "failed": 1}
+        assert data["total_commands"] == 2
+        assert data["oldest_pending"].startswith("2025-01-01")
+
+
+class TestDatabasePool:
+    """Test engine pool configuration"""
+
+    def test_sqlite_uses_static_pool(self, command_db):
+        assert command_db.pool_status()["pool_class"] == "StaticPool"
+
+    def test_server_database_pool_args(self):
+        args = DatabaseService._pool_args("postgresql+asyncpg://chronos@db/chronos")
+
+        assert args["pool_pre_ping"] is True
+        assert args["pool_size"] == 20
+        assert args["max_overflow"] == 20
+        assert "poolclass" not in args
+        assert args["connect_args"] == {"statement_cache_size": 0}
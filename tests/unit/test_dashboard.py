@@ -0,0 +1,77 @@
+"""
+Unit tests for the dashboard data collection
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.api.dashboard import ChronosDashboard
+
+
+@pytest.fixture
+def analytics():
+    analytics = Mock()
+    analytics.get_productivity_metrics = AsyncMock(return_value={
+        'total_events': 4, 'completion_rate': 0.5, 'average_productivity': 3.0,
+        'total_hours': 6.0, 'events_per_day': 1.0, 'completed_events': 2
+    })
+    analytics.get_priority_distribution = AsyncMock(return_value={'URGENT': 1, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 0})
+    analytics.get_time_distribution = AsyncMock(return_value={9: 2.0, 14: 4.0})
+    return analytics
+
+
+@pytest.fixture
+def dashboard(analytics):
+    return ChronosDashboard(analytics_engine=analytics, timebox_engine=Mock(), replan_engine=Mock())
+
+
+class TestDashboardData:
+    """Test dashboard data caching"""
+
+    async def test_concurrent_calls_share_one_collection(self, dashboard, analytics):
+        results = await asyncio.gather(*(dashboard._get_dashboard_data() for _ in range(5)))
+
+        assert all(result is results[0] for result in results)
+        assert analytics.get_productivity_metrics.await_count == 1
+        assert results[0]['time_distribution'] == {'9': 2.0, '14': 4.0}
+
+    async def test_cached_payload_expires(self, dashboard, analytics, monkeypatch):
+        await dashboard._get_dashboard_data()
+        await dashboard._get_dashboard_data()
+        assert analytics.get_productivity_metrics.await_count == 1
+
+        monkeypatch.setattr("src.api.dashboard.DASHBOARD_CACHE_TTL_SECONDS", 0)
+        await dashboard._get_dashboard_data()
+        assert analytics.get_productivity_metrics.await_count == 2
+
+    async def test_failing_query_only_defaults_its_section(self, dashboard, analytics):
+        analytics.get_priority_distribution = AsyncMock(side_effect=RuntimeError("db down"))
+
+        data = await dashboard._get_dashboard_data()
+
+        assert data['priority_distribution'] == {'URGENT': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
+        assert data['productivity_metrics']['total_events'] == 4
+        assert data['time_distribution'] == {'9': 2.0, '14': 4.0}
+
+    async def test_recommendations_are_memoized_copies(self, dashboard):
+        metrics = {'completion_rate': 0.5, 'events_per_day': 9.04, 'average_productivity': 3.0, 'total_hours': 400}
+
+        first = await dashboard._generate_recommendations(metrics)
+        first[0]['message'] = 'mutated'
+        second = await dashboard._generate_recommendations(dict(metrics, events_per_day=9.01))
+
+        assert second[0]['message'].startswith('Completion rate is 50.0%')
+        assert second[1]['message'].startswith('High event density (9.0 events/day)')
+        assert second[2]['type'] == 'balance'
+
+    async def test_background_refresh_warms_cache(self, dashboard, analytics):
+        dashboard.start_background_refresh()
+        await asyncio.sleep(0.01)
+        data = await dashboard._get_dashboard_data()
+        await dashboard.stop_background_refresh()
+
+        assert data['productivity_metrics']['total_events'] == 4
+        assert analytics.get_productivity_metrics.await_count == 1
+        assert dashboard._background_refresh is None
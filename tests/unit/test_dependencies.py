@@ -0,0 +1,118 @@
+"""
+Unit tests for the shared API dependencies
+"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
+
+import src.core.database as database
+from src.api.dependencies import APIAuthenticator, APIKeyMiddleware, get_db_session, get_scheduler, init_api_dependencies, verify_api_key
+from src.core.models import WorkflowDB
+
+
+def bearer(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestAPIAuthenticator:
+    """Test API key verification"""
+
+    def test_verify_api_key(self):
+        authenticator = APIAuthenticator("s3cret-key")
+
+        assert authenticator.verify_api_key(bearer("s3cret-key")) is True
+        assert authenticator.verify_api_key(bearer("s3cret-kez")) is False
+        assert authenticator.verify_api_key(bearer("")) is False
+        assert authenticator.verify_api_key(None) is False
+
+    def test_non_ascii_keys(self):
+        authenticator = APIAuthenticator("schlüssel")
+
+        assert authenticator.verify_api_key(bearer("schlüssel")) is True
+        assert authenticator.verify_api_key(bearer("schlussel")) is False
+
+    def test_plaintext_key_is_not_retained(self):
+        authenticator = APIAuthenticator("s3cret-key")
+
+        assert "s3cret-key" not in vars(authenticator).values()
+
+
+class TestAppStateDependencies:
+    """Test dependencies resolved from app.state"""
+
+    def test_dependencies_are_scoped_per_app(self):
+        scheduler = object()
+        secured, other = FastAPI(), FastAPI()
+        init_api_dependencies(secured, "key-a", scheduler)
+        init_api_dependencies(other, "key-b")
+
+        for app in (secured, other):
+            @app.get("/ping")
+            async def ping(authenticated: bool = Depends(verify_api_key)):
+                return {"ok": authenticated}
+
+        assert TestClient(secured).get("/ping", headers={"Authorization": "Bearer key-a"}).status_code == 200
+        assert TestClient(other).get("/ping", headers={"Authorization": "Bearer key-a"}).status_code == 401
+        assert secured.state.scheduler is scheduler
+
+    def test_missing_scheduler_is_reported(self):
+        app = FastAPI()
+        init_api_dependencies(app, "key")
+
+        @app.get("/scheduler")
+        async def scheduler_route(scheduler=Depends(get_scheduler)):
+            return {}
+
+        with pytest.raises(RuntimeError):
+            TestClient(app).get("/scheduler")
+
+    def test_db_session_is_shared_and_committed(self, memory_db, monkeypatch):
+        monkeypatch.setattr(database, "db_service", memory_db)
+        app = FastAPI()
+        committed = []
+
+        @app.post("/workflows")
+        async def create_workflow(session=Depends(get_db_session)):
+            session.add(WorkflowDB(name="Nightly"))
+            return {}
+
+        @app.get("/workflows")
+        async def list_workflows(session=Depends(get_db_session)):
+            committed.append(await session.get(WorkflowDB, 1))
+            return {}
+
+        with TestClient(app) as client:
+            client.post("/workflows")
+            client.get("/workflows")
+
+        assert get_db_session is database.get_db_session
+        assert committed[0].name == "Nightly"
+
+    def test_middleware_rejects_before_dependencies(self):
+        app = FastAPI()
+        app.add_middleware(APIKeyMiddleware, exempt_paths=("/api/v1/health",))
+        init_api_dependencies(app, "key-a", object())
+        calls = []
+
+        async def tracking_dependency():
+            calls.append(True)
+
+        @app.get("/api/v1/ping", dependencies=[Depends(tracking_dependency), Depends(verify_api_key)])
+        async def ping():
+            return {"ok": True}
+
+        @app.get("/api/v1/health")
+        async def health():
+            return {"ok": True}
+
+        client = TestClient(app)
+        rejected = client.get("/api/v1/ping", headers={"Authorization": "Bearer wrong"})
+        assert rejected.status_code == 401
+        assert rejected.headers["WWW-Authenticate"] == "Bearer"
+        assert calls == []
+
+        assert client.get("/api/v1/health").status_code == 200
+        assert client.get("/api/v1/ping", headers={"Authorization": "bearer key-a"}).status_code == 200
+        assert calls == [True]
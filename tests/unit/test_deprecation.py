@@ -0,0 +1,143 @@
+"""
+Unit tests for API deprecation tracking
+"""
+
+import dataclasses
+import inspect
+import sys
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+import src.api.deprecation as deprecation
+from src.api.deprecation import DeprecationTracker, deprecate_endpoint, deprecate_parameter
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    """Fresh tracker so usage counts do not leak between tests"""
+    tracker = DeprecationTracker()
+    monkeypatch.setattr(deprecation, "deprecation_tracker", tracker)
+    return tracker
+
+
+class TestDeprecationDecorators:
+    """Test deprecate_parameter and deprecate_endpoint"""
+
+    async def test_wrappers_keep_sync_and_async_handlers(self, tracker):
+        @deprecate_parameter("limit")
+        async def async_handler(limit=None):
+            return limit
+
+        @deprecate_endpoint("/old")
+        def sync_handler():
+            return "ok"
+
+        assert inspect.iscoroutinefunction(async_handler)
+        assert not inspect.iscoroutinefunction(sync_handler)
+        assert await async_handler(limit=5) == 5
+        assert sync_handler() == "ok"
+        assert tracker.get_usage_stats() == {"parameter:limit": 1, "endpoint:/old": 1}
+
+    async def test_unused_parameter_is_not_tracked(self, tracker):
+        @deprecate_parameter("limit")
+        async def handler(limit=None):
+            return limit
+
+        await handler()
+
+        assert tracker.get_usage_stats() == {}
+
+    def test_deprecation_is_registered_at_decoration(self, tracker):
+        @deprecate_parameter("limit", alternative="page_size")
+        async def handler(limit=None):
+            return limit
+
+        notice = tracker.get_deprecation_notice("parameter:limit")
+        assert notice is not None
+        assert notice.alternative == "page_size"
+
+    def test_decorator_keeps_earlier_notice(self, tracker):
+        """Test decorating does not replace a notice registered before, like the legacy ones"""
+        tracker.register_deprecation(
+            feature="parameter:limit", level=deprecation.DeprecationLevel.WARNING,
+            message="Parameter 'limit' is deprecated. Use 'page_size' instead.",
+            documentation_url="/docs#pagination"
+        )
+
+        @deprecate_parameter("limit", message="other text")
+        async def handler(limit=None):
+            return limit
+
+        notice = tracker.get_deprecation_notice("parameter:limit")
+        assert notice.message == "Parameter 'limit' is deprecated. Use 'page_size' instead."
+        assert notice.documentation_url == "/docs#pagination"
+
+    async def test_parameter_value_is_logged_per_call(self, tracker, caplog):
+        @deprecate_parameter("limit")
+        async def handler(limit=None):
+            return limit
+
+        with caplog.at_level("WARNING", logger="src.api.deprecation"):
+            await handler(limit=5)
+
+        [record] = [r for r in caplog.records if r.levelname == "WARNING"]
+        assert record.request_details == {"function": "handler", "parameter": "limit", "value": "5"}
+
+
+    def test_middleware_adds_headers_for_recorded_deprecations(self, tracker):
+        app = FastAPI()
+        app.middleware("http")(deprecation.create_deprecation_middleware())
+
+        @app.get("/old")
+        @deprecate_endpoint("/old", alternative="/new")
+        def old_handler():
+            return {}
+
+        @app.get("/new")
+        async def new_handler():
+            return {}
+
+        client = TestClient(app)
+        old = client.get("/old")
+        assert old.headers["Deprecation"] == "true"
+        assert old.headers["X-API-Deprecation-1-Alternative"] == "/new"
+        assert "Deprecation" not in client.get("/new").headers
+
+
+class TestDeprecationTracker:
+    """Test usage counting and rate-limited warnings"""
+
+    def test_warning_is_rate_limited(self, tracker, caplog):
+        tracker.register_deprecation("endpoint:/old", deprecation.DeprecationLevel.WARNING, "old")
+
+        with caplog.at_level("WARNING", logger="src.api.deprecation"):
+            for _ in range(3):
+                tracker.track_usage("endpoint:/old")
+
+        assert tracker.get_usage_stats() == {"endpoint:/old": 3}
+        with pytest.raises(TypeError):
+            tracker.get_usage_stats()["endpoint:/old"] = 0
+        assert len([r for r in caplog.records if r.levelname == "WARNING"]) == 1
+
+    def test_deprecation_headers(self, tracker):
+        tracker.register_deprecation("parameter:limit", deprecation.DeprecationLevel.WARNING, "old", alternative="page_size")
+        tracker.register_deprecation("parameter:offset", deprecation.DeprecationLevel.SUNSET, "gone")
+        response = Response()
+
+        deprecation.add_deprecation_headers(response, list(tracker.get_all_deprecations().values()))
+
+        assert response.headers["Deprecation"] == "true"
+        assert response.headers["X-API-Deprecation-1-Alternative"] == "page_size"
+        assert response.headers["X-API-Deprecation-2-Level"] == "sunset"
+        assert "X-API-Deprecation-2-Alternative" not in response.headers
+
+    def test_notices_are_frozen_and_keyed_by_interned_name(self, tracker):
+        feature = "".join(["parameter:", "legacy"])
+        tracker.register_deprecation(feature, deprecation.DeprecationLevel.INFO, "old")
+
+        key = next(iter(tracker.get_all_deprecations()))
+        assert key is sys.intern("parameter:legacy")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tracker.get_deprecation_notice(feature).message = "new"
@@ -0,0 +1,316 @@
+"""
+Unit tests for the email templates API router
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+
+import src.api.email_templates as email_templates
+from src.api.schemas import EmailTemplateResponse
+from src.api.dependencies import verify_api_key
+from src.api.pagination import VersionedTTLCache
+from src.core.models import EmailTemplateDB, SentEmailDB
+
+
+@pytest.fixture
+def template_db(memory_db, monkeypatch):
+    """In-memory database wired into the email templates router"""
+    monkeypatch.setattr(email_templates, "db_service", memory_db)
+    monkeypatch.setattr(
+        email_templates, "_stats_cache", VersionedTTLCache(email_templates.STATS_CACHE_TTL_SECONDS)
+    )
+    return memory_db
+
+
+@pytest.fixture
+def client(template_db):
+    """TestClient for the email templates router with auth bypassed"""
+    app = FastAPI()
+    app.include_router(email_templates.router)
+    app.dependency_overrides[verify_api_key] = lambda: True
+    return TestClient(app)
+
+
+@pytest.fixture
+def statements(template_db):
+    """SELECT statements issued against the database"""
+    issued = []
+
+    @event.listens_for(template_db.engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            issued.append(statement)
+
+    return issued
+
+
+def add_category(client, name, icon="📧"):
+    return client.post("/admin/email-templates/categories", json={"name": name, "icon": icon}).json()
+
+
+class TestEmailTemplatesAPI:
+    """Test email template endpoints"""
+
+    def test_list_loads_categories_without_per_row_queries(self, client, statements):
+        """Test the list endpoint batches category loading"""
+        categories = [add_category(client, f"Category {i}", icon=str(i)) for i in range(5)]
+        for i in range(10):
+            client.post("/admin/email-templates/", json={
+                "name": f"Template {i}", "subject": "Hi", "category_id": categories[i % 5]["id"]
+            })
+        statements.clear()
+
+        data = client.get("/admin/email-templates/").json()
+
+        assert data["total"] == 10
+        assert {t["category_name"] for t in data["templates"]} == {f"Category {i}" for i in range(5)}
+        # count, page and one batched category load
+        assert len(statements) == 3
+        assert "FROM (SELECT" not in statements[0]
+
+        filtered = client.get("/admin/email-templates/", params={"category_id": categories[0]["id"], "q": "Template"}).json()
+        assert filtered["total"] == 2
+
+    def test_create_get_and_update_include_category(self, client):
+        """Test single-template endpoints return the current category"""
+        news = add_category(client, "News", icon="📰")
+        promo = add_category(client, "Promo", icon="🎁")
+
+        created = client.post("/admin/email-templates/", json={
+            "name": "Welcome", "subject": "Hello", "category_id": news["id"]
+        }).json()
+        assert created["category_name"] == "News"
+
+        fetched = client.get(f"/admin/email-templates/{created['id']}").json()
+        assert fetched["category_icon"] == "📰"
+
+        updated = client.put(f"/admin/email-templates/{created['id']}", json={"category_id": promo["id"]}).json()
+        assert updated["category_name"] == "Promo"
+
+    async def test_stats_in_one_query(self, client, template_db, statements):
+        """Test dashboard stats come from a single statement"""
+        category = add_category(client, "News")
+        for i in range(3):
+            client.post("/admin/email-templates/", json={
+                "name": f"Template {i}", "subject": "Hi", "category_id": category["id"], "is_active": i != 0
+            })
+
+        async with template_db.get_session() as session:
+            for template_id, usage, open_rate in ((1, 0, 0.9), (2, 4, 0.5), (3, 2, 0.3)):
+                template = await session.get(EmailTemplateDB, template_id)
+                template.usage_count, template.open_rate = usage, open_rate
+            session.add(SentEmailDB(template_id=2, recipient_email="a@example.com", subject="Hi"))
+        statements.clear()
+
+        stats = client.get("/admin/email-templates/stats").json()
+
+        assert len(statements) == 1
+        assert (stats["total_templates"], stats["active_templates"]) == (3, 2)
+        assert (stats["total_categories"], stats["total_sent"]) == (1, 1)
+        assert stats["avg_open_rate"] == pytest.approx(0.4)
+
+    def test_empty_stats(self, client):
+        """Test stats on an empty database"""
+        stats = client.get("/admin/email-templates/stats").json()
+        assert stats["total_templates"] == 0
+        assert stats["active_templates"] == 0
+        assert stats["avg_click_rate"] == 0.0
+
+    def test_stats_are_cached_until_a_write(self, client, statements):
+        """Test cached stats are reused and router writes invalidate them"""
+        client.get("/admin/email-templates/stats")
+        statements.clear()
+
+        assert client.get("/admin/email-templates/stats").json()["total_templates"] == 0
+        assert statements == []
+
+        client.post("/admin/email-templates/", json={"name": "Welcome", "subject": "Hello"})
+        assert client.get("/admin/email-templates/stats").json()["total_templates"] == 1
+
+    def test_categories_include_template_counts(self, client):
+        """Test category listing counts templates per category"""
+        news = add_category(client, "News")
+        add_category(client, "Empty")
+        for i in range(3):
+            client.post("/admin/email-templates/", json={"name": f"T{i}", "subject": "Hi", "category_id": news["id"]})
+        client.post("/admin/email-templates/", json={"name": "Loose", "subject": "Hi"})
+
+        data = client.get("/admin/email-templates/categories").json()
+
+        assert {c["name"]: c["template_count"] for c in data["categories"]} == {"News": 3, "Empty": 0}
+
+    def test_duplicate_category_returns_409(self, client):
+        """Test the unique name constraint is reported as a conflict"""
+        created = client.post("/admin/email-templates/categories", json={"name": "News"})
+        assert created.status_code == 201
+        assert created.json()["created_at"] is not None
+
+        assert client.post("/admin/email-templates/categories", json={"name": "News"}).status_code == 409
+        assert len(client.get("/admin/email-templates/categories").json()["categories"]) == 1
+
+    def test_update_and_toggle(self, client):
+        """Test partial updates leave omitted fields alone and toggle flips is_active"""
+        created = client.post("/admin/email-templates/", json={"name": "Welcome", "subject": "Hello"}).json()
+
+        updated = client.put(f"/admin/email-templates/{created['id']}", json={"subject": "Hi", "name": None}).json()
+        assert (updated["name"], updated["subject"]) == ("Welcome", "Hi")
+        assert updated["updated_at"] >= created["updated_at"]
+
+        assert client.post(f"/admin/email-templates/{created['id']}/toggle").json()["message"].endswith("deaktiviert")
+        assert client.get(f"/admin/email-templates/{created['id']}").json()["is_active"] is False
+        assert client.post("/admin/email-templates/999/toggle").status_code == 404
+        assert client.put("/admin/email-templates/999", json={"name": "x"}).status_code == 404
+
+    async def test_toggle_null_is_active(self, client, template_db):
+        """Test a template with NULL is_active toggles to active instead of staying NULL"""
+        created = client.post("/admin/email-templates/", json={"name": "Legacy", "subject": "Hello"}).json()
+
+        async with template_db.engine.begin() as conn:
+            await conn.execute(text("UPDATE email_templates SET is_active = NULL"))
+
+        response = client.post(f"/admin/email-templates/{created['id']}/toggle")
+        assert response.json()["message"] == f"Template {created['id']} aktiviert"
+        assert client.get(f"/admin/email-templates/{created['id']}").json()["is_active"] is True
+
+    def test_empty_update_does_not_write(self, client, template_db):
+        """Test an update with no fields set returns the template without an UPDATE"""
+        created = client.post("/admin/email-templates/", json={"name": "Welcome", "subject": "Hello"}).json()
+        writes = []
+
+        @event.listens_for(template_db.engine.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE"):
+                writes.append(statement)
+
+        unchanged = client.put(f"/admin/email-templates/{created['id']}", json={"name": None}).json()
+
+        assert unchanged == created
+        assert writes == []
+        assert client.put("/admin/email-templates/999", json={}).status_code == 404
+
+    async def test_template_loads_raise_on_lazy_relationships(self, client, template_db):
+        """Test helper-loaded templates refuse lazy loads outside their category"""
+        created = client.post("/admin/email-templates/", json={"name": "Welcome", "subject": "Hello"}).json()
+
+        async with template_db.get_session() as session:
+            db_template = await email_templates._get_template(session, created["id"])
+            EmailTemplateResponse.model_validate(db_template)
+            with pytest.raises(InvalidRequestError):
+                db_template.sent_emails
+
+    async def test_delete_detaches_sent_emails(self, client, template_db):
+        """Test deleting a template keeps its sent email history"""
+        created = client.post("/admin/email-templates/", json={"name": "Welcome", "subject": "Hello"}).json()
+
+        async with template_db.get_session() as session:
+            session.add(SentEmailDB(template_id=created["id"], recipient_email="a@example.com", subject="Hi"))
+
+        assert client.delete(f"/admin/email-templates/{created['id']}").json()["success"] is True
+        async with template_db.get_session() as session:
+            assert (await session.execute(select(SentEmailDB.template_id))).scalars().all() == [None]
+        assert client.get(f"/admin/email-templates/{created['id']}").status_code == 404
+        assert client.delete(f"/admin/email-templates/{created['id']}").status_code == 404
+
+    def test_bulk_create_in_one_insert(self, client, template_db):
+        """Test bulk creation batches rows and keeps request order"""
+        news = add_category(client, "News")
+        inserts = []
+
+        @event.listens_for(template_db.engine.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO email_templates"):
+                inserts.append(statement)
+
+        created = client.post("/admin/email-templates/bulk", json=[
+            {"name": f"Template {i}", "subject": "Hi", "category_id": news["id"] if i % 2 else None}
+            for i in range(5)
+        ])
+
+        assert created.status_code == 201
+        assert [t["name"] for t in created.json()] == [f"Template {i}" for i in range(5)]
+        assert created.json()[1]["category_name"] == "News"
+        assert len(inserts) == 1
+        assert client.get("/admin/email-templates/stats").json()["total_templates"] == 5
+
+    def test_bulk_create_rejects_unknown_categories(self, client):
+        """Test nothing is inserted when a category is missing"""
+        response = client.post("/admin/email-templates/bulk", json=[
+            {"name": "A", "subject": "Hi"}, {"name": "B", "subject": "Hi", "category_id": 42}
+        ])
+
+        assert response.status_code == 404
+        assert client.get("/admin/email-templates/").json()["total"] == 0
+
+    def test_search_matches_substrings(self, client):
+        """Test q matches substrings case-insensitively and follows updates"""
+        created = client.post("/admin/email-templates/", json={
+            "name": "Weekly Newsletter", "subject": "This week", "description": "Sent on Mondays"
+        }).json()
+        client.post("/admin/email-templates/", json={"name": "Invoice", "subject": "Your bill"})
+
+        def names(q):
+            return [t["name"] for t in client.get("/admin/email-templates/", params={"q": q}).json()["templates"]]
+
+        assert names("NEWSLETT") == ["Weekly Newsletter"]
+        assert names("monday") == ["Weekly Newsletter"]
+        assert names("bi") == ["Invoice"]
+        assert names('"x') == []
+
+        client.put(f"/admin/email-templates/{created['id']}", json={"name": "Digest"})
+        assert names("newsletter") == []
+        assert names("digest") == ["Digest"]
+
+        client.delete(f"/admin/email-templates/{created['id']}")
+        assert names("week") == []
+
+    def test_list_omits_template_bodies(self, client):
+        """Test list pages leave out html/text bodies that GET /{id} returns"""
+        created = client.post("/admin/email-templates/", json={
+            "name": "Welcome", "subject": "Hello", "html_content": "<p>Hi</p>", "text_content": "Hi"
+        }).json()
+
+        [item] = client.get("/admin/email-templates/").json()["templates"]
+
+        assert "html_content" not in item and "text_content" not in item
+        assert item["name"] == "Welcome"
+        assert client.get(f"/admin/email-templates/{created['id']}").json()["html_content"] == "<p>Hi</p>"
+
+    def test_cursor_pagination_walks_all_rows(self, client, template_db):
+        """Test next_cursor pages through ties on updated_at without gaps"""
+        client.post("/admin/email-templates/bulk", json=[{"name": f"T{i}", "subject": "Hi"} for i in range(7)])
+
+        seen, cursor = [], None
+        while True:
+            params = {"page_size": 3, **({"cursor": cursor} if cursor else {})}
+            data = client.get("/admin/email-templates/", params=params).json()
+            seen += [t["id"] for t in data["templates"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert seen == list(range(7, 0, -1))
+        assert client.get("/admin/email-templates/", params={"cursor": "nope"}).status_code == 400
+
+    async def test_full_last_page_has_no_cursor(self, client, template_db):
+        """Test an exactly full last page does not point at an empty one"""
+        client.post("/admin/email-templates/bulk", json=[{"name": f"T{i}", "subject": "Hi"} for i in range(6)])
+
+        first = client.get("/admin/email-templates/", params={"page_size": 3}).json()
+        second = client.get("/admin/email-templates/", params={
+            "page_size": 3, "cursor": first["next_cursor"]
+        }).json()
+
+        assert [t["id"] for t in second["templates"]] == [3, 2, 1]
+        assert second["next_cursor"] is None
+
+        # The keyset column cannot be NULL, so every row can be encoded as a cursor
+        with pytest.raises(IntegrityError):
+            async with template_db.engine.begin() as conn:
+                await conn.execute(text("INSERT INTO email_templates (name, subject) VALUES ('N', 'S')"))
+
+    def test_missing_template_returns_404(self, client):
+        """Test a missing template is reported as 404"""
+        assert client.get("/admin/email-templates/999").status_code == 404
@@ -0,0 +1,156 @@
+"""
+Unit tests for the events API router
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event, text, update
+
+import src.api.events as events
+from src.api.dependencies import verify_api_key
+from src.api.pagination import VersionedTTLCache
+from src.core.models import ChronosEventDB, TemplateDB
+
+
+@pytest.fixture
+def event_db(memory_db, monkeypatch):
+    """In-memory database wired into the events router"""
+    monkeypatch.setattr(events, "db_service", memory_db)
+    monkeypatch.setattr(events, "_events_cache", VersionedTTLCache(
+        events.EVENTS_CACHE_TTL_SECONDS, events.EVENTS_CACHE_MAX_ENTRIES
+    ))
+    return memory_db
+
+
+@pytest.fixture
+def client(event_db):
+    """TestClient for the events router with auth bypassed"""
+    app = FastAPI()
+    app.include_router(events.router)
+    app.dependency_overrides[verify_api_key] = lambda: True
+    return TestClient(app)
+
+
+async def add_events(event_db, *rows):
+    async with event_db.get_session() as session:
+        session.add_all(ChronosEventDB(event_type="task", status="scheduled", **row) for row in rows)
+
+
+def list_titles(client, **params):
+    params = {"anchor": "2026-10-01", "days": 30, **params}
+    return sorted(e["title"] for e in client.get("/events", params=params).json()["items"])
+
+
+class TestEventsAPI:
+    """Test event list endpoint"""
+
+    async def test_search_matches_substrings(self, client, event_db):
+        """Test q matches title, description and location and follows writes"""
+        await add_events(
+            event_db,
+            {"id": "a", "title": "Weekly Standup", "description": "Team sync", "start_time": datetime(2026, 10, 5)},
+            {"id": "b", "title": "Dentist", "location": "Main Street", "start_time": datetime(2026, 10, 6)},
+        )
+
+        assert list_titles(client, q="STANDU") == ["Weekly Standup"]
+        assert list_titles(client, q="street") == ["Dentist"]
+        assert list_titles(client, q="st") == ["Dentist", "Weekly Standup"]
+        assert list_titles(client, q='"x') == []
+
+        async with event_db.get_session() as session:
+            await session.execute(update(ChronosEventDB).where(ChronosEventDB.id == "a").values(title="Retro"))
+            await session.execute(delete(ChronosEventDB).where(ChronosEventDB.id == "b"))
+        assert list_titles(client, q="standup") == []
+        assert list_titles(client, q="retro") == ["Retro"]
+        assert list_titles(client, q="street") == []
+
+    async def test_calendar_range_uses_index(self, client, event_db):
+        """Test the calendar + start_time filter is served by the composite index"""
+        await add_events(
+            event_db,
+            {"id": "a", "title": "Work", "calendar_id": "work", "start_time": datetime(2026, 10, 5)},
+            {"id": "b", "title": "Home", "calendar_id": "home", "start_time": datetime(2026, 10, 5)},
+        )
+
+        assert list_titles(client, calendar="work") == ["Work"]
+
+        async with event_db.get_session() as session:
+            result = await session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM events WHERE calendar_id = 'work' "
+                "AND start_time >= '2026-10-01' AND start_time <= '2026-10-31' ORDER BY start_time"
+            ))
+            plan = " ".join(row[-1] for row in result)
+
+        assert "idx_events_calendar_start" in plan
+
+    async def test_template_search_ands_tokens_and_ranks_title_first(self, client, event_db):
+        """Test /templates q matches every token and ranks title hits above description hits"""
+        async with event_db.get_session() as session:
+            session.add_all([
+                TemplateDB(title="Planning", description="Weekly review meeting", usage_count=9),
+                TemplateDB(title="Weekly Review", description="Friday", tags=["team"]),
+                TemplateDB(title="Review", description="Monthly"),
+            ])
+
+        def titles(q):
+            return [t["title"] for t in client.get("/templates", params={"q": q}).json()["items"]]
+
+        assert titles("review weekly") == ["Weekly Review", "Planning"]
+        assert titles("TEAM review") == ["Weekly Review"]
+        assert titles("mo review") == ["Review"]
+        assert client.get("/templates", params={"q": "review"}).json()["total_count"] == 3
+
+    async def test_event_pages_cached_until_a_commit(self, client, event_db):
+        """Test repeated /events queries skip the database until events are written"""
+        await add_events(event_db, {"id": "a", "title": "Work", "start_time": datetime(2026, 10, 5)})
+        assert list_titles(client) == ["Work"]
+        selects = []
+
+        @event.listens_for(event_db.engine.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        assert list_titles(client) == ["Work"]
+        assert selects == []
+
+        await add_events(event_db, {"id": "b", "title": "Home", "start_time": datetime(2026, 10, 6)})
+        assert list_titles(client) == ["Home", "Work"]
+
+    async def test_list_items_from_columns(self, client, event_db):
+        """Test list items treat NULL tags as empty and leave sub_tasks out"""
+        await add_events(event_db, {
+            "id": "a", "title": "Work", "start_time": datetime(2026, 10, 5), "tags": None,
+            "sub_tasks": [{"id": "s", "text": "Prep", "created_at": "2026-10-01T00:00:00"}]
+        })
+
+        [item] = client.get("/events", params={"anchor": "2026-10-01", "days": 30}).json()["items"]
+
+        assert (item["tags"], item["attendees"], item["priority"]) == ([], [], "MEDIUM")
+        assert item["sub_tasks"] is None
+
+    async def test_cursor_pagination(self, client, event_db):
+        """Test next_cursor walks events and templates without gaps on ties"""
+        await add_events(event_db, *(
+            {"id": f"e{i}", "title": f"E{i}", "start_time": datetime(2026, 10, 5 + i // 2)} for i in range(5)
+        ))
+
+        async with event_db.get_session() as session:
+            session.add_all(TemplateDB(title="Same", usage_count=i % 2) for i in range(5))
+
+        def walk(path, **params):
+            seen, cursor = [], None
+            while True:
+                data = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})}).json()
+                seen += [item["id"] for item in data["items"]]
+                cursor = data["next_cursor"]
+                if not cursor:
+                    return seen, data["total_count"]
+
+        assert walk("/events", anchor="2026-10-01", days=30, page_size=2) == ([f"e{i}" for i in range(5)], 5)
+        assert walk("/templates", page_size=2, include_total=False) == ([2, 4, 1, 3, 5], None)
+        assert client.get("/events", params={"cursor": "nope"}).status_code == 400
+        assert client.get("/templates", params={"cursor": "WzFd"}).status_code == 400
@@ -0,0 +1,59 @@
+"""
+Unit tests for the shared pagination helpers
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.pagination import VersionedTTLCache, decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """Test encode_cursor / decode_cursor"""
+
+    def test_round_trip(self):
+        cursor = encode_cursor(datetime(2026, 10, 18, 9, 30), "abc", 7)
+        assert decode_cursor(cursor, datetime.fromisoformat, str, int) == (
+            datetime(2026, 10, 18, 9, 30), "abc", 7
+        )
+
+    @pytest.mark.parametrize("cursor", ["nope", encode_cursor(1, 2)])
+    def test_malformed_cursor_is_client_error(self, cursor):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, int, int, int)
+        assert exc_info.value.status_code == 400
+
+
+class TestVersionedTTLCache:
+    """Test expiry, invalidation and eviction"""
+
+    def test_invalidate_drops_entries(self):
+        cache = VersionedTTLCache(60)
+        cache.put("stats", cache.version)
+        assert cache.get() == "stats"
+
+        cache.invalidate()
+        assert cache.get() is None
+
+    def test_entry_from_before_a_write_is_stale(self):
+        cache = VersionedTTLCache(60)
+        version = cache.version
+        cache.invalidate()
+        cache.put("stale", version)
+        assert cache.get() is None
+
+    def test_expired_entry_is_missed(self, monkeypatch):
+        cache = VersionedTTLCache(10)
+        monkeypatch.setattr("src.api.pagination.time.monotonic", lambda: 100.0)
+        cache.put("page", cache.version)
+        monkeypatch.setattr("src.api.pagination.time.monotonic", lambda: 111.0)
+        assert cache.get() is None
+
+    def test_oldest_entry_is_evicted(self):
+        cache = VersionedTTLCache(60, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key.upper(), cache.version, key)
+        assert cache.get("a") is None
+        assert (cache.get("b"), cache.get("c")) == ("B", "C")
@@ -0,0 +1,206 @@
+"""
+Unit tests for ChronosScheduler calendar synchronization
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import src.core.scheduler as scheduler_module
+from src.core.models import ChronosEventDB
+from src.core.scheduler import ChronosScheduler
+from src.core.source_adapter import AdapterCapabilities, CalendarRef, EventListResult, gather_bounded
+
+
+@pytest.fixture
+def sync_db(memory_db, monkeypatch):
+    """In-memory database used for sync token persistence"""
+    monkeypatch.setattr(scheduler_module, "db_service", memory_db)
+    return memory_db
+
+
+@pytest.fixture
+def calendars():
+    return [
+        CalendarRef(id='automation', alias='Automation', url='http://radicale.local/automation/'),
+        CalendarRef(id='dates', alias='Dates', url='http://radicale.local/dates/')
+    ]
+
+
+@pytest.fixture
+def adapter():
+    adapter = Mock(max_concurrency=1)
+    adapter.get_sync_token = AsyncMock(return_value="token-1")
+    adapter.list_events = AsyncMock(return_value=EventListResult(events=[]))
+    adapter.sync_collection = AsyncMock(return_value=EventListResult(events=[], sync_token="token-2"))
+    return adapter
+
+
+@pytest.fixture
+def scheduler(calendars, adapter, sync_db):
+    """Scheduler with only the collaborators sync_calendar needs"""
+    scheduler = ChronosScheduler.__new__(ChronosScheduler)
+    scheduler.logger = logging.getLogger(__name__)
+    scheduler.source_manager = Mock()
+    scheduler.source_manager.list_calendars = AsyncMock(return_value=calendars)
+    scheduler.source_manager.get_adapter = Mock(return_value=adapter)
+    scheduler.source_manager.get_capabilities = AsyncMock(return_value=AdapterCapabilities(
+        name="CalDAV/Radicale", can_write=True, supports_sync_token=True, timezone="UTC"
+    ))
+    return scheduler
+
+
+class TestSchedulerSync:
+    """Test fetching, filtering and incremental sync"""
+
+    async def test_first_sync_is_full_and_stores_token(self, scheduler, adapter):
+        result = await scheduler.sync_calendar()
+
+        assert result['success'] is True
+        assert result['incremental_calendars'] == []
+        assert adapter.list_events.await_count == 2
+        adapter.sync_collection.assert_not_awaited()
+        states = await scheduler._load_sync_states(['automation', 'dates'])
+        assert {calendar_id: state[0] for calendar_id, state in states.items()} == {
+            'automation': 'token-1', 'dates': 'token-1'
+        }
+
+    async def test_second_sync_uses_stored_token(self, scheduler, adapter):
+        await scheduler.sync_calendar()
+        adapter.list_events.reset_mock()
+
+        result = await scheduler.sync_calendar()
+
+        assert sorted(result['incremental_calendars']) == ['automation', 'dates']
+        adapter.list_events.assert_not_awaited()
+        adapter.sync_collection.assert_any_await(scheduler.source_manager.list_calendars.return_value[0], 'token-1')
+        assert (await scheduler._load_sync_states(['automation']))['automation'][0] == 'token-2'
+
+    async def test_rejected_token_falls_back_to_full_sync(self, scheduler, adapter):
+        await scheduler.sync_calendar()
+        adapter.sync_collection.return_value = None
+        adapter.list_events.reset_mock()
+
+        result = await scheduler.sync_calendar()
+
+        assert result['incremental_calendars'] == []
+        assert adapter.list_events.await_count == 2
+
+    async def test_window_moving_forward_lists_in_full(self, scheduler, adapter):
+        """Test an untouched event that enters a later window is still imported"""
+        await scheduler.sync_calendar(since=datetime(2026, 10, 1), until=datetime(2026, 10, 8))
+        adapter.list_events.reset_mock()
+
+        # Created long ago and never modified: the token delta would not report it
+        async def list_events(calendar, since, until):
+            return EventListResult(events=[{'id': 'old-event'}] if calendar.id == 'dates' else [])
+
+        adapter.list_events = AsyncMock(side_effect=list_events)
+        scheduler._process_calendar_events = AsyncMock(return_value=(1, 1, 0))
+
+        result = await scheduler.sync_calendar(since=datetime(2026, 10, 5), until=datetime(2026, 10, 12))
+
+        assert result['incremental_calendars'] == []
+        adapter.sync_collection.assert_not_awaited()
+        scheduler._process_calendar_events.assert_awaited_once_with(
+            scheduler.source_manager.list_calendars.return_value[1], [{'id': 'old-event'}]
+        )
+        assert (await scheduler._load_sync_states(['dates']))['dates'][1:] == (
+            datetime(2026, 10, 5), datetime(2026, 10, 12)
+        )
+
+        # A narrower window inside the stored one goes incremental again
+        result = await scheduler.sync_calendar(since=datetime(2026, 10, 6), until=datetime(2026, 10, 10))
+        assert sorted(result['incremental_calendars']) == ['automation', 'dates']
+
+    async def test_explicit_window_must_match_stored_one(self, scheduler, adapter):
+        """Test an explicitly requested window skips a token taken for another window"""
+        await scheduler.sync_calendar(since=datetime(2026, 10, 1), until=datetime(2026, 10, 31))
+        adapter.list_events.reset_mock()
+
+        result = await scheduler.sync_calendar(
+            since=datetime(2026, 10, 5), until=datetime(2026, 10, 12), exact_window=True
+        )
+
+        assert result['incremental_calendars'] == []
+        adapter.sync_collection.assert_not_awaited()
+        assert adapter.list_events.await_count == 2
+
+        result = await scheduler.sync_calendar(
+            since=datetime(2026, 10, 5), until=datetime(2026, 10, 12), exact_window=True
+        )
+        assert sorted(result['incremental_calendars']) == ['automation', 'dates']
+
+    async def test_delta_deletions_remove_events(self, scheduler, adapter, sync_db):
+        """Test members removed on the server are removed locally, only from their calendar"""
+        async with sync_db.get_session() as session:
+            session.add(ChronosEventDB(id='gone', title='Gone', calendar_id='automation'))
+
+        await scheduler.sync_calendar()
+        adapter.sync_collection.return_value = EventListResult(events=[], sync_token="token-2", deleted_ids=['gone'])
+
+        result = await scheduler.sync_calendar()
+
+        # Both deltas report the UID, but the row belongs to "automation"
+        assert result['calendar_results']['automation']['events_deleted'] == 1
+        assert result['calendar_results']['dates']['events_deleted'] == 0
+
+        async with sync_db.get_session() as session:
+            assert await session.get(ChronosEventDB, 'gone') is None
+
+    async def test_failed_changes_keep_previous_token(self, scheduler, adapter):
+        """Test a delta with unapplied changes is fetched again on the next run"""
+        await scheduler.sync_calendar()
+        adapter.sync_collection.return_value = EventListResult(
+            events=[{'id': 'changed'}], sync_token="token-2"
+        )
+        scheduler._process_calendar_events = AsyncMock(return_value=(0, 0, 0))
+
+        await scheduler.sync_calendar()
+        states = await scheduler._load_sync_states(['automation', 'dates'])
+        assert {calendar_id: state[0] for calendar_id, state in states.items()} == {
+            'automation': 'token-1', 'dates': 'token-1'
+        }
+
+        scheduler._process_calendar_events = AsyncMock(side_effect=RuntimeError("database locked"))
+        result = await scheduler.sync_calendar()
+        assert len(result['errors']) == 2
+        assert (await scheduler._load_sync_states(['automation']))['automation'][0] == 'token-1'
+
+        scheduler._process_calendar_events = AsyncMock(return_value=(1, 0, 1))
+        await scheduler.sync_calendar()
+        assert (await scheduler._load_sync_states(['automation']))['automation'][0] == 'token-2'
+
+    async def test_calendar_filter_and_fetch_errors(self, scheduler, adapter, calendars):
+        async def list_events(calendar, since, until):
+            raise RuntimeError("unreachable")
+
+        adapter.list_events = AsyncMock(side_effect=list_events)
+
+        result = await scheduler.sync_calendar(calendar_ids=['dates'])
+
+        assert result['calendars_synced'] == 1
+        assert result['errors'] == ['dates: unreachable']
+        assert result['calendar_results'] == {'dates': {'events_processed': 0, 'error': 'unreachable'}}
+
+
+class TestGatherBounded:
+    """Test bounded fan-out helper"""
+
+    async def test_limit_and_order(self):
+        running = 0
+        peak = 0
+
+        async def work(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return value
+
+        assert await gather_bounded((work(i) for i in range(10)), 3) == list(range(10))
+        assert peak == 3